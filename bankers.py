@@ -0,0 +1,176 @@
+# bankers.py
+"""
+Vectorized Banker's algorithm and an incremental request checker.
+
+`bankers_algorithm` in processmanagment.py rescans from process 0 after
+every grant, which is O(n^2 * m). Here each resource column is sorted by
+need once; as `work` grows, a searchsorted per column finds the processes
+that just became satisfiable on that resource and a per-process counter
+marks them ready once all m resources are covered. Every ready process is
+granted in the same round, so the whole search is O(n * m * log n).
+"""
+import numpy as np
+
+
+def _as_matrix(values, m=None):
+    matrix = np.asarray(values, dtype=np.int64)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(-1, m if m is not None else len(matrix))
+    return matrix
+
+
+def find_safe_sequence(allocation, need, available):
+    """
+    Safety algorithm on NumPy arrays.
+
+    Args:
+        allocation (ndarray): n x m currently allocated resources.
+        need (ndarray): n x m remaining claims (max - allocation).
+        available (ndarray): m free resources.
+
+    Returns:
+        ndarray: Process indices in a safe order, or None if the state is unsafe.
+    """
+    n, m = need.shape
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    work = np.asarray(available, dtype=np.int64).copy()
+
+    # Column j sorted by need; pointer[j] = processes already covered on j
+    order = np.argsort(need, axis=0, kind='stable').T
+    sorted_need = np.take_along_axis(need, order.T, axis=0).T
+    lo = min(int(sorted_need[:, 0].min()), 0)
+    span = int(sorted_need[:, -1].max()) - lo + 2
+    # Offset each row so one searchsorted call serves every column
+    flat = (sorted_need - lo + np.arange(m)[:, None] * span).ravel()
+    row_offsets = np.arange(m) * span
+    row_starts = np.arange(m) * n
+
+    pointer = np.zeros(m, dtype=np.int64)
+    covered = np.zeros(n, dtype=np.int64)
+    sequence = []
+    done = 0
+    while done < n:
+        keys = np.clip(work - lo, -1, span - 1) + row_offsets
+        new_pointer = np.searchsorted(flat, keys, side='right') - row_starts
+        grown = np.flatnonzero(new_pointer > pointer)
+        if len(grown) == 0:
+            return None
+        newly = np.concatenate([order[j, pointer[j]:new_pointer[j]] for j in grown.tolist()])
+        pointer = new_pointer
+        np.add.at(covered, newly, 1)
+        ready = np.unique(newly)
+        ready = ready[covered[ready] == m]
+        if len(ready) == 0:
+            return None
+        sequence.append(ready)
+        work += allocation[ready].sum(axis=0)
+        done += len(ready)
+    return np.concatenate(sequence)
+
+
+def bankers_algorithm_np(processes, allocation, max_need, available):
+    """
+    Drop-in for `processmanagment.bankers_algorithm` that scales to
+    thousands of processes and resource types.
+
+    Processes that become runnable in the same round are granted together,
+    in index order, so the safe sequence may differ from the original's
+    while the safe/unsafe verdict is the same.
+
+    Returns:
+        tuple: (safe sequence of process names, need matrix) or (None, None).
+    """
+    available = np.asarray(available, dtype=np.int64)
+    allocation = _as_matrix(allocation, len(available))
+    need = _as_matrix(max_need, len(available)) - allocation
+    order = find_safe_sequence(allocation, need, available)
+    if order is None:
+        return None, None
+    return [processes[i] for i in order.tolist()], need
+
+
+class BankersState:
+    """
+    Resource-allocation state that answers "can this request be granted?"
+    without recomputing the safety algorithm from scratch.
+
+    The state caches a safe sequence together with its slack matrix
+    (work available before each step minus that step's need). A request
+    from process i only lowers the work seen by the processes ahead of i
+    in the sequence, so it is safe if their slack covers it; only when that
+    check fails does the full search run again, possibly finding another
+    safe order.
+    """
+
+    def __init__(self, allocation, max_need, available, processes=None):
+        self.available = np.asarray(available, dtype=np.int64).copy()
+        self.allocation = _as_matrix(allocation, len(self.available)).copy()
+        self.max_need = _as_matrix(max_need, len(self.available)).copy()
+        self.need = self.max_need - self.allocation
+        n = len(self.allocation)
+        self.processes = list(processes) if processes is not None else [f"P{i}" for i in range(n)]
+        self.full_checks = 0
+        if not self._rebuild():
+            raise ValueError("Initial state is unsafe")
+
+    def _rebuild(self):
+        """Run the full safety search and refresh the cached sequence; False if unsafe."""
+        self.full_checks += 1
+        order = find_safe_sequence(self.allocation, self.need, self.available)
+        if order is None:
+            return False
+        self.sequence = order
+        self.position = np.empty(len(order), dtype=np.int64)
+        self.position[order] = np.arange(len(order))
+        granted = self.allocation[order]
+        work = self.available + np.cumsum(granted, axis=0) - granted
+        self.slack = work - self.need[order]
+        return True
+
+    @property
+    def safe_sequence(self):
+        return [self.processes[i] for i in self.sequence.tolist()]
+
+    def request(self, i, resources):
+        """
+        Grant `resources` to process `i` if the result is safe.
+
+        Returns:
+            tuple: (granted, reason) where reason is 'granted',
+            'exceeds claim', 'unavailable' or 'unsafe'.
+        """
+        req = np.asarray(resources, dtype=np.int64)
+        if np.any(req > self.need[i]):
+            return False, 'exceeds claim'
+        if np.any(req > self.available):
+            return False, 'unavailable'
+
+        cols = np.flatnonzero(req)
+        pos = self.position[i]
+        fast_ok = bool(np.all(self.slack[:pos][:, cols] >= req[cols]))
+
+        self.available -= req
+        self.allocation[i] += req
+        self.need[i] -= req
+        if fast_ok:
+            # Work ahead of i shrinks by req; i's own slack and later ones are unchanged
+            self.slack[:pos] -= req
+            return True, 'granted'
+        if self._rebuild():
+            return True, 'granted'
+
+        self.available += req
+        self.allocation[i] -= req
+        self.need[i] += req
+        return False, 'unsafe'
+
+    def release(self, i, resources):
+        """Return resources held by process `i`; a release never makes the state unsafe."""
+        rel = np.asarray(resources, dtype=np.int64)
+        if np.any(rel > self.allocation[i]):
+            raise ValueError("Cannot release more than is allocated")
+        self.available += rel
+        self.allocation[i] -= rel
+        self.need[i] += rel
+        self.slack[:self.position[i]] += rel
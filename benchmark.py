@@ -0,0 +1,467 @@
+# benchmark.py
+"""
+Scaling benchmarks for every simulator module.
+
+Usage:
+    python benchmark.py                          # run and print a report
+    python benchmark.py --list                   # show the available cases
+    python benchmark.py --save-baseline FILE     # record fitted exponents and constants
+    python benchmark.py --baseline FILE          # compare and fail on a regression
+    python benchmark.py --check                  # run the correctness checks only
+
+Each case is timed at growing input sizes (10 .. 10^6) until a single run
+exceeds the time budget; inputs come from the seeded generators in
+workload.py. A power law t = c * n^k is fitted to the timings. Against a
+baseline, a case regresses when `k` grows by more than EXPONENT_TOLERANCE
+(complexity) or its timings run more than CONSTANT_TOLERANCE times slower
+than the baseline fit predicts (constant factor).
+
+Fixed-cost cases (the system_monitor and procfs collectors) take no input
+size; they are timed once and compared on their best time alone.
+
+CHECKS are small correctness regressions for bugs the timings cannot see;
+each raises AssertionError with a description when it fails.
+"""
+import argparse
+import importlib
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from bankers import bankers_algorithm_np
+from cpu_scheduler import fcfs_scheduling, priority_scheduling, round_robin_scheduling
+from deadlock_graph import ResourceGraph, find_deadlocks, graph_from_matrices
+from disk_online import online_disk_scheduling
+from engine import simulate_replacement
+from disk_scheduler import (
+    c_look_disk_scheduling, c_scan_disk_scheduling, fcfs_disk_scheduling,
+    look_disk_scheduling, scan_disk_scheduling, sstf_disk_scheduling,
+)
+from memory_allocator import ALLOCATORS, make_allocator, replay
+from memory_analysis import lru_fault_curve
+from memorymanagmet import REPLACEMENT_ALGORITHMS
+from paging import TLB, MultiLevelPageTable, simulate_address_trace
+from processmanagment import bankers_algorithm, detect_deadlock
+from segmentation import SegmentTable
+from workload import (
+    allocation_trace, deadlock_state, disk_requests, generate_workload,
+    reference_string, resource_state,
+)
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_BASELINE = "benchmark_baseline.json"
+
+# Timings shorter than this are dominated by noise and are left out of the fit.
+MIN_FIT_SECONDS = 1e-3
+# Allowed increase of the fitted exponent before a case counts as regressed.
+EXPONENT_TOLERANCE = 0.3
+# Allowed slowdown against the baseline fit before a case counts as regressed.
+CONSTANT_TOLERANCE = 2.0
+DISK_SIZE = 100_000
+RESOURCE_TYPES = 10
+
+
+def _scheduler_case(fn, **kwargs):
+    def setup(n, seed):
+        return generate_workload(n, seed=seed)
+
+    def run(processes):
+        # fcfs_scheduling sorts its argument in place, so always pass a copy.
+        return fn(list(processes), **kwargs)
+
+    return setup, run
+
+
+def _replacement_case(fn, frames=1000):
+    def setup(n, seed):
+        return reference_string(n, seed=seed).tolist()
+
+    def run(pages):
+        return fn(pages, frames, trace=False)
+
+    return setup, run
+
+
+def _disk_case(fn, **kwargs):
+    def setup(n, seed):
+        return disk_requests(n, DISK_SIZE, seed)
+
+    def run(data):
+        requests, head = data
+        return fn(requests, head, disk_size=DISK_SIZE, **kwargs)
+
+    return setup, run
+
+
+def _bankers_case(fn):
+    def setup(n, seed):
+        allocation, max_need, available = resource_state(n, RESOURCE_TYPES, seed=seed)
+        return [f"P{i}" for i in range(n)], allocation, max_need, available
+
+    def run(data):
+        processes, allocation, max_need, available = data
+        # bankers_algorithm copies `available` itself
+        return fn(processes, allocation, max_need, available)
+
+    return setup, run
+
+
+def _detection_setup(n, seed):
+    return deadlock_state(n, RESOURCE_TYPES, seed=seed)
+
+
+def _graph_setup(n, seed):
+    allocation, request, _ = deadlock_state(n, RESOURCE_TYPES, seed=seed)
+    return graph_from_matrices(allocation, request)
+
+
+def _edges_setup(n, seed):
+    graph = _graph_setup(n, seed)
+    return [(u, v) for u, succ in graph.items() for v in succ]
+
+
+def _stream_edges(edges):
+    graph = ResourceGraph()
+    for u, v in edges:
+        graph.add_edge(u, v)
+    return graph
+
+
+def _allocator_case(kind, total_order=20):
+    def setup(n, seed):
+        return list(allocation_trace(n, seed=seed))
+
+    def run(ops):
+        return replay(make_allocator(kind, total_order), ops)
+
+    return setup, run
+
+
+CASES = {
+    "fcfs_scheduling": _scheduler_case(fcfs_scheduling),
+    "round_robin_scheduling": _scheduler_case(round_robin_scheduling, time_quantum=4),
+    "priority_scheduling": _scheduler_case(priority_scheduling),
+}
+CASES.update({
+    f"{fn.__name__}_replacement": _replacement_case(fn) for fn in REPLACEMENT_ALGORITHMS.values()
+})
+CASES.update({
+    "fcfs_disk_scheduling": _disk_case(fcfs_disk_scheduling),
+    "sstf_disk_scheduling": _disk_case(sstf_disk_scheduling),
+    "scan_disk_scheduling": _disk_case(scan_disk_scheduling, direction="left"),
+    "c_scan_disk_scheduling": _disk_case(c_scan_disk_scheduling),
+    "look_disk_scheduling": _disk_case(look_disk_scheduling, direction="left"),
+    "c_look_disk_scheduling": _disk_case(c_look_disk_scheduling),
+    "lru_fault_curve": (lambda n, seed: reference_string(n, seed=seed).tolist(), lambda pages: lru_fault_curve(pages, 1000)),
+    "first_fit_allocator": _allocator_case("first-fit"),
+    "next_fit_allocator": _allocator_case("next-fit"),
+    # A small arena keeps the next-fit cursor wrapping past the end of memory
+    "next_fit_allocator_small": _allocator_case("next-fit", total_order=12),
+    "best_fit_allocator": _allocator_case("best-fit"),
+    "worst_fit_allocator": _allocator_case("worst-fit"),
+    "buddy_allocator": _allocator_case("buddy"),
+    "bankers_algorithm": _bankers_case(bankers_algorithm),
+    "bankers_algorithm_np": _bankers_case(bankers_algorithm_np),
+    "detect_deadlock": (_detection_setup, lambda data: detect_deadlock(*data)),
+    "find_deadlocks": (_graph_setup, find_deadlocks),
+    "resource_graph_stream": (_edges_setup, _stream_edges),
+})
+
+
+def _collector(module, name):
+    """Loader for a fixed-cost case; the import happens only when the case runs."""
+    def load():
+        return getattr(importlib.import_module(module), name)
+    return load
+
+
+def _proc_sampler_run():
+    from proc_sampler import ProcSampler
+    sampler = ProcSampler(working_set_every=1)
+    sampler.sample()
+    return sampler.sample
+
+
+def _per_core_run():
+    from system_monitor import PerCoreCollector
+    return PerCoreCollector().sample
+
+
+# Cases without an input size: name -> loader returning a zero-argument callable.
+# Loaders may raise ImportError (e.g. GPUtil missing); the case is then skipped.
+FIXED_CASES = {
+    "get_system_info": _collector("system_monitor", "get_system_info"),
+    "get_cpu_info": _collector("system_monitor", "get_cpu_info"),
+    "get_memory_info": _collector("system_monitor", "get_memory_info"),
+    "get_disk_info": _collector("system_monitor", "get_disk_info"),
+    "get_network_info": _collector("system_monitor", "get_network_info"),
+    "proc_sampler_sample": _proc_sampler_run,
+    "per_core_sample": _per_core_run,
+}
+
+
+def _check_tlb_unmapped():
+    # A repeated unmapped page must fault (and miss) on every reference
+    table = MultiLevelPageTable((4, 4), 12)
+    table.map([1], [7])
+    addresses = np.array([2 << 12, 1 << 12] * 500)
+    stats = simulate_address_trace(addresses, table, TLB(4, 2))
+    assert stats["page_faults"] == 500, f"page_faults {stats['page_faults']} != 500"
+    assert stats["tlb_hits"] == 499, f"tlb_hits {stats['tlb_hits']} != 499"
+
+
+def _check_zero_size_alloc():
+    # alloc(0) used to "succeed" at an address a real allocation then reused
+    for kind in ALLOCATORS:
+        allocator = make_allocator(kind, 10)
+        try:
+            allocator.alloc(0)
+        except ValueError:
+            continue
+        raise AssertionError(f"{kind}: alloc(0) did not raise ValueError")
+
+
+def _check_zero_length_segment():
+    # A zero-length segment at the same base must not hide the real one, in either key order
+    for segments in ({"A": (100, 50), "Z": (100, 0)}, {"Z": (100, 0), "A": (100, 50)}):
+        table = SegmentTable(segments)
+        ids, _ = table.reverse([100, 120, 149])
+        assert (ids == table.ids["A"]).all(), f"reverse gave {ids.tolist()} for {list(segments)}"
+
+
+def _check_online_disk_batch():
+    # With every request arriving at time 0 the online scheduler must retrace the batch one
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        head = int(rng.integers(200))
+        requests = rng.integers(200, size=int(rng.integers(1, 12))).tolist()
+        for direction in ('left', 'right'):
+            batch = {
+                'scan': scan_disk_scheduling(requests, head, direction),
+                'c_scan': c_scan_disk_scheduling(requests, head),
+                'look': look_disk_scheduling(requests, head, direction),
+                'c_look': c_look_disk_scheduling(requests, head),
+            }
+            for algorithm, (sequence, total) in batch.items():
+                online = online_disk_scheduling([(0, c) for c in requests], head, algorithm, direction=direction)
+                assert (online['sequence'], online['total_seek']) == (list(sequence), total), \
+                    f"{algorithm} {direction} head={head} {requests}: online {online['total_seek']} != batch {total}"
+
+
+def _check_zero_frames():
+    # frame_size=0 used to escape from the simulators as a KeyError
+    try:
+        simulate_replacement('FIFO', [1, 2, 3], 0)
+    except ValueError:
+        return
+    raise AssertionError("simulate_replacement(frame_size=0) did not raise ValueError")
+
+
+# Correctness checks: name -> zero-argument function raising AssertionError on failure.
+CHECKS = {
+    "tlb_unmapped_pages": _check_tlb_unmapped,
+    "zero_size_alloc": _check_zero_size_alloc,
+    "zero_length_segment": _check_zero_length_segment,
+    "online_disk_matches_batch": _check_online_disk_batch,
+    "replacement_zero_frames": _check_zero_frames,
+}
+
+
+def run_checks(names=None):
+    """Run CHECKS (all, or `names`); returns a list of failure messages."""
+    failures = []
+    for name in names or CHECKS:
+        try:
+            CHECKS[name]()
+        except AssertionError as e:
+            failures.append(f"{name}: {e}")
+    return failures
+
+
+def measure(run, data, repeat=3):
+    """Return (best wall time in seconds, peak traced memory in bytes) of `run(data)`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(data)
+        best = min(best, time.perf_counter() - start)
+
+    # Memory is measured in a separate run so tracing does not skew the timing.
+    tracemalloc.start()
+    try:
+        run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def fit_power_law(sizes, times):
+    """Fit t = c * n^k by least squares in log-log space; returns (k, c) or (None, None)."""
+    points = [(n, t) for n, t in zip(sizes, times) if t >= MIN_FIT_SECONDS]
+    if len(points) < 2:
+        return None, None
+    x = np.log([n for n, _ in points])
+    y = np.log([t for _, t in points])
+    k, log_c = np.polyfit(x, y, 1)
+    return float(k), float(np.exp(log_c))
+
+
+def run_fixed_case(name, repeat=3):
+    """Time a fixed-cost case; returns a result with a single n=1 row, or a skip note."""
+    try:
+        fn = FIXED_CASES[name]()
+    except (ImportError, OSError) as e:
+        return {"case": name, "rows": [], "exponent": None, "constant": None, "skipped": str(e)}
+    seconds, peak = measure(lambda _: fn(), None, repeat=repeat)
+    return {"case": name, "rows": [{"n": 1, "seconds": seconds, "peak_bytes": peak}],
+            "exponent": None, "constant": None, "seconds": seconds}
+
+
+def run_case(name, sizes=SIZES, max_seconds=10.0, seed=0):
+    """Benchmark one case over `sizes`, stopping once the next size would blow the budget."""
+    if name in FIXED_CASES:
+        return run_fixed_case(name)
+    setup, run = CASES[name]
+    rows = []
+    for n in sizes:
+        if rows:
+            k, c = fit_power_law([r["n"] for r in rows], [r["seconds"] for r in rows])
+            last = rows[-1]
+            if k is not None:
+                predicted = c * n ** k
+            else:
+                predicted = last["seconds"] * n / last["n"]
+            if last["seconds"] > max_seconds or predicted > max_seconds:
+                break
+        data = setup(n, seed)
+        repeat = 3 if n <= 10_000 else 1
+        seconds, peak = measure(run, data, repeat=repeat)
+        rows.append({"n": n, "seconds": seconds, "peak_bytes": peak})
+
+    k, c = fit_power_law([r["n"] for r in rows], [r["seconds"] for r in rows])
+    return {"case": name, "rows": rows, "exponent": k, "constant": c}
+
+
+def _slowdown(res, base):
+    """Measured / baseline-predicted time at the largest reliably timed size, or None."""
+    if "seconds" in base and res.get("seconds") is not None:
+        return res["seconds"] / base["seconds"] if base["seconds"] else None
+    if base.get("exponent") is None or base.get("constant") is None:
+        return None
+    rows = [r for r in res["rows"] if r["seconds"] >= MIN_FIT_SECONDS]
+    if not rows:
+        return None
+    row = rows[-1]
+    return row["seconds"] / (base["constant"] * row["n"] ** base["exponent"])
+
+
+def check_regressions(results, baseline, tolerance=EXPONENT_TOLERANCE, factor=CONSTANT_TOLERANCE):
+    """Return a list of messages for cases whose exponent or constant factor regressed."""
+    failures = []
+    for res in results:
+        base = baseline.get(res["case"], {})
+        expected = base.get("exponent")
+        if expected is not None and res["exponent"] is not None and res["exponent"] > expected + tolerance:
+            failures.append(
+                f"{res['case']}: exponent {res['exponent']:.2f} > baseline {expected:.2f} + {tolerance}"
+            )
+        slowdown = _slowdown(res, base)
+        if slowdown is not None and slowdown > factor:
+            failures.append(f"{res['case']}: {slowdown:.1f}x slower than baseline (limit {factor}x)")
+    return failures
+
+
+def format_comparison(results, baseline):
+    """One line per case: baseline vs. current exponent and the time ratio against the baseline."""
+    failing = {msg.split(":")[0] for msg in check_regressions(results, baseline)}
+    lines = [f"{'case':<32} {'base k':>7} {'k':>7} {'time x':>7}  status"]
+    for res in results:
+        base = baseline.get(res["case"])
+        if res.get("skipped"):
+            status = "skipped"
+        elif base is None:
+            status = "new"
+        else:
+            status = "REGRESSED" if res["case"] in failing else "ok"
+        base = base or {}
+        slowdown = _slowdown(res, base)
+        fmt = lambda v: f"{v:7.2f}" if v is not None else f"{'-':>7}"
+        lines.append(f"{res['case']:<32} {fmt(base.get('exponent'))} {fmt(res['exponent'])} {fmt(slowdown)}  {status}")
+    return "\n".join(lines)
+
+
+def baseline_entry(res):
+    entry = {"exponent": res["exponent"], "constant": res["constant"]}
+    if res.get("seconds") is not None:
+        entry["seconds"] = res["seconds"]
+    return entry
+
+
+def format_report(results):
+    lines = []
+    for res in results:
+        k = res["exponent"]
+        if res.get("skipped"):
+            lines.append(f"{res['case']}  (skipped: {res['skipped']})")
+            continue
+        if res["case"] in FIXED_CASES and res["rows"]:
+            lines.append(f"{res['case']}  (fixed cost) {res['seconds'] * 1e3:10.2f} ms  peak {res['rows'][0]['peak_bytes'] / 1024:10.1f} KiB")
+            continue
+        lines.append(f"{res['case']}  (fitted O(n^{k:.2f}))" if k is not None else f"{res['case']}  (not enough data to fit)")
+        for row in res["rows"]:
+            lines.append(f"  n={row['n']:>9,d}  {row['seconds'] * 1e3:10.2f} ms  peak {row['peak_bytes'] / 1024:10.1f} KiB")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cases", nargs="*", help="Cases to run (default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="Per-run time budget")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", help="Baseline file to check against")
+    parser.add_argument("--save-baseline", help="Write fitted exponents to this file")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON")
+    parser.add_argument("--list", action="store_true", help="List the available cases and exit")
+    parser.add_argument("--check", action="store_true", help="Run the correctness checks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(list(CASES) + [f"{name}  (fixed cost)" for name in FIXED_CASES]
+                        + [f"{name}  (check)" for name in CHECKS]))
+        return 0
+    if args.check:
+        failures = run_checks()
+        print(f"{len(CHECKS) - len(failures)}/{len(CHECKS)} checks passed")
+        if failures:
+            print("\nFailed checks:\n  " + "\n  ".join(failures), file=sys.stderr)
+            return 1
+        return 0
+    names = args.cases or list(CASES) + list(FIXED_CASES)
+    unknown = [name for name in names if name not in CASES and name not in FIXED_CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+    results = [run_case(name, args.sizes, args.max_seconds, args.seed) for name in names]
+    print(json.dumps(results, indent=2) if args.json else format_report(results))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump({r["case"]: baseline_entry(r) for r in results if not r.get("skipped")}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print("\n" + format_comparison(results, baseline))
+        failures = check_regressions(results, baseline)
+        if failures:
+            print("\nRegressions:\n  " + "\n  ".join(failures), file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
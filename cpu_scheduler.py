@@ -1,105 +1,136 @@
-def fcfs_scheduling(processes):
-    processes.sort(key=lambda x: x['arrival_time'])
-    current_time = 0
-    gantt_chart = []
-    waiting_times = {}
-    turnaround_times = {}
+import heapq
+import math
+from collections import deque
+
+from schedule_result import ScheduleResult, merge_slices
+
+
+# ---- Scheduler cores ----
+#
+# Each core consumes processes already sorted by arrival time (any iterable,
+# read lazily) and yields events (pid, start, end, waiting, turnaround), where
+# waiting/turnaround are only set on the slice that completes a process.
 
+
+def iter_fcfs(processes):
+    current_time = 0
     for p in processes:
         start = max(current_time, p['arrival_time'])
         end = start + p['burst_time']
-        gantt_chart.append({'pid': p['pid'], 'start': start, 'end': end})
-
-        waiting_time = start - p['arrival_time']
-        turnaround_time = end - p['arrival_time']
-        waiting_times[p['pid']] = waiting_time
-        turnaround_times[p['pid']] = turnaround_time
-
+        yield p['pid'], start, end, start - p['arrival_time'], end - p['arrival_time']
         current_time = end
 
-    return gantt_chart, waiting_times, turnaround_times
-
 
-def round_robin_scheduling(processes, time_quantum):
-    processes = sorted(processes, key=lambda x: x['arrival_time'])
-    queue = []
-    gantt_chart = []
+def iter_round_robin(processes, time_quantum):
+    it = iter(processes)
+    pending = next(it, None)
+    ready_queue = deque()
+    remaining_bt = {}
+    info = {}
     time = 0
-    waiting_time = {}
-    turnaround_time = {}
-    remaining_bt = {p['pid']: p['burst_time'] for p in processes}
-    arrival_dict = {p['pid']: p['arrival_time'] for p in processes}
-    ready_queue = []
-    completed = set()
-
-    while len(completed) < len(processes):
+
+    while ready_queue or pending is not None:
         # Add newly arrived processes
-        for p in processes:
-            if p['arrival_time'] <= time and p['pid'] not in [proc['pid'] for proc in ready_queue] and p['pid'] not in completed:
-                ready_queue.append({'pid': p['pid']})
+        while pending is not None and pending['arrival_time'] <= time:
+            pid = pending['pid']
+            ready_queue.append(pid)
+            remaining_bt[pid] = pending['burst_time']
+            info[pid] = (pending['arrival_time'], pending['burst_time'])
+            pending = next(it, None)
 
         if not ready_queue:
-            time += 1
+            # Idle in whole ticks until the next arrival
+            time += max(1, math.ceil(pending['arrival_time'] - time))
             continue
 
-        current = ready_queue.pop(0)
-        pid = current['pid']
+        pid = ready_queue.popleft()
         start_time = time
         exec_time = min(time_quantum, remaining_bt[pid])
         time += exec_time
         remaining_bt[pid] -= exec_time
-        gantt_chart.append({'pid': pid, 'start': start_time, 'end': time})
 
         # Re-add process if not completed
         if remaining_bt[pid] > 0:
             # Add any new processes that arrived during execution
-            for p in processes:
-                if start_time < p['arrival_time'] <= time and p['pid'] not in [proc['pid'] for proc in ready_queue] and p['pid'] not in completed:
-                    ready_queue.append({'pid': p['pid']})
-            ready_queue.append({'pid': pid})
+            while pending is not None and pending['arrival_time'] <= time:
+                new_pid = pending['pid']
+                ready_queue.append(new_pid)
+                remaining_bt[new_pid] = pending['burst_time']
+                info[new_pid] = (pending['arrival_time'], pending['burst_time'])
+                pending = next(it, None)
+            ready_queue.append(pid)
+            yield pid, start_time, time, None, None
         else:
-            completed.add(pid)
-            turnaround_time[pid] = time - arrival_dict[pid]
-            waiting_time[pid] = turnaround_time[pid] - next(p['burst_time'] for p in processes if p['pid'] == pid)
-
-    return gantt_chart, waiting_time, turnaround_time
+            del remaining_bt[pid]
+            arrival, burst = info.pop(pid)
+            turnaround = time - arrival
+            yield pid, start_time, time, turnaround - burst, turnaround
 
 
-def priority_scheduling(processes):
+def iter_priority(processes):
     """
     Non-preemptive priority scheduling:
     - Lower priority number means higher priority.
+    - Ties go to the process that arrived first.
     """
-    n = len(processes)
-    completed = 0
+    it = iter(processes)
+    pending = next(it, None)
+    ready = []
+    seq = 0
     current_time = 0
-    gantt_chart = []
-    waiting_times = {}
-    turnaround_times = {}
-    processes_left = sorted(processes, key=lambda x: x['arrival_time'])
-
-    while completed < n:
-        # Get processes that have arrived by current_time
-        ready_queue = [p for p in processes_left if p['arrival_time'] <= current_time]
 
-        if not ready_queue:
+    while ready or pending is not None:
+        if not ready and pending['arrival_time'] > current_time:
             # If no process is ready, advance time to next arriving process
-            current_time = processes_left[0]['arrival_time']
-            ready_queue = [p for p in processes_left if p['arrival_time'] <= current_time]
+            current_time = pending['arrival_time']
+        while pending is not None and pending['arrival_time'] <= current_time:
+            heapq.heappush(ready, (pending['priority'], seq, pending))
+            seq += 1
+            pending = next(it, None)
+
+        _, _, proc = heapq.heappop(ready)
+        start = current_time
+        end = start + proc['burst_time']
+        yield proc['pid'], start, end, start - proc['arrival_time'], end - proc['arrival_time']
+        current_time = end
 
-        # Pick process with highest priority (lowest priority number)
-        proc = min(ready_queue, key=lambda x: x['priority'])
 
-        start = max(current_time, proc['arrival_time'])
-        end = start + proc['burst_time']
-        gantt_chart.append({'pid': proc['pid'], 'start': start, 'end': end})
+def _by_arrival(processes):
+    return sorted(processes, key=lambda x: x['arrival_time'])
 
-        turnaround_times[proc['pid']] = end - proc['arrival_time']
-        waiting_times[proc['pid']] = start - proc['arrival_time']
 
-        current_time = end
-        completed += 1
-        processes_left.remove(proc)
+def stream_schedule(events):
+    """Streaming mode: merged (pid, start, end, waiting, turnaround) slices without storing the run."""
+    return merge_slices(events)
 
-    return gantt_chart, waiting_times, turnaround_times
 
+# ---- Columnar API ----
+
+def fcfs_schedule(processes):
+    return ScheduleResult.from_events(iter_fcfs(_by_arrival(processes)))
+
+
+def round_robin_schedule(processes, time_quantum):
+    return ScheduleResult.from_events(iter_round_robin(_by_arrival(processes), time_quantum))
+
+
+def priority_schedule(processes):
+    return ScheduleResult.from_events(iter_priority(_by_arrival(processes)))
+
+
+# ---- Dict API ----
+
+def fcfs_scheduling(processes):
+    return fcfs_schedule(processes).as_tuple()
+
+
+def round_robin_scheduling(processes, time_quantum):
+    return round_robin_schedule(processes, time_quantum).as_tuple()
+
+
+def priority_scheduling(processes):
+    """
+    Non-preemptive priority scheduling:
+    - Lower priority number means higher priority.
+    """
+    return priority_schedule(processes).as_tuple()
@@ -0,0 +1,354 @@
+# deadlock_graph.py
+"""
+Graph-based deadlock detection for single-instance resources.
+
+A resource-allocation graph has request edges P -> R (P waits for R) and
+assignment edges R -> P (R is held by P); with one instance per resource,
+the system is deadlocked exactly when the graph has a cycle. Collapsing
+the resource nodes gives the wait-for graph, which has the same cycles.
+
+- `strongly_connected_components`: iterative Tarjan, O(V + E), for a
+  one-off check of a whole graph.
+- `ResourceGraph`: keeps cycle information up to date as edges stream in
+  and out. Acyclic edges are kept in a dynamic topological order
+  (Pearce-Kelly), so an insertion only searches the region of the order
+  between its endpoints. The forward search from the target and the
+  backward search from the source run in lockstep and the first to finish
+  decides: only its side is moved, into the gap left between node orders,
+  so a hub resource with thousands of edges is not re-walked whenever a
+  single process moves. An edge that would close a cycle is parked with
+  the cycle it closes; removing any edge of that cycle re-inserts it.
+"""
+from collections import deque
+
+ORDER_GAP = 1 << 32  # levels between the orders of new nodes
+SEQ_BITS = 40        # low bits of an order: an assignment counter, so orders never tie
+SEQ_MASK = (1 << SEQ_BITS) - 1
+
+
+def strongly_connected_components(graph):
+    """
+    Tarjan's algorithm without recursion.
+
+    Args:
+        graph (dict): node -> iterable of successors.
+
+    Returns:
+        list: SCCs as lists of nodes, in reverse topological order.
+    """
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = low[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, ()))))
+                    advanced = True
+                    break
+                if succ in on_stack:
+                    low[node] = min(low[node], index[succ])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    return components
+
+
+def _cycle_in(graph, component):
+    """One cycle through the first node of an SCC (shortest, via BFS)."""
+    members = set(component)
+    start = component[0]
+    parent = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for succ in graph.get(node, ()):
+            if succ not in members:
+                continue
+            if succ == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            if succ not in parent:
+                parent[succ] = node
+                queue.append(succ)
+    return [start]
+
+
+def find_deadlocks(graph):
+    """
+    All deadlocks of a resource-allocation or wait-for graph.
+
+    Returns:
+        list: (nodes in the deadlocked SCC, one cycle through them) pairs.
+    """
+    found = []
+    for component in strongly_connected_components(graph):
+        if len(component) > 1 or component[0] in graph.get(component[0], ()):
+            found.append((component, _cycle_in(graph, component[::-1])))
+    return found
+
+
+def graph_from_matrices(allocation, request):
+    """
+    Resource-allocation graph from allocation / request matrices, treating
+    every resource as single-instance. Processes are 'P<i>', resources 'R<j>'.
+    """
+    graph = {}
+    for i, (held, wanted) in enumerate(zip(allocation, request)):
+        graph.setdefault(f"P{i}", set())
+        for j, (h, w) in enumerate(zip(held, wanted)):
+            graph.setdefault(f"R{j}", set())
+            if h > 0:
+                graph[f"R{j}"].add(f"P{i}")
+            if w > 0:
+                graph[f"P{i}"].add(f"R{j}")
+    return graph
+
+
+class ResourceGraph:
+    """
+    Resource-allocation graph with incremental cycle detection.
+
+    `cycles` maps every cycle-closing edge to the cycle it closes (a node
+    list starting at the edge's target); the graph is deadlock-free exactly
+    when it is empty.
+    """
+
+    def __init__(self):
+        self.succ = {}
+        self.pred = {}
+        self.order = {}       # topological position in the acyclic part
+        self.cycles = {}      # parked edge (u, v) -> cycle closed by it
+        self._users = {}      # acyclic edge -> parked edges whose cycle uses it
+        self._next = 0
+        self._seq = 0
+
+    def _stamp(self, level):
+        """A fresh order at `level`; the low bits count assignments, so orders never tie."""
+        self._seq += 1
+        return (level << SEQ_BITS) | (self._seq & SEQ_MASK)
+
+    def _add_node(self, node):
+        if node not in self.order:
+            self.order[node] = self._stamp(self._next)
+            self._next += ORDER_GAP
+            self.succ[node] = set()
+            self.pred[node] = set()
+
+    def __len__(self):
+        return len(self.order)
+
+    def has_edge(self, u, v):
+        return (u, v) in self.cycles or v in self.succ.get(u, ())
+
+    def _search(self, start, goal, bound, forward):
+        """
+        Lazy DFS over acyclic edges from start towards goal: along successors
+        through nodes ordered at most `bound`, or (backward) along predecessors
+        through nodes ordered at least `bound`. Every node is asked for the
+        goal directly before its neighbours are walked, so a hub resource on
+        a short cycle costs one set lookup, not a scan of all its edges.
+
+        A generator that yields after every step, so the two searches of an
+        insertion can run in lockstep. Returns (path from start to goal or
+        None, visited nodes -> DFS parent, nearest order just outside the
+        bound on an edge leaving the visited nodes, or None).
+        """
+        order = self.order
+        edges = self.succ if forward else self.pred
+        parent = {start: None}
+        nearest = None
+        work = [(start, iter(edges[start]))]
+        while work:
+            node, neighbours = work[-1]
+            if goal in edges[node]:
+                path = [goal, node]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1], parent, nearest
+            for nxt in neighbours:
+                if nxt not in parent:
+                    rank = order[nxt]
+                    if (rank <= bound) if forward else (rank >= bound):
+                        parent[nxt] = node
+                        work.append((nxt, iter(edges[nxt])))
+                        break
+                    if nearest is None or ((rank < nearest) if forward else (rank > nearest)):
+                        nearest = rank
+                yield
+            else:
+                work.pop()
+            yield
+        return None, parent, nearest
+
+    @staticmethod
+    def _finish(search):
+        while True:
+            try:
+                next(search)
+            except StopIteration as stop:
+                return stop.value
+
+    def _place(self, nodes, lo, hi):
+        """
+        Give `nodes` (in their current relative order) fresh orders strictly
+        between lo and hi (either may be None for unbounded). Returns False
+        if the gap between them is used up.
+        """
+        if hi is None:
+            level = (lo >> SEQ_BITS) + ORDER_GAP
+        elif lo is None:
+            level = (hi >> SEQ_BITS) - ORDER_GAP
+        else:
+            lo_level, hi_level = lo >> SEQ_BITS, hi >> SEQ_BITS
+            if hi_level - lo_level < 2:
+                return False
+            level = (lo_level + hi_level) // 2
+        for node in sorted(nodes, key=self.order.get):
+            self.order[node] = self._stamp(level)
+        return True
+
+    def _insert(self, u, v):
+        """Insert into the acyclic part; returns the cycle instead if (u, v) would close one."""
+        order = self.order
+        if u == v:
+            return [u]
+        lower, upper = order[v], order[u]
+        if lower < upper:
+            # Only the region between v and u can change. Search forward from
+            # v and backward from u in lockstep and stop at the first one to
+            # finish: either it found the other end (a cycle) or it holds
+            # every node that has to move.
+            forward = self._search(v, u, upper, True)
+            backward = self._search(u, v, lower, False)
+            while True:
+                try:
+                    next(forward)
+                except StopIteration as stop:
+                    done, other = stop.value, backward
+                    break
+                try:
+                    next(backward)
+                except StopIteration as stop:
+                    done, other = stop.value, forward
+                    break
+            path, visited, nearest = done
+            if path is not None:
+                return path if other is backward else path[::-1]
+            # Move only the side that finished: what v reaches goes straight
+            # after u, or what reaches u goes straight before v
+            moved = (self._place(visited, upper, nearest) if other is backward
+                     else self._place(visited, nearest, lower))
+            if not moved:
+                # No room left there: Pearce-Kelly reorder over both sides,
+                # nodes reaching u before nodes reachable from v
+                rest = self._finish(other)[1]
+                if other is backward:
+                    ahead, behind = rest, visited
+                else:
+                    ahead, behind = visited, rest
+                nodes = sorted(ahead, key=order.get) + sorted(behind, key=order.get)
+                slots = sorted(order[node] for node in nodes)
+                for node, slot in zip(nodes, slots):
+                    order[node] = slot
+        self.succ[u].add(v)
+        self.pred[v].add(u)
+        return None
+
+    def add_edge(self, u, v):
+        """
+        Add edge u -> v.
+
+        Returns:
+            list: The cycle the edge closes (nodes from v round to u), or None.
+        """
+        self._add_node(u)
+        self._add_node(v)
+        if self.has_edge(u, v):
+            return self.cycles.get((u, v))
+        cycle = self._insert(u, v)
+        if cycle is not None:
+            self._park((u, v), cycle)
+        return cycle
+
+    def _park(self, edge, cycle):
+        self.cycles[edge] = cycle
+        for a, b in zip(cycle, cycle[1:]):
+            self._users.setdefault((a, b), set()).add(edge)
+
+    def _unpark(self, edge):
+        cycle = self.cycles.pop(edge)
+        for a, b in zip(cycle, cycle[1:]):
+            users = self._users.get((a, b))
+            if users is not None:
+                users.discard(edge)
+                if not users:
+                    del self._users[(a, b)]
+
+    def remove_edge(self, u, v):
+        """Remove edge u -> v; edges whose cycle it broke are re-inserted."""
+        if (u, v) in self.cycles:
+            self._unpark((u, v))
+            return
+        if v not in self.succ.get(u, ()):
+            return
+        self.succ[u].discard(v)
+        self.pred[v].discard(u)
+        for edge in list(self._users.pop((u, v), ())):
+            self._unpark(edge)
+            cycle = self._insert(*edge)
+            if cycle is not None:
+                self._park(edge, cycle)
+
+    def request(self, process, resource):
+        """`process` waits for `resource`; returns the cycle if this deadlocks."""
+        return self.add_edge(process, resource)
+
+    def assign(self, resource, process):
+        """`resource` is granted to `process`, satisfying its pending request."""
+        self.remove_edge(process, resource)
+        return self.add_edge(resource, process)
+
+    def release(self, resource, process):
+        self.remove_edge(resource, process)
+
+    def is_deadlocked(self):
+        return bool(self.cycles)
+
+    def deadlocks(self):
+        """Full SCC analysis of the current graph (see `find_deadlocks`)."""
+        graph = {node: set(succ) for node, succ in self.succ.items()}
+        for u, v in self.cycles:
+            graph[u].add(v)
+        return find_deadlocks(graph)
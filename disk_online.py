@@ -0,0 +1,214 @@
+# disk_online.py
+"""
+Online disk scheduling: requests arrive over time instead of as one batch.
+
+Pending requests live in a bisect-maintained list of (cylinder, seq) so the
+head can find its neighbours in O(log n). Moving one cylinder costs
+`seek_time` and every request then takes `service_time` to transfer.
+"""
+from bisect import bisect_left, insort
+from collections import deque
+
+import numpy as np
+
+ALGORITHMS = ('fcfs', 'sstf', 'scan', 'look', 'c_scan', 'c_look')
+PERCENTILES = (50, 90, 95, 99)
+
+
+class _CylinderQueue:
+    """Pending requests ordered by cylinder, ties broken by arrival order."""
+
+    def __init__(self):
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, cylinder, seq):
+        insort(self.items, (cylinder, seq))
+
+    def pop(self, index):
+        return self.items.pop(index)
+
+    def at_or_above(self, cylinder):
+        """Index of the first request at or above `cylinder`, or None."""
+        i = bisect_left(self.items, (cylinder, -1))
+        return i if i < len(self.items) else None
+
+    def below(self, cylinder):
+        """Index of the earliest-arrived request on the nearest cylinder below `cylinder`, or None."""
+        i = bisect_left(self.items, (cylinder, -1)) - 1
+        if i < 0:
+            return None
+        return bisect_left(self.items, (self.items[i][0], -1))
+
+
+def _next_index(queue, head, algorithm, direction, disk_size, swept, at_head):
+    """
+    Choose the next request for the elevator-style policies.
+
+    `swept` says whether anything was served since the queue last ran dry;
+    `at_head` whether the head is resting on a cylinder it has just served
+    (otherwise a request on the head's own cylinder belongs to the upward
+    side, as in disk_scheduler's batch functions).
+
+    Returns (index, new_direction, extra_path, turned), where extra_path
+    lists the cylinders the head sweeps through without serving anything
+    (disk ends) and turned says whether the sweep reversed or wrapped.
+    """
+    if algorithm == 'sstf':
+        up = queue.at_or_above(head)
+        down = queue.below(head)
+        if up is None:
+            return down, direction, [], False
+        if down is None:
+            return up, direction, [], False
+        d_up = queue.items[up][0] - head
+        d_down = head - queue.items[down][0]
+        if d_down < d_up or (d_down == d_up and queue.items[down][1] < queue.items[up][1]):
+            return down, direction, [], False
+        return up, direction, [], False
+
+    if algorithm in ('look', 'scan'):
+        i = queue.at_or_above(head) if direction == 'right' else queue.below(head + 1 if at_head else head)
+        if i is not None:
+            return i, direction, [], False
+        turn = 'left' if direction == 'right' else 'right'
+        # SCAN runs on to the disk end before reversing, unless it had nothing to serve on the way
+        edge = [disk_size - 1 if direction == 'right' else 0] if algorithm == 'scan' and swept else []
+        i = queue.below(head) if turn == 'left' else queue.at_or_above(head)
+        return i, turn, edge, True
+
+    # c_look / c_scan: only serve while moving up, then wrap around
+    i = queue.at_or_above(head)
+    if i is not None:
+        return i, 'right', [], False
+    edge = [disk_size - 1, 0] if algorithm == 'c_scan' and swept else []
+    return 0, 'right', edge, True
+
+
+def online_disk_scheduling(requests, head, algorithm='sstf', disk_size=200, direction='right',
+                           seek_time=1.0, service_time=0.0):
+    """
+    Serve arrival-timed requests with one of ALGORITHMS.
+
+    SCAN and C-SCAN sweep to the disk edge the way the batch functions in
+    disk_scheduler.py do: the head turns at the edge (C-SCAN: wraps via
+    the edge and cylinder 0) only if it served something on the way, and
+    the first sweep of a busy period runs on to the edge even when the
+    queue empties. When every request arrives at time 0 the seek sequence
+    and total match scan_disk_scheduling / c_scan_disk_scheduling (and
+    the other batch functions) for the same direction.
+
+    Args:
+        requests (iterable): (arrival_time, cylinder, ...) tuples sorted by arrival time.
+        head (int): Initial head position.
+        algorithm (str): One of ALGORITHMS.
+        disk_size (int): Number of cylinders.
+        direction (str): Initial sweep direction for SCAN/LOOK.
+        seek_time (float): Time to move one cylinder.
+        service_time (float): Transfer time per request.
+
+    Returns:
+        dict: seek sequence, total seek distance (including edge sweeps),
+        per-request response times (in arrival order), their percentiles,
+        makespan (up to the last completion) and throughput.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if not 0 <= head < disk_size:
+        raise ValueError(f"Head position {head} is outside the disk (0-{disk_size - 1})")
+
+    it = iter(requests)
+    pending = next(it, None)
+    fifo = deque()
+    queue = _CylinderQueue()
+    arrivals = []
+    responses = []
+    sequence = []
+    total_seek = 0
+    time = 0.0
+    done = 0.0
+    swept = turned = False  # since the queue last ran dry
+
+    while True:
+        # Admit everything that has arrived by now
+        while pending is not None and pending[0] <= time:
+            arrival, cylinder = pending[0], pending[1]
+            if not 0 <= cylinder < disk_size:
+                raise ValueError(f"Request {cylinder} is outside the disk (0-{disk_size - 1})")
+            seq = len(arrivals)
+            arrivals.append(arrival)
+            responses.append(0.0)
+            if algorithm == 'fcfs':
+                fifo.append((cylinder, seq))
+            else:
+                queue.add(cylinder, seq)
+            pending = next(it, None)
+
+        if not fifo and not len(queue):
+            if swept and not turned and algorithm in ('scan', 'c_scan'):
+                # The first sweep runs on to the edge
+                if algorithm == 'scan':
+                    path = [disk_size - 1 if direction == 'right' else 0]
+                else:
+                    path = [disk_size - 1, 0]
+                for position in path:
+                    total_seek += abs(position - head)
+                    time += abs(position - head) * seek_time
+                    head = position
+            swept = turned = False
+            if pending is None:
+                break
+            time = max(time, pending[0])
+            continue
+
+        if algorithm == 'fcfs':
+            cylinder, seq = fifo.popleft()
+            path = [cylinder]
+        else:
+            at_head = bool(sequence) and sequence[-1] == head
+            index, direction, path, turn = _next_index(queue, head, algorithm, direction, disk_size, swept, at_head)
+            turned = turned or turn
+            cylinder, seq = queue.pop(index)
+            path = path + [cylinder]
+
+        for position in path:
+            total_seek += abs(position - head)
+            time += abs(position - head) * seek_time
+            head = position
+        time += service_time
+        done = time
+        swept = True
+        sequence.append(cylinder)
+        responses[seq] = time - arrivals[seq]
+
+    responses = np.asarray(responses, dtype=float)
+    makespan = done - (arrivals[0] if arrivals else 0.0)
+    return {
+        'sequence': sequence,
+        'total_seek': total_seek,
+        'response_times': responses,
+        'percentiles': response_percentiles(responses),
+        'makespan': makespan,
+        'throughput': len(sequence) / makespan if makespan > 0 else 0.0,
+    }
+
+
+def response_percentiles(responses, percentiles=PERCENTILES):
+    """Mean, max and the given percentiles of an array of response times."""
+    if len(responses) == 0:
+        return {}
+    values = np.percentile(responses, percentiles)
+    stats = {f'p{p}': float(v) for p, v in zip(percentiles, values)}
+    stats['mean'] = float(np.mean(responses))
+    stats['max'] = float(np.max(responses))
+    return stats
+
+
+def generate_arrivals(n, rate, disk_size=200, seed=0):
+    """Poisson arrivals with uniformly distributed cylinders, for sustained-load studies."""
+    rng = np.random.default_rng(seed)
+    times = np.cumsum(rng.exponential(1.0 / rate, size=n))
+    cylinders = rng.integers(0, disk_size, size=n)
+    return list(zip(times.tolist(), cylinders.tolist()))
@@ -1,149 +1,126 @@
 # disk_scheduler.py
+from bisect import bisect_left
 
-def fcfs_disk_scheduling(requests, head):
-    seek_sequence = []
-    total_seek_time = 0
-    current = head
-
-    for req in requests:
-        seek_sequence.append(req)
-        total_seek_time += abs(req - current)
-        current = req
+import numpy as np
 
-    return seek_sequence, total_seek_time
 
-def scan_disk_scheduling(requests, head, direction='left'):
-    requests = sorted(requests)
-    seek_sequence = []
-    total_seek_time = 0
-    current = head
+def _seek_total(head, path):
+    """Total head movement along `path` starting at `head`: sum of |diff|."""
+    if len(path) == 0:
+        return 0
+    positions = np.concatenate(([head], np.asarray(path)))
+    return int(np.abs(np.diff(positions)).sum())
 
-    if direction == 'left':
-        left = [r for r in requests if r < head][::-1]
-        right = [r for r in requests if r >= head]
-        for r in left:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-        if left:
-            total_seek_time += current
-            current = 0
-        for r in right:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-    else:
-        right = [r for r in requests if r >= head]
-        left = [r for r in requests if r < head][::-1]
-        for r in right:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-        if right:
-            total_seek_time += (199 - current)
-            current = 199
-        for r in left:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-
-    return seek_sequence, total_seek_time
-
-def c_scan_disk_scheduling(requests, head):
-    requests = sorted(requests)
-    seek_sequence = []
-    total_seek_time = 0
-    current = head
 
-    right = [r for r in requests if r >= head]
-    left = [r for r in requests if r < head]
+def _check_geometry(requests, head, disk_size):
+    """Reject heads or requests outside cylinders 0 .. disk_size - 1."""
+    if not 0 <= head < disk_size:
+        raise ValueError(f"Head position {head} is outside the disk (0-{disk_size - 1})")
+    if len(requests) and not 0 <= min(requests) <= max(requests) < disk_size:
+        raise ValueError(f"Requests must lie within cylinders 0-{disk_size - 1}")
 
-    for r in right:
-        seek_sequence.append(r)
-        total_seek_time += abs(current - r)
-        current = r
 
-    if right:
-        total_seek_time += (199 - current)
-        total_seek_time += 199
-        current = 0
+def _split(requests, head):
+    """Sorted requests below the head and at/above it."""
+    arr = np.sort(np.asarray(requests, dtype=np.int64))
+    cut = np.searchsorted(arr, head, side='left')
+    return arr[:cut], arr[cut:]
 
-    for r in left:
-        seek_sequence.append(r)
-        total_seek_time += abs(current - r)
-        current = r
 
-    return seek_sequence, total_seek_time
+def fcfs_disk_scheduling(requests, head, disk_size=200):
+    _check_geometry(requests, head, disk_size)
+    seek_sequence = list(requests)
+    return seek_sequence, _seek_total(head, seek_sequence)
 
-def look_disk_scheduling(requests, head, direction):
-    requests = sorted(requests)
-    seek_sequence = []
-    total_seek_time = 0
-    current = head
+def scan_disk_scheduling(requests, head, direction='left', disk_size=200):
+    _check_geometry(requests, head, disk_size)
+    left, right = _split(requests, head)
 
     if direction == 'left':
-        left = [r for r in requests if r < head][::-1]
-        right = [r for r in requests if r >= head]
-        for r in left:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-        for r in right:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
+        left = left[::-1]
+        sequence = np.concatenate((left, right))
+        # Sweep to cylinder 0 before reversing
+        path = np.concatenate((left, [0], right)) if len(left) else sequence
     else:
-        right = [r for r in requests if r >= head]
-        left = [r for r in requests if r < head][::-1]
-        for r in right:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-        for r in left:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-
-    return seek_sequence, total_seek_time
-
-def c_look_disk_scheduling(requests, head):
-    requests = sorted(requests)
-    seek_sequence = []
-    total_seek_time = 0
-    current = head
+        left = left[::-1]
+        sequence = np.concatenate((right, left))
+        # Sweep to the last cylinder before reversing
+        path = np.concatenate((right, [disk_size - 1], left)) if len(right) else sequence
 
-    right = [r for r in requests if r >= head]
-    left = [r for r in requests if r < head]
+    return sequence.tolist(), _seek_total(head, path)
 
-    for r in right:
-        seek_sequence.append(r)
-        total_seek_time += abs(current - r)
-        current = r
+def c_scan_disk_scheduling(requests, head, disk_size=200):
+    _check_geometry(requests, head, disk_size)
+    left, right = _split(requests, head)
+    sequence = np.concatenate((right, left))
 
-    if left:
-        total_seek_time += abs(current - left[0])
-        current = left[0]
-        for r in left:
-            seek_sequence.append(r)
-            total_seek_time += abs(current - r)
-            current = r
-
-    return seek_sequence, total_seek_time
-# disk_scheduler.py
-
-def sstf_disk_scheduling(requests, head):
-    requests = requests.copy()
-    seek_sequence = []
-    total_seek_time = 0
-    current = head
+    if len(right):
+        # Sweep to the last cylinder, then return to cylinder 0
+        path = np.concatenate((right, [disk_size - 1, 0], left))
+    else:
+        path = sequence
 
-    while requests:
-        distances = {req: abs(current - req) for req in requests}
-        closest = min(distances, key=distances.get)
-        seek_sequence.append(closest)
-        total_seek_time += abs(current - closest)
-        current = closest
-        requests.remove(closest)
+    return sequence.tolist(), _seek_total(head, path)
 
-    return seek_sequence, total_seek_time
+def look_disk_scheduling(requests, head, direction, disk_size=200):
+    _check_geometry(requests, head, disk_size)
+    left, right = _split(requests, head)
 
+    if direction == 'left':
+        sequence = np.concatenate((left[::-1], right))
+    else:
+        sequence = np.concatenate((right, left[::-1]))
+
+    return sequence.tolist(), _seek_total(head, sequence)
+
+def c_look_disk_scheduling(requests, head, disk_size=200):
+    _check_geometry(requests, head, disk_size)
+    left, right = _split(requests, head)
+    sequence = np.concatenate((right, left))
+    return sequence.tolist(), _seek_total(head, sequence)
+
+def sstf_disk_scheduling(requests, head, disk_size=200):
+    """
+    Shortest Seek Time First in O(n log n).
+
+    The served requests always form a contiguous run of the sorted request
+    array around the head, so the next request is one of the two neighbours
+    of that run. Duplicate requests are all served (at zero extra seek);
+    ties in distance go to the request that came first in `requests`.
+    """
+    _check_geometry(requests, head, disk_size)
+    if len(requests) == 0:
+        return [], 0
+
+    values, first_seen, counts = np.unique(np.asarray(requests, dtype=np.int64), return_index=True, return_counts=True)
+    vals = values.tolist()
+    first = first_seen.tolist()
+    n = len(vals)
+
+    hi = bisect_left(vals, head)
+    lo = hi - 1
+    current = head
+    order = []
+
+    while lo >= 0 or hi < n:
+        if hi >= n:
+            take_left = True
+        elif lo < 0:
+            take_left = False
+        else:
+            d_left = current - vals[lo]
+            d_right = vals[hi] - current
+            take_left = d_left < d_right or (d_left == d_right and first[lo] < first[hi])
+
+        if take_left:
+            order.append(lo)
+            current = vals[lo]
+            lo -= 1
+        else:
+            order.append(hi)
+            current = vals[hi]
+            hi += 1
+
+    order = np.asarray(order, dtype=np.int64)
+    sequence = np.repeat(values[order], counts[order])
+    return sequence.tolist(), _seek_total(head, values[order])
@@ -0,0 +1,189 @@
+# disk_trace.py
+"""
+Block I/O trace ingestion and single-pass evaluation of the disk schedulers.
+
+Two input formats are understood:
+- blkparse text output (default format), e.g.
+      8,0    3       11     0.009507758   697  Q   W 223490 + 8 [kjournald]
+- a compact binary format written by `write_binary_trace`: header b'BIOT' +
+  version (u16), then fixed 25-byte records (see RECORD_DTYPE).
+
+Both are memory-mapped and decoded chunk by chunk into NumPy record arrays,
+so memory use depends on the chunk size, not on the trace size.
+"""
+import mmap
+import struct
+
+import numpy as np
+
+from disk_scheduler import (
+    fcfs_disk_scheduling, sstf_disk_scheduling, scan_disk_scheduling,
+    look_disk_scheduling, c_scan_disk_scheduling, c_look_disk_scheduling
+)
+
+MAGIC = b'BIOT'
+VERSION = 1
+HEADER = struct.Struct('<4sH')
+RECORD_DTYPE = np.dtype([
+    ('time', '<f8'),
+    ('sector', '<u8'),
+    ('nblocks', '<u4'),
+    ('write', 'u1'),
+    ('pid', '<u4'),
+])
+CHUNK_BYTES = 64 << 20
+
+
+def _open_map(path):
+    f = open(path, 'rb')
+    try:
+        return f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # empty file
+        f.close()
+        raise ValueError(f"{path} is empty")
+
+
+def iter_blkparse(path, action='Q', chunk_bytes=CHUNK_BYTES):
+    """
+    Yield record-array chunks of the `action` events in a blkparse text trace.
+
+    'Q' (queued) events are the requests as the application issued them,
+    before any kernel scheduler reordered them. Lines that are not I/O
+    events (summaries, messages, plugs) are skipped.
+    """
+    f, mm = _open_map(path)
+    try:
+        size = len(mm)
+        pos = 0
+        action = action.encode()
+        while pos < size:
+            end = mm.find(b'\n', min(pos + chunk_bytes, size))
+            end = size if end == -1 else end + 1
+            rows = []
+            for line in mm[pos:end].splitlines():
+                parts = line.split()
+                # dev cpu seq time pid action rwbs sector + nblocks [process]
+                if len(parts) < 10 or parts[5] != action or parts[8] != b'+':
+                    continue
+                try:
+                    rows.append((float(parts[3]), int(parts[7]), int(parts[9]),
+                                 b'W' in parts[6], int(parts[4])))
+                except ValueError:
+                    continue
+            pos = end
+            if rows:
+                yield np.array(rows, dtype=RECORD_DTYPE)
+    finally:
+        mm.close()
+        f.close()
+
+
+def write_binary_trace(chunks, path):
+    """Write record-array chunks (e.g. from `iter_blkparse`) to the compact binary format."""
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION))
+        for chunk in chunks:
+            f.write(np.ascontiguousarray(chunk, dtype=RECORD_DTYPE).tobytes())
+            count += len(chunk)
+    return count
+
+
+def iter_binary_trace(path, chunk_records=CHUNK_BYTES // RECORD_DTYPE.itemsize):
+    """Yield record-array chunks from a binary trace without copying it into memory."""
+    f, mm = _open_map(path)
+    try:
+        if len(mm) < HEADER.size:
+            raise ValueError(f"{path}: truncated trace header")
+        magic, version = HEADER.unpack(mm[:HEADER.size])
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} block trace")
+        total = (len(mm) - HEADER.size) // RECORD_DTYPE.itemsize
+        for start in range(0, total, chunk_records):
+            count = min(chunk_records, total - start)
+            # Copy out so no view pins the map when it is closed
+            yield np.frombuffer(mm, dtype=RECORD_DTYPE, count=count,
+                                offset=HEADER.size + start * RECORD_DTYPE.itemsize).copy()
+    finally:
+        mm.close()
+        f.close()
+
+
+def iter_trace(path, **kwargs):
+    """Dispatch on the file header: binary traces start with MAGIC, anything else is blkparse text."""
+    with open(path, 'rb') as f:
+        binary = f.read(len(MAGIC)) == MAGIC
+    return iter_binary_trace(path, **kwargs) if binary else iter_blkparse(path, **kwargs)
+
+
+def sector_to_cylinder(sectors, sectors_per_cylinder, disk_size):
+    """Map sector numbers to cylinders, clamping to the last cylinder."""
+    cylinders = np.asarray(sectors, dtype=np.uint64) // np.uint64(sectors_per_cylinder)
+    return np.minimum(cylinders, disk_size - 1).astype(np.int64)
+
+
+def _opposite(direction):
+    return 'left' if direction == 'right' else 'right'
+
+
+def compare_on_trace(chunks, head=0, disk_size=200, sectors_per_cylinder=2048,
+                     window=64, direction='right'):
+    """
+    Run all six disk scheduling algorithms over a trace in one pass.
+
+    The trace is cut into consecutive windows of `window` requests (the
+    queue depth the scheduler gets to reorder). Each algorithm schedules
+    every window starting from where its own head stopped after the
+    previous window, so results are comparable across algorithms while
+    only one window is held in memory.
+
+    Returns:
+        dict: algorithm -> {'requests', 'total_seek', 'avg_seek'}.
+    """
+    heads = {name: head for name in ('FCFS', 'SSTF', 'SCAN', 'LOOK', 'C-SCAN', 'C-LOOK')}
+    directions = {'SCAN': direction, 'LOOK': direction}
+    totals = dict.fromkeys(heads, 0)
+    served = 0
+    carry = np.empty(0, dtype=np.int64)
+
+    def run_window(reqs):
+        for name in heads:
+            h = heads[name]
+            if name == 'FCFS':
+                seq, seek = fcfs_disk_scheduling(reqs, h, disk_size)
+            elif name == 'SSTF':
+                seq, seek = sstf_disk_scheduling(reqs, h, disk_size)
+            elif name in ('SCAN', 'LOOK'):
+                d = directions[name]
+                fn = scan_disk_scheduling if name == 'SCAN' else look_disk_scheduling
+                seq, seek = fn(reqs, h, d, disk_size)
+                # The sweep ends moving the other way whenever it had work behind the head
+                ahead = sum(1 for r in reqs if (r >= h if d == 'right' else r < h))
+                if ahead < len(reqs):
+                    directions[name] = _opposite(d)
+            elif name == 'C-SCAN':
+                seq, seek = c_scan_disk_scheduling(reqs, h, disk_size)
+            else:
+                seq, seek = c_look_disk_scheduling(reqs, h, disk_size)
+            totals[name] += seek
+            heads[name] = seq[-1]
+
+    for chunk in chunks:
+        cylinders = np.concatenate((carry, sector_to_cylinder(chunk['sector'], sectors_per_cylinder, disk_size)))
+        full = len(cylinders) - len(cylinders) % window
+        for start in range(0, full, window):
+            run_window(cylinders[start:start + window].tolist())
+        served += full
+        carry = cylinders[full:]
+    if len(carry):
+        run_window(carry.tolist())
+        served += len(carry)
+
+    return {
+        name: {
+            'requests': served,
+            'total_seek': totals[name],
+            'avg_seek': totals[name] / served if served else 0.0,
+        }
+        for name in heads
+    }
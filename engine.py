@@ -0,0 +1,322 @@
+# engine.py
+"""
+Shared simulation core for the Streamlit front ends (main.py, memoryst.py)
+and headless callers.
+
+Every entry point returns a small result object instead of an ad-hoc tuple:
+
+    translate_paging(...)      -> PagingResult
+    translate_segment(...)     -> SegmentResult
+    simulate_replacement(...)  -> ReplacementResult (optionally with a PageTrace)
+    schedule(...)              -> ScheduleResult (see schedule_result.py)
+
+Results and precomputed structures (Belady next-use arrays, the fault
+columns of every replacement run) go through one ResultCache. Arrays are
+published as .npy files in a per-user cache directory shared by every
+process of that user and read back with mmap, so two apps asking the same
+question compute it once and share one page-cache copy instead of each
+holding their own. Set OSIM_CACHE_DIR to move the directory. Cache keys
+include CACHE_VERSION and a hash of the simulator sources, so entries
+written by an older version of the code are never read back.
+"""
+import glob
+import hashlib
+import os
+import stat
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+import memorymanagmet
+import trace_table
+from cpu_scheduler import fcfs_schedule, priority_schedule, round_robin_schedule
+from memorymanagmet import REPLACEMENT_ALGORITHMS, logical_to_physical_paging, next_use_index, segmentation_translation
+from trace_table import PageTrace
+
+CACHE_DIR = os.environ.get('OSIM_CACHE_DIR') or os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'osim')
+MEMORY_ENTRIES = 256  # in-process entries kept in front of the shared directory
+DISK_LIMIT = 1 << 30  # bytes of .npy files kept before the oldest are pruned
+CACHE_VERSION = 1  # bump when the layout of cached arrays changes
+
+SCHEDULERS = {
+    'FCFS': lambda processes, time_quantum: fcfs_schedule(processes),
+    'Round Robin': round_robin_schedule,
+    'Priority (Non-preemptive)': lambda processes, time_quantum: priority_schedule(processes),
+}
+
+
+class PagingResult:
+    __slots__ = ('physical_address', 'page_number', 'offset')
+
+    def __init__(self, physical_address, page_number, offset):
+        self.physical_address = physical_address
+        self.page_number = page_number
+        self.offset = offset
+
+    def as_tuple(self):
+        return self.physical_address, self.page_number, self.offset
+
+
+class SegmentResult:
+    __slots__ = ('segment', 'offset', 'base', 'limit', 'physical_address')
+
+    def __init__(self, segment, offset, base, limit, physical_address):
+        self.segment = segment
+        self.offset = offset
+        self.base = base
+        self.limit = limit
+        self.physical_address = physical_address
+
+    @property
+    def valid(self):
+        return self.physical_address is not None
+
+    def as_tuple(self):
+        return self.segment, self.offset, self.base, self.limit, self.physical_address
+
+
+class ReplacementResult:
+    """Fault count of one page-replacement run, plus its PageTrace when requested."""
+
+    __slots__ = ('algorithm', 'frame_size', 'references', 'faults', 'trace')
+
+    def __init__(self, algorithm, frame_size, references, faults, trace=None):
+        self.algorithm = algorithm
+        self.frame_size = frame_size
+        self.references = references
+        self.faults = faults
+        self.trace = trace
+
+    @property
+    def hits(self):
+        return self.references - self.faults
+
+    @property
+    def fault_ratio(self):
+        return self.faults / self.references if self.references else 0.0
+
+    def as_tuple(self):
+        return self.algorithm, self.frame_size, self.references, self.faults
+
+
+def _private_directory(directory):
+    """Create `directory` (mode 0o700) if missing; True if it is ours alone to write."""
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        st = os.lstat(directory)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        return False
+    return not hasattr(os, 'getuid') or st.st_uid == os.getuid()
+
+
+def _source_hash(*modules):
+    """Hash of the source files of `modules`, so cached results follow code changes."""
+    h = hashlib.blake2b(digest_size=16)
+    for module in modules:
+        try:
+            with open(module.__file__, 'rb') as f:
+                h.update(f.read())
+        except (OSError, TypeError):
+            h.update(module.__name__.encode())
+    return h.hexdigest()
+
+
+_CODE_KEY = (CACHE_VERSION, _source_hash(memorymanagmet, trace_table))
+
+
+def _digest(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in (_CODE_KEY,) + parts:
+        h.update(part.tobytes() if isinstance(part, np.ndarray) else repr(part).encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-level cache: a small in-process LRU in front of mmap-ed .npy files
+    in `directory`. Files are written to a temporary name and renamed into
+    place, so concurrent readers never see a partial array. The directory
+    is created with mode 0o700 and only used if it is a real directory
+    owned by the current user that nobody else can write to; otherwise
+    (or if it cannot be created) the cache degrades to in-process only.
+    Once the files exceed `disk_limit` bytes the least recently written
+    ones are removed (mappings already open stay valid).
+    """
+
+    def __init__(self, directory=CACHE_DIR, memory_entries=MEMORY_ENTRIES, disk_limit=DISK_LIMIT):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.disk_limit = disk_limit
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._trusted = None
+
+    @property
+    def shared(self):
+        """True when the directory is safe to read from and publish to (checked once)."""
+        if self._trusted is None:
+            self._trusted = _private_directory(self.directory)
+        return self._trusted
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+        return value
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.npy')
+
+    def _publish(self, path, value):
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, value)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            return False
+        self._prune()
+        return True
+
+    def _prune(self):
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.npy')):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_limit:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+    def _load(self, path):
+        if not self.shared:
+            return None
+        try:
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError):  # missing, or too small to map
+            return None
+
+    def array(self, key, compute):
+        """Return the array stored under `key`, computing and publishing it on a miss."""
+        if key in self.memory:
+            self.hits += 1
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        path = self._path(key)
+        value = self._load(path)
+        if value is not None:
+            self.hits += 1
+            return self._remember(key, value)
+        self.misses += 1
+        value = np.asarray(compute())
+        if value.size and self.shared and self._publish(path, value):
+            # Hold the shared mapping rather than a private copy
+            shared = self._load(path)
+            if shared is not None:
+                value = shared
+        return self._remember(key, value)
+
+    def memo(self, key, compute):
+        """In-process only, for results that are not plain arrays."""
+        if key in self.memory:
+            self.hits += 1
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        self.misses += 1
+        return self._remember(key, compute())
+
+    def stats(self):
+        files = glob.glob(os.path.join(self.directory, '*.npy')) if self.shared else []
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'memory_entries': len(self.memory),
+            'disk_files': len(files),
+            'disk_bytes': sum(os.path.getsize(f) for f in files if os.path.exists(f)),
+        }
+
+    def clear(self):
+        self.memory.clear()
+        if not self.shared:
+            return
+        for path in glob.glob(os.path.join(self.directory, '*.npy')):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+_default_cache = None
+
+
+def default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
+
+
+def translate_paging(logical_address, page_size, base_address):
+    return PagingResult(*logical_to_physical_paging(logical_address, page_size, base_address))
+
+
+def translate_segment(segments, segment, offset):
+    base, limit = segments.get(segment, (0, 0))
+    return SegmentResult(segment, offset, base, limit, segmentation_translation(segments, segment, offset))
+
+
+def simulate_replacement(algorithm, pages, frame_size, trace=False, cache=None):
+    """
+    Run one REPLACEMENT_ALGORITHMS entry through the shared cache.
+
+    The fault columns of the run (and, for Optimal, the next-use array of
+    the reference string) are cached, so a later call with trace=True, or
+    from the other app, costs a file map instead of a simulation.
+    """
+    if algorithm not in REPLACEMENT_ALGORITHMS:
+        raise ValueError(f"Unknown replacement algorithm: {algorithm}")
+    if frame_size < 1:
+        raise ValueError(f"Frame size must be at least 1, got {frame_size}")
+    cache = cache or default_cache()
+    pages = np.asarray(pages, dtype=np.int64).ravel()
+    pages_key = _digest('pages', pages)
+
+    def run():
+        page_list = pages.tolist()
+        kwargs = {}
+        if algorithm == 'Optimal':
+            kwargs['next_use'] = cache.array(_digest('next_use', pages_key), lambda: next_use_index(page_list))
+        _, deltas = REPLACEMENT_ALGORITHMS[algorithm](page_list, frame_size, trace='delta', **kwargs)
+        return PageTrace(pages, frame_size, deltas).columns()
+
+    columns = cache.array(_digest('replacement', algorithm, frame_size, pages_key), run)
+    page_trace = PageTrace.from_columns(pages, frame_size, columns) if trace else None
+    return ReplacementResult(algorithm, frame_size, len(pages), int(columns.shape[1]), page_trace)
+
+
+def schedule(algorithm, processes, time_quantum=None, cache=None):
+    """Run a CPU scheduler (a SCHEDULERS name); returns a ScheduleResult."""
+    if algorithm not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    cache = cache or default_cache()
+    key = _digest('schedule', algorithm, time_quantum, [sorted(p.items()) for p in processes])
+    return cache.memo(key, lambda: SCHEDULERS[algorithm](processes, time_quantum))
@@ -0,0 +1,267 @@
+# io_schedulers.py
+"""
+Simulations of the Linux block-layer I/O schedulers on the disk model of
+`disk_online.py`:
+
+- 'none':        dispatch in arrival order.
+- 'mq-deadline': per-direction sector-sorted queues plus read/write FIFOs
+                 with expiry times; dispatches in batches of `fifo_batch`
+                 requests in sector order, jumps to the FIFO head when its
+                 deadline has passed, and prefers reads unless writes have
+                 been starved `writes_starved` times.
+- 'bfq':         proportional share between processes. Each backlogged
+                 process gets a budget of requests and a virtual finish time
+                 budget / weight; the process with the smallest finish time
+                 is served next, in sector order within its own queue.
+
+Requests are (arrival_time, cylinder[, is_write[, pid]]) tuples sorted by
+arrival time, so the same workloads drive `online_disk_scheduling`.
+"""
+import heapq
+from bisect import bisect_left, insort
+from collections import deque
+
+import numpy as np
+
+from disk_online import ALGORITHMS, online_disk_scheduling, response_percentiles
+
+IO_SCHEDULERS = ('none', 'mq-deadline', 'bfq')
+
+READ, WRITE = 0, 1
+
+
+class _Noop:
+    def __init__(self):
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, req):
+        self.queue.append(req)
+
+    def dispatch(self, now, head):
+        return self.queue.popleft()
+
+
+class _Deadline:
+    def __init__(self, read_expire=500, write_expire=5000, fifo_batch=16, writes_starved=2):
+        self.expire = (read_expire, write_expire)
+        self.fifo_batch = fifo_batch
+        self.writes_starved = writes_starved
+        self.sorted = ([], [])  # per direction: [(cylinder, seq)]
+        self.fifo = ([], [])    # per direction: heap of (deadline, seq), lazily pruned
+        self.pending = {}
+        self.next_pos = [0, 0]
+        self.batch_dir = None
+        self.batching = 0
+        self.starved = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, req):
+        seq, arrival, cylinder, direction, _ = req
+        insort(self.sorted[direction], (cylinder, seq))
+        heapq.heappush(self.fifo[direction], (arrival + self.expire[direction], seq))
+        self.pending[seq] = req
+
+    def _expired(self, direction, now):
+        fifo = self.fifo[direction]
+        while fifo and fifo[0][1] not in self.pending:
+            heapq.heappop(fifo)
+        if fifo and fifo[0][0] <= now:
+            return self.pending[fifo[0][1]]
+        return None
+
+    def _take(self, direction, index):
+        cylinder, seq = self.sorted[direction].pop(index)
+        self.next_pos[direction] = cylinder
+        return self.pending.pop(seq)
+
+    def dispatch(self, now, head):
+        # Keep going in sector order while the current batch lasts
+        if self.batch_dir is not None and self.batching < self.fifo_batch:
+            queue = self.sorted[self.batch_dir]
+            i = bisect_left(queue, (self.next_pos[self.batch_dir], -1))
+            if i < len(queue):
+                self.batching += 1
+                return self._take(self.batch_dir, i)
+
+        reads, writes = self.sorted[READ], self.sorted[WRITE]
+        if reads and (not writes or self.starved < self.writes_starved):
+            direction = READ
+            if writes:
+                self.starved += 1
+        else:
+            direction = WRITE
+            self.starved = 0
+
+        queue = self.sorted[direction]
+        expired = self._expired(direction, now)
+        if expired is not None:
+            i = bisect_left(queue, (expired[2], expired[0]))
+        else:
+            i = bisect_left(queue, (self.next_pos[direction], -1))
+            if i == len(queue):
+                i = 0  # wrap around to the lowest sector
+        self.batch_dir = direction
+        self.batching = 1
+        return self._take(direction, i)
+
+
+class _ProportionalShare:
+    def __init__(self, weights=None, budget=16):
+        self.weights = weights or {}
+        self.budget = budget
+        self.queues = {}   # pid -> [(cylinder, seq)]
+        self.pending = {}
+        self.tags = {}     # pid -> virtual finish time of its latest slice
+        self.heap = []     # (finish, order, pid), lazily pruned
+        self.order = 0
+        self.vtime = 0.0
+        self.active = None
+        self.remaining = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def _schedule(self, pid):
+        weight = self.weights.get(pid, 100)
+        finish = max(self.vtime, self.tags.get(pid, 0.0)) + self.budget / weight
+        self.tags[pid] = finish
+        heapq.heappush(self.heap, (finish, self.order, pid))
+        self.order += 1
+
+    def add(self, req):
+        seq, _, cylinder, _, pid = req
+        queue = self.queues.setdefault(pid, [])
+        if not queue and pid != self.active:
+            self._schedule(pid)
+        insort(queue, (cylinder, seq))
+        self.pending[seq] = req
+
+    def dispatch(self, now, head):
+        if self.active is None or self.remaining == 0 or not self.queues[self.active]:
+            if self.active is not None and self.queues[self.active]:
+                self._schedule(self.active)
+            while True:
+                finish, _, pid = heapq.heappop(self.heap)
+                if self.tags[pid] == finish and self.queues[pid]:
+                    break
+            self.active = pid
+            self.remaining = self.budget
+            self.vtime = finish - self.budget / self.weights.get(pid, 100)
+
+        queue = self.queues[self.active]
+        i = bisect_left(queue, (head, -1))
+        if i == len(queue):
+            i = 0
+        _, seq = queue.pop(i)
+        self.remaining -= 1
+        return self.pending.pop(seq)
+
+
+def _normalize(requests):
+    for seq, r in enumerate(requests):
+        yield (seq, r[0], r[1], WRITE if len(r) > 2 and r[2] else READ, r[3] if len(r) > 3 else 0)
+
+
+def run_io_scheduler(requests, policy='mq-deadline', head=0, disk_size=200, seek_time=1.0,
+                     service_time=0.0, **options):
+    """
+    Simulate one of IO_SCHEDULERS.
+
+    Extra keyword options go to the policy: read_expire, write_expire,
+    fifo_batch and writes_starved for 'mq-deadline'; weights (pid -> weight)
+    and budget for 'bfq'.
+
+    Returns:
+        dict: total seek, throughput, makespan, response-time percentiles
+        overall and per direction, and per-process request counts and mean
+        response times.
+    """
+    if policy == 'none':
+        sched = _Noop()
+    elif policy == 'mq-deadline':
+        sched = _Deadline(**options)
+    elif policy == 'bfq':
+        sched = _ProportionalShare(**options)
+    else:
+        raise ValueError(f"Unknown I/O scheduler: {policy}")
+
+    it = _normalize(requests)
+    pending = next(it, None)
+    responses = []
+    directions = []
+    per_pid = {}
+    total_seek = 0
+    time = 0.0
+    first_arrival = pending[1] if pending is not None else 0.0
+
+    while pending is not None or len(sched):
+        while pending is not None and pending[1] <= time:
+            if not 0 <= pending[2] < disk_size:
+                raise ValueError(f"Request {pending[2]} is outside the disk (0-{disk_size - 1})")
+            sched.add(pending)
+            responses.append(0.0)
+            directions.append(pending[3])
+            pending = next(it, None)
+
+        if not len(sched):
+            time = max(time, pending[1])
+            continue
+
+        seq, arrival, cylinder, _, pid = sched.dispatch(time, head)
+        distance = abs(cylinder - head)
+        total_seek += distance
+        time += distance * seek_time + service_time
+        head = cylinder
+        responses[seq] = time - arrival
+        count, total = per_pid.get(pid, (0, 0.0))
+        per_pid[pid] = (count + 1, total + responses[seq])
+
+    responses = np.asarray(responses, dtype=float)
+    directions = np.asarray(directions, dtype=np.int8)
+    makespan = time - first_arrival
+    return {
+        'policy': policy,
+        'total_seek': total_seek,
+        'makespan': makespan,
+        'throughput': len(responses) / makespan if makespan > 0 else 0.0,
+        'percentiles': response_percentiles(responses),
+        'read_percentiles': response_percentiles(responses[directions == READ]),
+        'write_percentiles': response_percentiles(responses[directions == WRITE]),
+        'per_process': {pid: {'requests': c, 'mean_response': t / c} for pid, (c, t) in per_pid.items()},
+    }
+
+
+def compare_io_schedulers(requests, head=0, disk_size=200, seek_time=1.0, service_time=0.0):
+    """
+    Run the seek algorithms and the Linux-style schedulers on the same workload.
+
+    Returns a list of rows: algorithm, total seek, throughput and the
+    response-time percentiles.
+    """
+    requests = list(requests)
+    rows = []
+    for alg in ALGORITHMS:
+        result = online_disk_scheduling(requests, head, alg, disk_size,
+                                        seek_time=seek_time, service_time=service_time)
+        rows.append({'Algorithm': alg.upper().replace('_', '-'), 'Total Seek': result['total_seek'],
+                     'Throughput': result['throughput'], **result['percentiles']})
+    for policy in IO_SCHEDULERS:
+        result = run_io_scheduler(requests, policy, head, disk_size, seek_time, service_time)
+        rows.append({'Algorithm': policy, 'Total Seek': result['total_seek'],
+                     'Throughput': result['throughput'], **result['percentiles']})
+    return rows
+
+
+def generate_io_workload(n, rate, disk_size=200, write_fraction=0.3, num_processes=4, seed=0):
+    """Poisson arrivals of reads and writes from several processes, uniformly spread over the disk."""
+    rng = np.random.default_rng(seed)
+    times = np.cumsum(rng.exponential(1.0 / rate, size=n))
+    cylinders = rng.integers(0, disk_size, size=n)
+    writes = rng.random(n) < write_fraction
+    pids = rng.integers(0, num_processes, size=n)
+    return list(zip(times.tolist(), cylinders.tolist(), writes.tolist(), pids.tolist()))
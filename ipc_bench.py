@@ -0,0 +1,445 @@
+# ipc_bench.py
+"""
+Throughput / latency benchmark of local IPC mechanisms.
+
+For each mechanism and message size, one child process is forked:
+
+1. ping-pong: the parent sends a message, the child echoes it back, and
+   the round trip is timed;
+2. streaming: the parent sends a batch of messages one way and the child
+   reports back the CPU time it spent receiving them.
+
+Mechanisms: 'pipe', 'unix_stream', 'unix_dgram', 'mp_pipe', 'mp_queue',
+'shm_ring' (lock-free single-producer/single-consumer ring in
+multiprocessing.shared_memory) and 'mmap' (the same ring over an mmap-ed
+file). Message sizes are fixed per run, so receivers read exactly `size`
+bytes and no framing is needed. Linux/Unix only (fork, AF_UNIX).
+
+The parent closes its copy of the child's end, so a child that dies shows
+up as EOF on the fd-based channels; the channels that cannot see EOF
+(datagrams, queues, rings) poll the child's liveness while waiting and
+give up after PEER_TIMEOUT seconds without progress.
+
+Usage:
+    python ipc_bench.py --sizes 64 4096 1048576 --mechanisms pipe shm_ring
+"""
+import argparse
+import mmap
+import multiprocessing as mp
+import os
+import queue
+import socket
+import struct
+import tempfile
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+MECHANISMS = ('pipe', 'unix_stream', 'unix_dgram', 'mp_pipe', 'mp_queue', 'shm_ring', 'mmap')
+SIZES = (64, 1024, 16 * 1024, 256 * 1024, 1024 * 1024, 4 * 1024 * 1024)
+RTT_PERCENTILES = (50, 90, 99)
+DGRAM_CHUNK = 32 * 1024     # datagram payload limit used to fragment large messages
+RING_CAPACITY = 1 << 20     # bytes per shared-memory ring
+PEER_TIMEOUT = 60.0        # seconds a receiver/sender waits for its peer without progress
+PEER_POLL = 0.5            # seconds between liveness checks on blocking waits
+_CPU = struct.Struct('d')
+
+
+def _check_peer(alive, since):
+    """Raise if the peer process exited or has not made progress since `since`."""
+    if alive is not None and not alive():
+        raise EOFError("IPC peer exited")
+    if time.monotonic() - since > PEER_TIMEOUT:
+        raise TimeoutError(f"IPC peer made no progress for {PEER_TIMEOUT:g} s")
+
+
+def _read_exact(read_into, view):
+    got = 0
+    while got < len(view):
+        n = read_into(view[got:])
+        if not n:
+            raise EOFError("IPC peer closed the channel")
+        got += n
+
+
+class _FdEnd:
+    """One direction of each of two fd-based channels (pipes or stream sockets)."""
+
+    def __init__(self, read_fd, write_fd):
+        self.read_fd, self.write_fd = read_fd, write_fd
+
+    def send(self, data):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.write_fd, view):]
+
+    def recv(self, buf):
+        _read_exact(lambda v: os.readv(self.read_fd, [v]), memoryview(buf))
+        return buf
+
+    def close(self):
+        for fd in (self.read_fd, self.write_fd):
+            if fd >= 0:
+                os.close(fd)
+        self.read_fd = self.write_fd = -1
+
+
+class _StreamSocketEnd:
+    def __init__(self, sock):
+        self.sock = sock
+
+    def send(self, data):
+        self.sock.sendall(data)
+
+    def recv(self, buf):
+        _read_exact(self.sock.recv_into, memoryview(buf))
+        return buf
+
+    def close(self):
+        self.sock.close()
+
+
+class _DgramSocketEnd:
+    # Datagram sockets never report EOF, so recv polls the peer (see watch)
+    def __init__(self, sock):
+        self.sock = sock
+        self.alive = None
+
+    def send(self, data):
+        view = memoryview(data)
+        start = 0
+        since = time.monotonic()
+        while start < len(view):
+            try:
+                self.sock.send(view[start:start + DGRAM_CHUNK])
+            except socket.timeout:
+                _check_peer(self.alive, since)
+                continue
+            start += DGRAM_CHUNK
+            since = time.monotonic()
+
+    def recv(self, buf):
+        view = memoryview(buf)
+        got = 0
+        since = time.monotonic()
+        while got < len(view):
+            try:
+                got += self.sock.recv_into(view[got:got + DGRAM_CHUNK])
+            except socket.timeout:
+                _check_peer(self.alive, since)
+                continue
+            since = time.monotonic()
+        return buf
+
+    def watch(self, process):
+        self.alive = process.is_alive
+        self.sock.settimeout(PEER_POLL)
+
+    def close(self):
+        self.sock.close()
+
+
+class _ConnectionEnd:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def send(self, data):
+        self.conn.send_bytes(data)
+
+    def recv(self, buf):
+        self.conn.recv_bytes_into(buf)
+        return buf
+
+    def close(self):
+        self.conn.close()
+
+
+class _QueueEnd:
+    def __init__(self, inbox, outbox):
+        self.inbox, self.outbox = inbox, outbox
+        self.alive = None
+
+    def send(self, data):
+        self.outbox.put(bytes(data))
+
+    def recv(self, buf):
+        since = time.monotonic()
+        while True:
+            try:
+                return self.inbox.get(timeout=PEER_POLL)
+            except queue.Empty:
+                _check_peer(self.alive, since)
+
+    def watch(self, process):
+        self.alive = process.is_alive
+
+    def close(self):
+        pass  # the queues are shared with the peer end; the channel cleanup closes them
+
+    def flush(self):
+        # put() hands data to a feeder thread; wait for it before exiting
+        self.outbox.close()
+        self.outbox.join_thread()
+
+
+class SpscRing:
+    """
+    Lock-free single-producer / single-consumer byte ring over any writable
+    buffer: a head counter (written by the producer only), a tail counter
+    (consumer only) on separate cache lines, then the data area.
+
+    The producer copies data before publishing the new head, relying on the
+    host's store ordering (x86 keeps stores in order). Waits give up when
+    `alive` (optional callable) reports the peer gone or after PEER_TIMEOUT
+    seconds without progress.
+    """
+
+    HEADER = 128
+
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer)
+        self.capacity = len(self.buffer) - self.HEADER
+        self.head = np.ndarray(1, dtype=np.int64, buffer=self.buffer, offset=0)
+        self.tail = np.ndarray(1, dtype=np.int64, buffer=self.buffer, offset=64)
+        self.data = self.buffer[self.HEADER:]
+        self.alive = None
+
+    def reset(self):
+        self.head[0] = 0
+        self.tail[0] = 0
+
+    def _wait(self, spins, since):
+        if spins > 64:
+            os.sched_yield()
+            if spins % 1024 == 0:
+                _check_peer(self.alive, since)
+
+    def send(self, data):
+        view = memoryview(data).cast('B')
+        capacity = self.capacity
+        head = int(self.head[0])
+        sent = 0
+        spins = 0
+        while sent < len(view):
+            free = capacity - (head - int(self.tail[0]))
+            if free == 0:
+                if spins == 0:
+                    since = time.monotonic()
+                spins += 1
+                self._wait(spins, since)
+                continue
+            spins = 0
+            pos = head % capacity
+            n = min(free, len(view) - sent, capacity - pos)
+            self.data[pos:pos + n] = view[sent:sent + n]
+            sent += n
+            head += n
+            self.head[0] = head
+
+    def recv(self, buf):
+        view = memoryview(buf)
+        capacity = self.capacity
+        tail = int(self.tail[0])
+        got = 0
+        spins = 0
+        while got < len(view):
+            ready = int(self.head[0]) - tail
+            if ready == 0:
+                if spins == 0:
+                    since = time.monotonic()
+                spins += 1
+                self._wait(spins, since)
+                continue
+            spins = 0
+            pos = tail % capacity
+            n = min(ready, len(view) - got, capacity - pos)
+            view[got:got + n] = self.data[pos:pos + n]
+            got += n
+            tail += n
+            self.tail[0] = tail
+        return buf
+
+    def release(self):
+        self.head = self.tail = None
+        self.data.release()
+        self.buffer.release()
+
+
+class _RingEnd:
+    def __init__(self, inbox, outbox):
+        self.inbox, self.outbox = inbox, outbox
+
+    def send(self, data):
+        self.outbox.send(data)
+
+    def recv(self, buf):
+        return self.inbox.recv(buf)
+
+    def watch(self, process):
+        self.inbox.alive = self.outbox.alive = process.is_alive
+
+    def close(self):
+        pass  # the rings are shared with the peer end; the channel cleanup releases them
+
+
+def _make_channel(mechanism, ctx):
+    """Return (parent end, child end, cleanup) for a two-way channel."""
+    if mechanism == 'pipe':
+        down_r, down_w = os.pipe()
+        up_r, up_w = os.pipe()
+        parent, child = _FdEnd(up_r, down_w), _FdEnd(down_r, up_w)
+        return parent, child, lambda: (parent.close(), child.close())
+    if mechanism in ('unix_stream', 'unix_dgram'):
+        kind = socket.SOCK_STREAM if mechanism == 'unix_stream' else socket.SOCK_DGRAM
+        a, b = socket.socketpair(socket.AF_UNIX, kind)
+        for sock in (a, b):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        End = _StreamSocketEnd if mechanism == 'unix_stream' else _DgramSocketEnd
+        return End(a), End(b), lambda: (a.close(), b.close())
+    if mechanism == 'mp_pipe':
+        a, b = ctx.Pipe()
+        return _ConnectionEnd(a), _ConnectionEnd(b), lambda: (a.close(), b.close())
+    if mechanism == 'mp_queue':
+        down, up = ctx.Queue(), ctx.Queue()
+        return _QueueEnd(up, down), _QueueEnd(down, up), lambda: (down.close(), up.close())
+    if mechanism in ('shm_ring', 'mmap'):
+        size = 2 * (SpscRing.HEADER + RING_CAPACITY)
+        if mechanism == 'shm_ring':
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            region = shm.buf
+
+            def close_region():
+                shm.close()
+                shm.unlink()
+        else:
+            f = tempfile.TemporaryFile(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+            f.truncate(size)
+            mapped = mmap.mmap(f.fileno(), size)
+            region = memoryview(mapped)
+
+            def close_region():
+                region.release()
+                mapped.close()
+                f.close()
+        half = size // 2
+        down, up = SpscRing(region[:half]), SpscRing(region[half:])
+        down.reset()
+        up.reset()
+
+        def cleanup():
+            down.release()
+            up.release()
+            close_region()
+        return _RingEnd(up, down), _RingEnd(down, up), cleanup
+    raise ValueError(f"Unknown IPC mechanism: {mechanism}")
+
+
+def _child(end, parent_end, size, rtt_count, stream_count):
+    parent_end.close()  # so the parent exiting shows up as EOF here too
+    buf = bytearray(size)
+    for _ in range(rtt_count):
+        end.send(end.recv(buf))
+    cpu = time.process_time()
+    for _ in range(stream_count):
+        end.recv(buf)
+    end.send(_CPU.pack(time.process_time() - cpu))
+    if hasattr(end, 'flush'):
+        end.flush()
+    os._exit(0)  # skip atexit/finalizers of state inherited through fork
+
+
+def measure_mechanism(mechanism, size, rtt_count=None, stream_bytes=64 << 20):
+    """
+    Benchmark one mechanism at one message size.
+
+    Returns:
+        dict: mechanism, size, bandwidth in MB/s, round-trip percentiles in
+        microseconds and CPU microseconds per streamed message (parent and
+        child together).
+    """
+    if size < 1:
+        raise ValueError(f"Message size must be at least 1 byte, got {size}")
+    ctx = mp.get_context('fork')
+    if rtt_count is None:
+        rtt_count = int(min(1000, max(10, (16 << 20) // max(size, 1))))
+    stream_count = int(min(20_000, max(10, stream_bytes // max(size, 1))))
+
+    parent, child_end, cleanup = _make_channel(mechanism, ctx)
+    child = ctx.Process(target=_child, args=(child_end, parent, size, rtt_count, stream_count))
+    try:
+        child.start()
+        # Keep only our own end open, so the child dying reads as EOF instead of blocking
+        child_end.close()
+        if hasattr(parent, 'watch'):
+            parent.watch(child)
+        message = os.urandom(size)
+        buf = bytearray(size)
+        clock = time.perf_counter
+        rtts = np.empty(rtt_count)
+        for i in range(rtt_count):
+            start = clock()
+            parent.send(message)
+            parent.recv(buf)
+            rtts[i] = clock() - start
+
+        cpu = time.process_time()
+        start = clock()
+        for _ in range(stream_count):
+            parent.send(message)
+        ack = parent.recv(bytearray(_CPU.size))
+        elapsed = clock() - start
+        parent_cpu = time.process_time() - cpu
+        child_cpu = _CPU.unpack(bytes(ack))[0]
+        child.join()
+    except (EOFError, ConnectionError) as e:
+        child.join(PEER_POLL)
+        raise RuntimeError(f"{mechanism} benchmark child exited early (exit code {child.exitcode})") from e
+    finally:
+        if child.is_alive():
+            child.kill()
+            child.join()
+        cleanup()
+
+    row = {
+        'mechanism': mechanism,
+        'size': size,
+        'messages': stream_count,
+        'bandwidth_MBps': size * stream_count / elapsed / 1e6,
+    }
+    for p, value in zip(RTT_PERCENTILES, np.percentile(rtts * 1e6, RTT_PERCENTILES)):
+        row[f'rtt_p{p}_us'] = float(value)
+    row['cpu_us_per_message'] = (parent_cpu + child_cpu) / stream_count * 1e6
+    return row
+
+
+def run_ipc_benchmark(mechanisms=MECHANISMS, sizes=SIZES, stream_bytes=64 << 20):
+    """Sweep every mechanism over every message size; returns a list of rows."""
+    return [measure_mechanism(m, s, stream_bytes=stream_bytes) for m in mechanisms for s in sizes]
+
+
+def _message_size(text):
+    size = int(text)
+    if size < 1:
+        raise argparse.ArgumentTypeError(f"message size must be at least 1 byte, got {size}")
+    return size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mechanisms', nargs='+', default=list(MECHANISMS), choices=MECHANISMS)
+    parser.add_argument('--sizes', nargs='+', type=_message_size, default=list(SIZES))
+    parser.add_argument('--stream-mb', type=int, default=64, help='Bytes streamed per measurement (MB)')
+    args = parser.parse_args(argv)
+
+    print(f"{'mechanism':<12} {'size':>9} {'MB/s':>9} {'p50 us':>9} {'p99 us':>9} {'cpu us/msg':>11}")
+    for mechanism in args.mechanisms:
+        for size in args.sizes:
+            row = measure_mechanism(mechanism, size, stream_bytes=args.stream_mb << 20)
+            print(f"{mechanism:<12} {size:>9} {row['bandwidth_MBps']:>9.1f} {row['rtt_p50_us']:>9.1f} "
+                  f"{row['rtt_p99_us']:>9.1f} {row['cpu_us_per_message']:>11.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,36 @@
+import matplotlib.pyplot as plt
+import numpy as np
 import streamlit as st
 from streamlit_autorefresh import st_autorefresh
 from system_monitor import (
     get_system_info, get_cpu_info, get_memory_info,
-    get_disk_info, get_network_info, get_gpu_info
+    get_disk_info, get_network_info, get_gpu_info, PerCoreCollector
 )
-from cpu_scheduler import fcfs_scheduling, priority_scheduling, round_robin_scheduling
+from engine import schedule, simulate_replacement, translate_paging, translate_segment
+from process_trace import replay_trace
 from disk_scheduler import (
     fcfs_disk_scheduling, scan_disk_scheduling, look_disk_scheduling,
     c_scan_disk_scheduling, c_look_disk_scheduling, sstf_disk_scheduling
 )
-from memorymanagmet import fifo,lru,logical_to_physical_paging,optimal,segmentation_translation
-from utils import plot_gantt_chart, plot_disk_chart
+from io_schedulers import compare_io_schedulers, generate_io_workload
+from disk_trace import compare_on_trace, iter_trace as iter_block_trace
+from memorymanagmet import REPLACEMENT_ALGORITHMS
+import proc_sampler
+import profiling
+from segmentation import SegmentTable
+from paging import MultiLevelPageTable, TLB, simulate_address_trace
+from workload import address_trace, allocation_trace, reference_string
+from memory_allocator import ALLOCATORS, make_allocator, replay as replay_allocations
+from trace_table import PAGE_ROWS, SUMMARY_ONLY_STEPS, gantt_columns, page_bounds
+from memory_analysis import lru_fault_curve, fifo_fault_curve, belady_anomalies
+from utils import plot_gantt_chart, plot_disk_chart, plot_fault_curves, plot_core_heatmap
 
-from processmanagment import bankers_algorithm,detect_deadlock,producer_consumer_simulation,readers_writers_simulation
+from bankers import BankersState, bankers_algorithm_np
+from deadlock_graph import ResourceGraph, find_deadlocks, graph_from_matrices
+from sync_engine import BACKENDS as SYNC_BACKENDS, run_producer_consumer
+from rwlock import RW_LOCKS, LATENCY_BINS, contention_benchmark
+from ipc_bench import MECHANISMS as IPC_MECHANISMS, run_ipc_benchmark
+from processmanagment import detect_deadlock,producer_consumer_simulation,readers_writers_simulation
 
 # Page config
 st.set_page_config(page_title="System Health, CPU & Disk Scheduler", layout="wide")
@@ -26,597 +44,1092 @@ page = st.sidebar.selectbox(
     ["System Health Monitor", "CPU Scheduling Simulator", "Disk Scheduling Simulator", "Memory Management", "Process Management"]
 )
 
-# -------------------- System Health Monitor --------------------
-if page == "System Health Monitor":
-    st.title("🔍 System Health Monitor")
-
-    sys_info = get_system_info()
-    cpu_info = get_cpu_info()
-    mem_info = get_memory_info()
-    disk_info = get_disk_info()
-    net_info = get_network_info()
-    gpu_data = get_gpu_info()
-
-    st.subheader("🖥️ System Info")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("System", sys_info.get("system", "N/A"))
-        st.metric("Node Name", sys_info.get("node_name", "N/A"))
-        st.metric("Boot Time", sys_info.get("boot_time", "N/A"))
-    with col2:
-        st.metric("Release", sys_info.get("release", "N/A"))
-        st.metric("Version", sys_info.get("version", "N/A"))
-    with col3:
-        st.metric("Machine", sys_info.get("machine", "N/A"))
-        st.metric("Processor", sys_info.get("processor", "N/A"))
-
-    st.markdown("---")
-
-    st.subheader("⚙️ CPU Info")
-    cpu_col1, cpu_col2, cpu_col3 = st.columns(3)
-    with cpu_col1:
-        st.metric("Physical Cores", cpu_info.get("physical_cores", "N/A"))
-        st.metric("Logical Cores", cpu_info.get("logical_cores", "N/A"))
-        st.metric("CPU Usage (%)", cpu_info.get("cpu_usage_percent", 0))
-    with cpu_col2:
-        st.metric("Max Frequency (MHz)", cpu_info.get("max_frequency", 0))
-        st.metric("Min Frequency (MHz)", cpu_info.get("min_frequency", 0))
-    with cpu_col3:
-        st.metric("Current Frequency (MHz)", cpu_info.get("current_frequency", 0))
-
-    st.markdown("---")
-
-    st.subheader("💾 Memory Info")
-    mem_total_gb = mem_info.get("total", 0) / (1024 ** 3)
-    mem_used_gb = mem_info.get("used", 0) / (1024 ** 3)
-    mem_available_gb = mem_info.get("available", 0) / (1024 ** 3)
-    st.write(f"**Total Memory:** {mem_total_gb:.2f} GB")
-    st.write(f"**Used Memory:** {mem_used_gb:.2f} GB")
-    st.write(f"**Available Memory:** {mem_available_gb:.2f} GB")
-    st.progress(mem_info.get("percent", 0) / 100)
-
-    swap_total = mem_info.get("swap_total", 0) / (1024 ** 3)
-    swap_used = mem_info.get("swap_used", 0) / (1024 ** 3)
-    st.write(f"**Swap Memory Used:** {swap_used:.2f} GB / {swap_total:.2f} GB")
-    st.progress(mem_info.get("swap_percent", 0) / 100)
-
-    st.markdown("---")
-
-    st.subheader("🗃️ Disk Info")
-    for disk in disk_info:
-        st.markdown(f"**{disk['device']}** mounted on {disk['mountpoint']} ({disk['fstype']})")
-        st.progress(disk.get("usage_percent", 0) / 100)
-        used = disk.get("used", 0) / (1024 ** 3)
-        total = disk.get("total", 0) / (1024 ** 3)
-        st.write(f"Used: {used:.2f} GB / Total: {total:.2f} GB")
-
-    st.markdown("---")
-
-    st.subheader("🌐 Network Info")
-    net_col1, net_col2 = st.columns(2)
-    with net_col1:
-        st.metric("Bytes Sent (MB)", f"{net_info.get('bytes_sent', 0) / (1024**2):.2f}")
-        st.metric("Packets Sent", net_info.get("packets_sent", 0))
-    with net_col2:
-        st.metric("Bytes Received (MB)", f"{net_info.get('bytes_recv', 0) / (1024**2):.2f}")
-        st.metric("Packets Received", net_info.get("packets_recv", 0))
-
-    st.markdown("---")
-
-    st.subheader("🧠 GPU Info")
-    if gpu_data:
-        for idx, gpu in enumerate(gpu_data):
-            st.markdown(f"**GPU {idx + 1}: {gpu['Name']}**")
-            st.metric("Load (%)", gpu["Load (%)"])
-            st.metric("Temperature (°C)", gpu["Temperature (°C)"])
-            st.metric("Memory Used / Total (MB)", f"{gpu['Memory Used (MB)']} / {gpu['Memory Total (MB)']}")
-    else:
-        st.info("No GPU detected.")
-
-# -------------------- CPU Scheduling --------------------
-elif page == "CPU Scheduling Simulator":
-    st.title("🧠 CPU Scheduling Simulator")
-
-    algorithm = st.selectbox("Choose Scheduling Algorithm", ["FCFS", "Round Robin", "Priority (Non-preemptive)"])
-    num = st.number_input("Number of Processes", min_value=1, max_value=10, value=3)
-
-    processes = []
-    for i in range(num):
-        st.markdown(f"### Process P{i+1}")
-        arrival = st.number_input(f"Arrival Time (P{i+1})", key=f"arrival_{i}", min_value=0)
-        burst = st.number_input(f"Burst Time (P{i+1})", key=f"burst_{i}", min_value=1)
-        priority = None
-        if algorithm == "Priority (Non-preemptive)":
-            priority = st.number_input(f"Priority (lower = higher) (P{i+1})", key=f"priority_{i}", min_value=1)
-        proc = {'pid': f'P{i+1}', 'arrival_time': arrival, 'burst_time': burst}
-        if priority is not None:
-            proc['priority'] = priority
-        processes.append(proc)
-
-    time_quantum = None
-    if algorithm == "Round Robin":
-        time_quantum = st.number_input("Time Quantum", min_value=1, value=2)
-
-    if st.button("Run Scheduling"):
-        if algorithm == "FCFS":
-            gantt, waiting, turnaround = fcfs_scheduling(processes)
-        elif algorithm == "Round Robin":
-            gantt, waiting, turnaround = round_robin_scheduling(processes, time_quantum)
-        elif algorithm == "Priority (Non-preemptive)":
-            gantt, waiting, turnaround = priority_scheduling(processes)
+# Debug panel: opt-in render phase timing and a one-shot profile of the next rerun
+with st.sidebar.expander("🛠️ Render Profiling"):
+    time_phases = st.checkbox("Time Render Phases", key="time_render_phases")
+    profile_choice = st.selectbox("Profiler", profiling.PROFILE_MODES)
+    arm_profile = st.button("Profile Next Rerun")
+    profile_panel = st.empty()
+if arm_profile:
+    st.session_state.profile_armed = profile_choice
+    profile_mode = None
+else:
+    profile_mode = st.session_state.pop("profile_armed", None)
+prof = profiling.Profiler(time_phases, profile_mode).start()
+
+
+def finish_render():
+    """Close the render profile and show it in the debug panel (safe to call twice)."""
+    report = prof.finish()
+    if report is not None:
+        st.session_state.last_render_profile = report
+    last = st.session_state.get("last_render_profile")
+    if last is None or not (time_phases or last["profile"]):
+        return
+    import pandas as pd
+    with profile_panel.container():
+        st.caption(f"Last instrumented render: {last['total_ms']:.1f} ms")
+        st.dataframe(pd.DataFrame(last["phases"]).round(2), use_container_width=True, hide_index=True)
+        if last["profile"]:
+            st.caption(f"{last['profile_mode']} profile (top functions by cumulative time)")
+            st.dataframe(pd.DataFrame(last["profile"]).round(4), use_container_width=True, hide_index=True)
+
+
+def stop_render():
+    finish_render()
+    st.stop()
+
+
+try:
+    # -------------------- System Health Monitor --------------------
+    if page == "System Health Monitor":
+        st.title("🔍 System Health Monitor")
+
+        live_cores = st.checkbox("Live Per-Core View (1 Hz)", key="live_cores")
+        if live_cores:
+            st_autorefresh(interval=1000, key="per_core_refresh")
+
+        with prof.phase("collection"):
+            sys_info = get_system_info()
+            # The blocking 1 s aggregate sample would stall a 1 Hz refresh
+            cpu_info = get_cpu_info(interval=None if live_cores else 1)
+            mem_info = get_memory_info()
+            disk_info = get_disk_info()
+            net_info = get_network_info()
+            gpu_data = get_gpu_info()
+
+        st.subheader("🖥️ System Info")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("System", sys_info.get("system", "N/A"))
+            st.metric("Node Name", sys_info.get("node_name", "N/A"))
+            st.metric("Boot Time", sys_info.get("boot_time", "N/A"))
+        with col2:
+            st.metric("Release", sys_info.get("release", "N/A"))
+            st.metric("Version", sys_info.get("version", "N/A"))
+        with col3:
+            st.metric("Machine", sys_info.get("machine", "N/A"))
+            st.metric("Processor", sys_info.get("processor", "N/A"))
+
+        st.markdown("---")
+
+        st.subheader("⚙️ CPU Info")
+        cpu_col1, cpu_col2, cpu_col3 = st.columns(3)
+        with cpu_col1:
+            st.metric("Physical Cores", cpu_info.get("physical_cores", "N/A"))
+            st.metric("Logical Cores", cpu_info.get("logical_cores", "N/A"))
+            st.metric("CPU Usage (%)", cpu_info.get("cpu_usage_percent", 0))
+        with cpu_col2:
+            st.metric("Max Frequency (MHz)", cpu_info.get("max_frequency", 0))
+            st.metric("Min Frequency (MHz)", cpu_info.get("min_frequency", 0))
+        with cpu_col3:
+            st.metric("Current Frequency (MHz)", cpu_info.get("current_frequency", 0))
+
+        st.markdown("---")
+
+        st.subheader("🔥 Per-Core CPU")
+        # The collector keeps the previous cpu_times and the history matrices across reruns
+        if "core_collector" not in st.session_state:
+            st.session_state.core_collector = PerCoreCollector()
+        collector = st.session_state.core_collector
+        with prof.phase("collection"):
+            latest = collector.sample()
+
+        core_col1, core_col2, core_col3 = st.columns(3)
+        with core_col1:
+            busiest = int(np.nanargmax(latest["usage"]))
+            st.metric("Busiest Core", f"CPU {busiest}", f"{latest['usage'][busiest]:.0f}% busy", delta_color="off")
+        with core_col2:
+            if np.isnan(latest["temperature"]).all():
+                st.metric("Hottest Core", "N/A")
+            else:
+                hottest = int(np.nanargmax(latest["temperature"]))
+                st.metric("Hottest Core", f"CPU {hottest}", f"{latest['temperature'][hottest]:.0f} °C", delta_color="off")
+        with core_col3:
+            if np.isnan(latest["frequency"]).all():
+                st.metric("Slowest Core", "N/A")
+            else:
+                slowest = int(np.nanargmin(latest["frequency"]))
+                st.metric("Slowest Core", f"CPU {slowest}", f"{latest['frequency'][slowest]:.0f} MHz", delta_color="off")
+
+        heatmap_metric = st.radio("Heatmap", ["Utilisation", "I/O Wait", "Frequency", "Temperature"], horizontal=True)
+        metric_key, unit, limits = {
+            "Utilisation": ("usage", "%", (0, 100)),
+            "I/O Wait": ("iowait", "%", (0, 100)),
+            "Frequency": ("frequency", "MHz", (None, None)),
+            "Temperature": ("temperature", "°C", (None, None)),
+        }[heatmap_metric]
+        matrix, times = collector.matrix(metric_key)
+        if collector.count < 2 and metric_key in ("usage", "iowait"):
+            st.info("Collecting: utilisation needs two samples.")
+        elif np.isnan(matrix).all():
+            st.info(f"{heatmap_metric} is not reported on this host.")
         else:
-            st.error("Invalid algorithm selected.")
-            st.stop()
-
-        st.subheader("📊 Gantt Chart (Text)")
-        for entry in gantt:
-            st.text(f"{entry['pid']} | Start: {entry['start']} | End: {entry['end']}")
-
-        st.subheader("📉 Gantt Chart")
-        fig = plot_gantt_chart(gantt)
-        st.pyplot(fig)
-
-        st.subheader("⏱️ Waiting Times")
-        st.json(waiting)
-
-        st.subheader("🔁 Turnaround Times")
-        st.json(turnaround)
-
-# -------------------- Disk Scheduling --------------------
-elif page == "Disk Scheduling Simulator":
-    st.title("💽 Disk Scheduling Simulator")
-
-    algorithm = st.selectbox("Choose Disk Scheduling Algorithm", ["FCFS", "SSTF", "SCAN", "LOOK", "C-SCAN", "C-LOOK"])
-    requests = st.text_input("Enter Disk Requests (comma-separated)", "55, 58, 60, 70, 18, 90, 150, 160, 184")
-    head_start = st.number_input("Initial Head Position", min_value=0, value=50)
-    disk_size = st.number_input("Disk Size (Optional for SCAN/C-SCAN)", value=200)
-    direction = None
-
-    if algorithm in ["SCAN", "C-SCAN", "LOOK", "C-LOOK"]:
-        direction = st.radio("Head Movement Direction", ["left", "right"])
-
-    if st.button("Run Disk Scheduling"):
-        reqs = list(map(int, requests.split(',')))
-
-        if algorithm == "FCFS":
-            sequence, total = fcfs_disk_scheduling(reqs, head_start)
-        elif algorithm == "SSTF":
-            sequence, total = sstf_disk_scheduling(reqs, head_start)
-        elif algorithm == "SCAN":
-            sequence, total = scan_disk_scheduling(reqs, head_start,direction)
-        elif algorithm == "LOOK":
-            sequence, total = look_disk_scheduling(reqs, head_start, direction)
-        elif algorithm == "C-SCAN":
-            sequence, total = c_scan_disk_scheduling(reqs, head_start)
-        elif algorithm == "C-LOOK":
-            sequence, total = c_look_disk_scheduling(reqs, head_start)
+            with prof.phase("plot"):
+                fig = plot_core_heatmap(matrix, times, f"{heatmap_metric} per Core", unit, *limits)
+                st.pyplot(fig)
+                plt.close(fig)
+        st.caption(f"{collector.cores} logical cores, last {len(times)} samples. Turn on the live view to sample every second.")
+
+        st.markdown("---")
+
+        st.subheader("💾 Memory Info")
+        mem_total_gb = mem_info.get("total", 0) / (1024 ** 3)
+        mem_used_gb = mem_info.get("used", 0) / (1024 ** 3)
+        mem_available_gb = mem_info.get("available", 0) / (1024 ** 3)
+        st.write(f"**Total Memory:** {mem_total_gb:.2f} GB")
+        st.write(f"**Used Memory:** {mem_used_gb:.2f} GB")
+        st.write(f"**Available Memory:** {mem_available_gb:.2f} GB")
+        st.progress(mem_info.get("percent", 0) / 100)
+
+        swap_total = mem_info.get("swap_total", 0) / (1024 ** 3)
+        swap_used = mem_info.get("swap_used", 0) / (1024 ** 3)
+        st.write(f"**Swap Memory Used:** {swap_used:.2f} GB / {swap_total:.2f} GB")
+        st.progress(mem_info.get("swap_percent", 0) / 100)
+
+        st.markdown("---")
+
+        st.subheader("🧬 Process Memory Behaviour")
+        if not proc_sampler.available():
+            st.info("Per-process fault sampling needs Linux /proc.")
         else:
-            st.error("Invalid algorithm selected.")
-            st.stop()
-
-        st.subheader("📄 Seek Sequence")
-        st.write(" ➜ ".join(map(str, sequence)))
-
-        st.subheader("📏 Total Seek Distance")
-        st.metric("Total Seek", total)
-
-        st.subheader("📊 Disk Head Movement Chart")
-        fig = plot_disk_chart(sequence)
-        st.pyplot(fig)
-
-# -------------------- Memory Management --------------------
-elif page == "Memory Management":
-    st.title("🧮 Memory Management Simulator")
-    
-    memory_option = st.selectbox(
-        "Choose Memory Management Technique",
-        ["Address Translation", "Page Replacement Algorithms"]
-    )
-    
-    if memory_option == "Address Translation":
-        st.subheader("🔄 Address Translation")
-        
-        translation_type = st.radio("Select Translation Type", ["Paging", "Segmentation"])
-        
-        if translation_type == "Paging":
-            st.markdown("### Paging Address Translation")
-            col1, col2 = st.columns(2)
-            
+            # The sampler keeps a capped set of /proc file handles open across
+            # reruns; they are closed when the session (and the sampler) is dropped
+            if "proc_sampler" not in st.session_state:
+                st.session_state.proc_sampler = proc_sampler.ProcSampler()
+            sampler = st.session_state.proc_sampler
+            with prof.phase("collection"):
+                sample = sampler.sample()
+                if sample["interval"] is None:
+                    sample = sampler.sample()  # first sample only sets the counters
+            with prof.phase("compute"):
+                minor_rate, major_rate = proc_sampler.fault_rates(sample)
+
+            vm_col1, vm_col2, vm_col3 = st.columns(3)
+            with vm_col1:
+                st.metric("Page Faults / s", f"{sample['vmstat'].get('pgfault', 0) / sample['interval']:.0f}")
+            with vm_col2:
+                st.metric("Major Faults / s", f"{sample['vmstat'].get('pgmajfault', 0) / sample['interval']:.0f}")
+            with vm_col3:
+                st.metric("Swap In / Out (pages)", f"{sample['vmstat'].get('pswpin', 0)} / {sample['vmstat'].get('pswpout', 0)}")
+
+            import pandas as pd
+            records = sample["processes"]
+            top = st.slider("Processes Shown", min_value=5, max_value=100, value=15)
+            with prof.phase("table"):
+                frame = pd.DataFrame({
+                    "PID": records["pid"],
+                    "Name": [sampler.names.get(pid, "?") for pid in records["pid"].tolist()],
+                    "RSS (MB)": records["rss_kb"] / 1024,
+                    "Working Set (MB)": np.where(records["working_set_kb"] >= 0, records["working_set_kb"] / 1024, np.nan),
+                    "Minor Faults / s": minor_rate,
+                    "Major Faults / s": major_rate,
+                }).sort_values(["Major Faults / s", "Minor Faults / s", "RSS (MB)"], ascending=False).head(top)
+            st.dataframe(frame.round(2), use_container_width=True, hide_index=True)
+            st.caption(f"{len(records)} processes sampled; {len(sampler.history)} samples kept. "
+                       "Working sets need read access to smaps_rollup.")
+
+            with st.expander("Export Samples as a Page Reference Workload"):
+                max_refs = st.number_input("Maximum References", min_value=100, max_value=1_000_000, value=100_000, step=1000)
+                export_frames = st.number_input("Frames", min_value=1, max_value=1_000_000, value=256)
+                if st.button("Build Reference String"):
+                    refs = proc_sampler.to_reference_string(sampler.history, int(max_refs))
+                    if not refs:
+                        st.warning("No faults were recorded yet.")
+                    else:
+                        comparison = {}
+                        for name in ("FIFO", "LRU", "Optimal"):
+                            faults, _ = REPLACEMENT_ALGORITHMS[name](refs, int(export_frames), trace=False)
+                            comparison[name] = faults
+                        st.dataframe(pd.DataFrame([comparison], index=["Page Faults"]), use_container_width=True)
+                        st.download_button("Download Reference String", ",".join(map(str, refs)), file_name="reference_string.txt")
+
+        st.markdown("---")
+
+        st.subheader("🗃️ Disk Info")
+        for disk in disk_info:
+            st.markdown(f"**{disk['device']}** mounted on {disk['mountpoint']} ({disk['fstype']})")
+            st.progress(disk.get("usage_percent", 0) / 100)
+            used = disk.get("used", 0) / (1024 ** 3)
+            total = disk.get("total", 0) / (1024 ** 3)
+            st.write(f"Used: {used:.2f} GB / Total: {total:.2f} GB")
+
+        st.markdown("---")
+
+        st.subheader("🌐 Network Info")
+        net_col1, net_col2 = st.columns(2)
+        with net_col1:
+            st.metric("Bytes Sent (MB)", f"{net_info.get('bytes_sent', 0) / (1024**2):.2f}")
+            st.metric("Packets Sent", net_info.get("packets_sent", 0))
+        with net_col2:
+            st.metric("Bytes Received (MB)", f"{net_info.get('bytes_recv', 0) / (1024**2):.2f}")
+            st.metric("Packets Received", net_info.get("packets_recv", 0))
+
+        st.markdown("---")
+
+        st.subheader("🧠 GPU Info")
+        if gpu_data:
+            for idx, gpu in enumerate(gpu_data):
+                st.markdown(f"**GPU {idx + 1}: {gpu['Name']}**")
+                st.metric("Load (%)", gpu["Load (%)"])
+                st.metric("Temperature (°C)", gpu["Temperature (°C)"])
+                st.metric("Memory Used / Total (MB)", f"{gpu['Memory Used (MB)']} / {gpu['Memory Total (MB)']}")
+        else:
+            st.info("No GPU detected.")
+
+    # -------------------- CPU Scheduling --------------------
+    elif page == "CPU Scheduling Simulator":
+        st.title("🧠 CPU Scheduling Simulator")
+
+        source = st.radio("Workload Source", ["Manual Input", "Replay Captured Trace"], horizontal=True)
+
+        if source == "Replay Captured Trace":
+            st.info("Capture a trace with `python process_trace.py capture FILE`, then replay it through each scheduler.")
+            trace_path = st.text_input("Trace File", "trace.ptrace")
+            tick = st.number_input("Seconds per Time Unit", min_value=0.0001, value=0.01, format="%.4f")
+            trace_quantum = st.number_input("Time Quantum (Round Robin)", min_value=1, value=10)
+
+            if st.button("Replay Trace"):
+                import pandas as pd
+                try:
+                    summaries = [replay_trace(trace_path, alg, trace_quantum, tick) for alg in ["fcfs", "round_robin", "priority"]]
+                except (OSError, ValueError) as e:
+                    st.error(f"❌ Could not read trace: {e}")
+                    stop_render()
+                st.subheader("📊 Replay Summary")
+                st.dataframe(pd.DataFrame(summaries).set_index("algorithm"), use_container_width=True)
+            stop_render()
+
+        algorithm = st.selectbox("Choose Scheduling Algorithm", ["FCFS", "Round Robin", "Priority (Non-preemptive)"])
+        num = st.number_input("Number of Processes", min_value=1, max_value=10, value=3)
+
+        processes = []
+        for i in range(num):
+            st.markdown(f"### Process P{i+1}")
+            arrival = st.number_input(f"Arrival Time (P{i+1})", key=f"arrival_{i}", min_value=0)
+            burst = st.number_input(f"Burst Time (P{i+1})", key=f"burst_{i}", min_value=1)
+            priority = None
+            if algorithm == "Priority (Non-preemptive)":
+                priority = st.number_input(f"Priority (lower = higher) (P{i+1})", key=f"priority_{i}", min_value=1)
+            proc = {'pid': f'P{i+1}', 'arrival_time': arrival, 'burst_time': burst}
+            if priority is not None:
+                proc['priority'] = priority
+            processes.append(proc)
+
+        time_quantum = None
+        if algorithm == "Round Robin":
+            time_quantum = st.number_input("Time Quantum", min_value=1, value=2)
+
+        if st.button("Run Scheduling"):
+            try:
+                with prof.phase("compute"):
+                    gantt, waiting, turnaround = schedule(algorithm, processes, time_quantum).as_tuple()
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                stop_render()
+
+            st.subheader("📊 Gantt Chart (Table)")
+            import pandas as pd
+            with prof.phase("table"):
+                gantt_table = pd.DataFrame(gantt_columns(gantt))
+            st.dataframe(gantt_table, use_container_width=True, hide_index=True)
+
+            st.subheader("📉 Gantt Chart")
+            with prof.phase("plot"):
+                fig = plot_gantt_chart(gantt)
+                st.pyplot(fig)
+
+            st.subheader("⏱️ Waiting Times")
+            st.json(waiting)
+
+            st.subheader("🔁 Turnaround Times")
+            st.json(turnaround)
+
+    # -------------------- Disk Scheduling --------------------
+    elif page == "Disk Scheduling Simulator":
+        st.title("💽 Disk Scheduling Simulator")
+
+        mode = st.radio("Mode", ["Static Batch", "Online (Arrival-Timed)", "Block Trace Comparison"], horizontal=True)
+
+        if mode == "Static Batch":
+            algorithm = st.selectbox("Choose Disk Scheduling Algorithm", ["FCFS", "SSTF", "SCAN", "LOOK", "C-SCAN", "C-LOOK"])
+            requests = st.text_input("Enter Disk Requests (comma-separated)", "55, 58, 60, 70, 18, 90, 150, 160, 184")
+            head_start = st.number_input("Initial Head Position", min_value=0, value=50)
+            disk_size = st.number_input("Disk Size (Cylinders)", min_value=1, value=200)
+            direction = None
+
+            if algorithm in ["SCAN", "C-SCAN", "LOOK", "C-LOOK"]:
+                direction = st.radio("Head Movement Direction", ["left", "right"])
+
+            if st.button("Run Disk Scheduling"):
+                reqs = list(map(int, requests.split(',')))
+
+                with prof.phase("compute"):
+                    try:
+                        if algorithm == "FCFS":
+                            sequence, total = fcfs_disk_scheduling(reqs, head_start, disk_size)
+                        elif algorithm == "SSTF":
+                            sequence, total = sstf_disk_scheduling(reqs, head_start, disk_size)
+                        elif algorithm == "SCAN":
+                            sequence, total = scan_disk_scheduling(reqs, head_start, direction, disk_size)
+                        elif algorithm == "LOOK":
+                            sequence, total = look_disk_scheduling(reqs, head_start, direction, disk_size)
+                        elif algorithm == "C-SCAN":
+                            sequence, total = c_scan_disk_scheduling(reqs, head_start, disk_size)
+                        elif algorithm == "C-LOOK":
+                            sequence, total = c_look_disk_scheduling(reqs, head_start, disk_size)
+                        else:
+                            st.error("Invalid algorithm selected.")
+                            stop_render()
+                    except ValueError as e:
+                        st.error(f"❌ {e}")
+                        stop_render()
+
+                st.subheader("📄 Seek Sequence")
+                st.write(" ➜ ".join(map(str, sequence)))
+
+                st.subheader("📏 Total Seek Distance")
+                st.metric("Total Seek", total)
+
+                st.subheader("📊 Disk Head Movement Chart")
+                with prof.phase("plot"):
+                    fig = plot_disk_chart(sequence)
+                    st.pyplot(fig)
+
+        elif mode == "Online (Arrival-Timed)":
+            st.info("Requests arrive as a Poisson stream and are served from a dynamic queue; compare the seek algorithms and the Linux none / mq-deadline / bfq schedulers under sustained load.")
+            col1, col2, col3 = st.columns(3)
             with col1:
-                logical_addr = st.number_input("Logical Address", min_value=0, value=1024)
-                page_size = st.number_input("Page Size", min_value=1, value=512)
-            
+                num_requests = st.number_input("Number of Requests", min_value=10, max_value=1_000_000, value=10_000)
+                arrival_rate = st.number_input("Arrival Rate (requests / time unit)", min_value=0.001, value=0.05, format="%.3f")
             with col2:
-                base_addr = st.number_input("Base Address", min_value=0, value=2048)
-            
-            if st.button("Calculate Physical Address"):
-                physical_addr, page_num, offset = logical_to_physical_paging(logical_addr, page_size, base_addr)
-                
-                st.success("✅ Translation Results:")
-                col1, col2, col3 = st.columns(3)
+                disk_size = st.number_input("Disk Size (Cylinders)", min_value=1, value=5000)
+                head_start = st.number_input("Initial Head Position", min_value=0, value=0)
+            with col3:
+                seek_time = st.number_input("Seek Time per Cylinder", min_value=0.0, value=0.001, format="%.4f")
+                service_time = st.number_input("Service Time per Request", min_value=0.0, value=5.0)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                write_fraction = st.slider("Write Fraction", 0.0, 1.0, 0.3)
+            with col2:
+                num_io_processes = st.number_input("Issuing Processes", min_value=1, max_value=64, value=4)
+            with col3:
+                seed = st.number_input("Seed", min_value=0, value=0)
+
+            if st.button("Run Online Simulation"):
+                import pandas as pd
+                with prof.phase("compute"):
+                    workload = generate_io_workload(num_requests, arrival_rate, disk_size, write_fraction, num_io_processes, seed)
+                    rows = compare_io_schedulers(workload, min(head_start, disk_size - 1), disk_size, seek_time, service_time)
+                st.subheader("⏱️ Response Time Percentiles")
+                st.dataframe(pd.DataFrame(rows).set_index("Algorithm"), use_container_width=True)
+
+        else:  # Block Trace Comparison
+            st.info("Reads a blkparse text trace or a compact binary trace chunk by chunk and runs all six algorithms in one pass.")
+            trace_path = st.text_input("Trace File", "trace.blk")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                disk_size = st.number_input("Disk Size (Cylinders)", min_value=1, value=200)
+            with col2:
+                sectors_per_cylinder = st.number_input("Sectors per Cylinder", min_value=1, value=2048)
+            with col3:
+                window = st.number_input("Queue Depth (Window)", min_value=1, value=64)
+
+            if st.button("Compare on Trace"):
+                import pandas as pd
+                try:
+                    comparison = compare_on_trace(iter_block_trace(trace_path), 0, disk_size, sectors_per_cylinder, window)
+                except (OSError, ValueError) as e:
+                    st.error(f"❌ Could not read trace: {e}")
+                    stop_render()
+                st.dataframe(pd.DataFrame(comparison).T, use_container_width=True)
+
+    # -------------------- Memory Management --------------------
+    elif page == "Memory Management":
+        st.title("🧮 Memory Management Simulator")
+
+        memory_option = st.selectbox(
+            "Choose Memory Management Technique",
+            ["Address Translation", "Page Replacement Algorithms", "Fault Curves", "Contiguous Allocation"]
+        )
+
+        if memory_option == "Address Translation":
+            st.subheader("🔄 Address Translation")
+
+            translation_type = st.radio("Select Translation Type", ["Paging", "Segmentation", "Address Trace (TLB)"])
+
+            if translation_type == "Paging":
+                st.markdown("### Paging Address Translation")
+                col1, col2 = st.columns(2)
+
                 with col1:
-                    st.metric("Page Number", page_num)
+                    logical_addr = st.number_input("Logical Address", min_value=0, value=1024)
+                    page_size = st.number_input("Page Size", min_value=1, value=512)
+
                 with col2:
-                    st.metric("Offset", offset)
-                with col3:
-                    st.metric("Physical Address", physical_addr)
-                
-                st.info(f"**Formula:** Physical Address = Base Address + (Page Number × Page Size) + Offset")
-                st.info(f"**Calculation:** {physical_addr} = {base_addr} + ({page_num} × {page_size}) + {offset}")
-        
-        else:  # Segmentation
-            st.markdown("### Segmentation Address Translation")
-            
-            # Define segments
-            st.markdown("#### Define Segments")
-            num_segments = st.number_input("Number of Segments", min_value=1, max_value=5, value=3)
-            
-            segments = {}
-            for i in range(num_segments):
+                    base_addr = st.number_input("Base Address", min_value=0, value=2048)
+
+                if st.button("Calculate Physical Address"):
+                    physical_addr, page_num, offset = translate_paging(logical_addr, page_size, base_addr).as_tuple()
+
+                    st.success("✅ Translation Results:")
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Page Number", page_num)
+                    with col2:
+                        st.metric("Offset", offset)
+                    with col3:
+                        st.metric("Physical Address", physical_addr)
+
+                    st.info(f"**Formula:** Physical Address = Base Address + (Page Number × Page Size) + Offset")
+                    st.info(f"**Calculation:** {physical_addr} = {base_addr} + ({page_num} × {page_size}) + {offset}")
+
+            elif translation_type == "Address Trace (TLB)":
+                st.markdown("### Multi-Level Page Table and TLB")
+                st.info("Translates a synthetic virtual address trace in bulk and simulates a set-associative TLB in front of a multi-level page table.")
+
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    seg_name = st.text_input(f"Segment {i+1} Name", value=f"seg{i+1}", key=f"seg_name_{i}")
+                    num_addresses = st.number_input("Trace Length", min_value=1_000, max_value=50_000_000, value=1_000_000)
+                    working_pages = st.number_input("Pages Touched", min_value=1, value=50_000)
                 with col2:
-                    base = st.number_input(f"Base Address", min_value=0, value=1000*i, key=f"base_{i}")
+                    level_bits_input = st.text_input("Bits per Level (comma-separated)", "9, 9, 9, 9")
+                    offset_bits = st.number_input("Offset Bits", min_value=1, max_value=30, value=12)
                 with col3:
-                    limit = st.number_input(f"Limit", min_value=1, value=500, key=f"limit_{i}")
-                
-                segments[seg_name] = (base, limit)
-            
-            st.markdown("#### Translate Address")
+                    tlb_entries = st.number_input("TLB Entries", min_value=1, value=64)
+                    tlb_ways = st.number_input("TLB Ways", min_value=1, value=4)
+                memory_time = st.number_input("Memory Access Time (ns)", min_value=0.0, value=100.0)
+
+                if st.button("Simulate Address Trace"):
+                    try:
+                        level_bits = [int(b) for b in level_bits_input.split(',')]
+                        page_table = MultiLevelPageTable(level_bits, offset_bits)
+                        if working_pages > 1 << page_table.vpn_bits:
+                            raise ValueError(f"{working_pages:,} pages do not fit in a {page_table.vpn_bits}-bit virtual page number")
+                        tlb = TLB(tlb_entries, tlb_ways)
+                    except ValueError as e:
+                        st.error(f"❌ {e}")
+                        stop_render()
+
+                    with prof.phase("compute"):
+                        addresses = address_trace(num_addresses, page_table.page_size, working_pages)
+                        vpns = np.unique(addresses >> offset_bits)
+                        page_table.map(vpns, np.arange(len(vpns)))
+                        stats = simulate_address_trace(addresses, page_table, tlb, memory_time)
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("TLB Hit Rate", f"{stats['tlb_hit_rate'] * 100:.2f}%")
+                    with col2:
+                        st.metric("Page Walks", f"{stats['page_walks']:,}")
+                    with col3:
+                        st.metric("Effective Access Time (ns)", f"{stats['effective_access_time']:.1f}")
+                    st.write(f"**Page-table pages per level:** {page_table.table_pages()}")
+                    st.json(stats)
+
+            else:  # Segmentation
+                st.markdown("### Segmentation Address Translation")
+
+                # Define segments
+                st.markdown("#### Define Segments")
+                num_segments = st.number_input("Number of Segments", min_value=1, max_value=5, value=3)
+
+                segments = {}
+                for i in range(num_segments):
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        seg_name = st.text_input(f"Segment {i+1} Name", value=f"seg{i+1}", key=f"seg_name_{i}")
+                    with col2:
+                        base = st.number_input(f"Base Address", min_value=0, value=1000*i, key=f"base_{i}")
+                    with col3:
+                        limit = st.number_input(f"Limit", min_value=1, value=500, key=f"limit_{i}")
+
+                    segments[seg_name] = (base, limit)
+
+                st.markdown("#### Translate Address")
+                col1, col2 = st.columns(2)
+                with col1:
+                    selected_segment = st.selectbox("Select Segment", list(segments.keys()))
+                with col2:
+                    offset = st.number_input("Offset", min_value=0, value=100)
+
+                if st.button("Translate Segmented Address"):
+                    result = translate_segment(segments, selected_segment, offset)
+
+                    if result.valid:
+                        st.success(f"✅ Physical Address: {result.physical_address}")
+                        st.info(f"**Calculation:** {result.physical_address} = {result.base} (base) + {offset} (offset)")
+                    else:
+                        st.error("❌ Invalid offset! Offset exceeds segment limit.")
+
+                    # Display segment table
+                    st.markdown("#### Segment Table")
+                    import pandas as pd
+                    table = SegmentTable(segments)
+                    st.dataframe(pd.DataFrame({"Segment": table.names, "Base": table.bases,
+                                               "Limit": table.limits, "End": table.bases + table.limits}))
+                    for name, other in table.overlaps():
+                        st.warning(f"⚠️ Segment {name} overlaps segment {other}.")
+
+        elif memory_option == "Fault Curves":
+            st.subheader("📉 Page Faults vs. Frame Count")
+            st.info("LRU faults for every frame count come from one stack-distance pass; FIFO is simulated per frame count in parallel and checked for Belady's anomaly.")
+
             col1, col2 = st.columns(2)
             with col1:
-                selected_segment = st.selectbox("Select Segment", list(segments.keys()))
+                curve_sequence = st.text_input("Page Reference Sequence (comma-separated)", "1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5", key="curve_sequence")
             with col2:
-                offset = st.number_input("Offset", min_value=0, value=100)
-            
-            if st.button("Translate Segmented Address"):
-                result = segmentation_translation(segments, selected_segment, offset)
-                
-                if result is not None:
-                    st.success(f"✅ Physical Address: {result}")
-                    base, limit = segments[selected_segment]
-                    st.info(f"**Calculation:** {result} = {base} (base) + {offset} (offset)")
+                max_frames = st.number_input("Maximum Frames", min_value=1, max_value=10_000, value=7)
+
+            if st.button("Compute Fault Curves"):
+                try:
+                    pages = list(map(int, curve_sequence.split(',')))
+                except ValueError:
+                    st.error("❌ Please enter valid comma-separated integers for the page sequence.")
+                    stop_render()
+
+                with prof.phase("compute"):
+                    frame_counts = list(range(1, max_frames + 1))
+                    lru_curve = lru_fault_curve(pages, max_frames)
+                    # Worker processes only pay off on long reference strings
+                    fifo_curve = fifo_fault_curve(pages, frame_counts, workers=None if len(pages) * max_frames > 1_000_000 else 1)
+                    anomalies = belady_anomalies(frame_counts, fifo_curve)
+
+                with prof.phase("plot"):
+                    st.pyplot(plot_fault_curves(frame_counts, {"FIFO": fifo_curve, "LRU": lru_curve}, anomalies))
+                if anomalies:
+                    for frames, faults, more_frames, more_faults in anomalies:
+                        st.warning(f"⚠️ Belady's anomaly: FIFO has {faults} faults with {frames} frames but {more_faults} with {more_frames}.")
                 else:
-                    st.error("❌ Invalid offset! Offset exceeds segment limit.")
-                
-                # Display segment table
-                st.markdown("#### Segment Table")
+                    st.success("✅ No Belady's anomaly for FIFO on this reference string.")
+
+        elif memory_option == "Contiguous Allocation":
+            st.subheader("🧱 Contiguous Allocation")
+            st.info("Replays a synthetic alloc/free trace against each allocator and reports fragmentation and cost per operation. Sizes are in allocation units.")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                num_ops = st.number_input("Operations", min_value=1_000, max_value=5_000_000, value=200_000, step=10_000)
+                live_target = st.number_input("Target Live Objects", min_value=10, max_value=1_000_000, value=10_000)
+                mean_size = st.number_input("Mean Object Size", min_value=1.0, max_value=1024.0, value=8.0)
+            with col2:
+                memory_order = st.slider("Memory Size (2^k units)", min_value=12, max_value=24, value=20)
+                alloc_seed = st.number_input("Seed", min_value=0, value=0, key="alloc_seed")
+                chosen = st.multiselect("Allocators", list(ALLOCATORS), default=list(ALLOCATORS))
+
+            if st.button("Replay Allocation Trace"):
                 import pandas as pd
-                seg_data = []
-                for name, (base, limit) in segments.items():
-                    seg_data.append({"Segment": name, "Base": base, "Limit": limit, "Size": limit - base})
-                st.dataframe(pd.DataFrame(seg_data))
-    
-    else:  # Page Replacement Algorithms
-        st.subheader("📚 Page Replacement Algorithms")
-        
-        # Input parameters
-        col1, col2 = st.columns(2)
-        with col1:
-            page_sequence = st.text_input("Page Reference Sequence (comma-separated)", "1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5")
-            frame_size = st.number_input("Number of Frames", min_value=1, max_value=10, value=3)
-        
-        with col2:
-            algorithms = st.multiselect(
-                "Select Algorithms to Compare",
-                ["FIFO", "LRU", "Optimal"],
-                default=["FIFO", "LRU", "Optimal"]
-            )
-        
-        if st.button("Run Page Replacement Simulation"):
-            try:
-                pages = list(map(int, page_sequence.split(',')))
-                
-                results = {}
-                traces = {}
-                
-                # Run selected algorithms
-                if "FIFO" in algorithms:
-                    faults, trace = fifo(pages, frame_size)
-                    results["FIFO"] = faults
-                    traces["FIFO"] = trace
-                
-                if "LRU" in algorithms:
-                    faults, trace = lru(pages, frame_size)
-                    results["LRU"] = faults
-                    traces["LRU"] = trace
-                
-                if "Optimal" in algorithms:
-                    faults, trace = optimal(pages, frame_size)
-                    results["Optimal"] = faults
-                    traces["Optimal"] = trace
-                
+                rows = []
+                with st.spinner("Replaying trace..."), prof.phase("compute"):
+                    for kind in chosen:
+                        ops = allocation_trace(int(num_ops), int(live_target), mean_size, seed=int(alloc_seed))
+                        result = replay_allocations(make_allocator(kind, memory_order), ops)
+                        rows.append({
+                            "Allocator": kind,
+                            "µs / op": round(result["us_per_op"], 3),
+                            "Failed Allocations": result["failed_allocations"],
+                            "Free Units": result["free"],
+                            "Largest Free Block": result["largest_free"],
+                            "Free Blocks": result["free_blocks"],
+                            "External Fragmentation (%)": round(100 * result["external_fragmentation"], 2),
+                            "Peak External Fragmentation (%)": round(100 * result["peak_external_fragmentation"], 2),
+                            "Internal Fragmentation (%)": round(100 * result["internal_fragmentation"], 2),
+                        })
+                st.dataframe(pd.DataFrame(rows), use_container_width=True)
+
+        else:  # Page Replacement Algorithms
+            st.subheader("📚 Page Replacement Algorithms")
+
+            # Input parameters
+            source = st.radio("Reference Source", ["Manual Input", "Synthetic (Zipf)"], horizontal=True)
+            col1, col2 = st.columns(2)
+            with col1:
+                if source == "Manual Input":
+                    page_sequence = st.text_input("Page Reference Sequence (comma-separated)", "1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5")
+                else:
+                    synthetic_length = st.number_input("Reference String Length", min_value=10, max_value=5_000_000, value=1_000_000, step=10_000)
+                    synthetic_pages = st.number_input("Distinct Pages", min_value=1, max_value=1_000_000, value=1_000)
+                    synthetic_seed = st.number_input("Seed", min_value=0, value=0, key="replacement_seed")
+                frame_size = st.number_input("Number of Frames", min_value=1, max_value=10, value=3)
+
+            with col2:
+                algorithms = st.multiselect(
+                    "Select Algorithms to Compare",
+                    list(REPLACEMENT_ALGORITHMS),
+                    default=["FIFO", "LRU", "Optimal"]
+                )
+                long_tables = st.checkbox(f"Step Tables Above {SUMMARY_ONLY_STEPS:,} References",
+                                          help="Long traces show summaries and a fault-rate chart unless this is ticked.")
+
+            if st.button("Run Page Replacement Simulation"):
+                if source == "Manual Input":
+                    try:
+                        pages = list(map(int, page_sequence.split(',')))
+                    except ValueError:
+                        st.error("❌ Please enter valid comma-separated integers for the page sequence.")
+                        stop_render()
+                else:
+                    pages = reference_string(int(synthetic_length), int(synthetic_pages), seed=int(synthetic_seed)).tolist()
+
+                # Faults are recorded as deltas during the run; the traces are
+                # kept so paging through them does not rerun the simulation
+                with st.spinner("Simulating..."), prof.phase("compute"):
+                    st.session_state.page_traces = {
+                        alg: simulate_replacement(alg, pages, frame_size, trace=True).trace for alg in algorithms
+                    }
+
+            page_traces = st.session_state.get("page_traces")
+            if page_traces:
+                import pandas as pd
+                total_references = len(next(iter(page_traces.values())))
+
                 # Display results
                 st.subheader("📊 Results Summary")
-                cols = st.columns(len(results))
-                for i, (alg, faults) in enumerate(results.items()):
+                cols = st.columns(len(page_traces))
+                for i, (alg, trace) in enumerate(page_traces.items()):
                     with cols[i]:
-                        st.metric(f"{alg} Page Faults", faults)
-                
-                # Display detailed trace for each algorithm
-                for alg in algorithms:
-                    st.subheader(f"🔍 {alg} Algorithm Trace")
-                    
-                    # Create trace table
-                    import pandas as pd
-                    trace_data = []
-                    for i, page in enumerate(pages):
-                        frame_state = traces[alg][i] if i < len(traces[alg]) else []
-                        # Pad frame state to match frame size
-                        padded_frame = frame_state + ['-'] * (frame_size - len(frame_state))
-                        
-                        row = {"Step": i+1, "Page": page}
-                        for j in range(frame_size):
-                            row[f"Frame {j+1}"] = padded_frame[j] if j < len(padded_frame) else '-'
-                        
-                        # Check if it's a page fault
-                        if i == 0:
-                            row["Fault"] = "Yes"
-                        else:
-                            prev_frame = traces[alg][i-1] if i-1 < len(traces[alg]) else []
-                            row["Fault"] = "Yes" if page not in prev_frame else "No"
-                        
-                        trace_data.append(row)
-                    
-                    df = pd.DataFrame(trace_data)
-                    st.dataframe(df, use_container_width=True)
-                
+                        st.metric(f"{alg} Page Faults", f"{trace.faults:,}")
+
+                if total_references > SUMMARY_ONLY_STEPS and not long_tables:
+                    st.info(f"{total_references:,} references: showing summaries only. Tick the step-table option to page through the traces.")
+                    st.subheader("📈 Fault Rate over the Trace")
+                    with prof.phase("plot"):
+                        rates = {}
+                        for alg, trace in page_traces.items():
+                            window_ends, rates[alg] = trace.fault_rate()
+                        st.line_chart(pd.DataFrame(rates, index=pd.Index(window_ends, name="Reference")))
+                else:
+                    # Display detailed trace for each algorithm, one page of rows at a time
+                    for alg, trace in page_traces.items():
+                        st.subheader(f"🔍 {alg} Algorithm Trace")
+                        num_table_pages = max(-(-len(trace) // PAGE_ROWS), 1)
+                        table_page = 1
+                        if num_table_pages > 1:
+                            table_page = st.number_input(f"Page (of {num_table_pages:,}, {PAGE_ROWS} steps each)", min_value=1,
+                                                         max_value=num_table_pages, value=1, key=f"trace_page_{alg}_{num_table_pages}")
+                        start, stop = page_bounds(len(trace), int(table_page))
+                        with prof.phase("table"):
+                            df = pd.DataFrame(trace.display_rows(start, stop))
+                        st.dataframe(df, use_container_width=True, hide_index=True)
+
                 # Calculate hit ratio
                 st.subheader("📈 Performance Metrics")
-                total_references = len(pages)
-                
                 perf_data = []
-                for alg, faults in results.items():
-                    hits = total_references - faults
-                    hit_ratio = (hits / total_references) * 100
-                    fault_ratio = (faults / total_references) * 100
-                    
+                for alg, trace in page_traces.items():
+                    summary = trace.summary()
                     perf_data.append({
                         "Algorithm": alg,
-                        "Page Faults": faults,
-                        "Page Hits": hits,
-                        "Hit Ratio (%)": f"{hit_ratio:.2f}%",
-                        "Fault Ratio (%)": f"{fault_ratio:.2f}%"
+                        "Page Faults": summary["faults"],
+                        "Page Hits": summary["hits"],
+                        "Hit Ratio (%)": f"{100 * (1 - summary['fault_ratio']):.2f}%",
+                        "Fault Ratio (%)": f"{100 * summary['fault_ratio']:.2f}%"
                     })
-                
+
                 st.dataframe(pd.DataFrame(perf_data), use_container_width=True)
-                
-            except ValueError:
-                st.error("❌ Please enter valid comma-separated integers for the page sequence.")
-            except Exception as e:
-                st.error(f"❌ An error occurred: {str(e)}")
-
-# -------------------- Process Management --------------------
-elif page == "Process Management":
-    st.title("⚙️ Process Management Simulator")
-    
-    process_option = st.selectbox(
-        "Choose Process Management Technique",
-        ["Deadlock Management", "Process Synchronization", "Inter-Process Communication"]
-    )
-    
-    if process_option == "Deadlock Management":
-        st.subheader("🔒 Deadlock Management")
-        
-        deadlock_method = st.radio("Select Method", ["Banker's Algorithm (Prevention)", "Deadlock Detection"])
-        
-        if deadlock_method == "Banker's Algorithm (Prevention)":
-            st.markdown("### 🏦 Banker's Algorithm")
-            st.info("The Banker's Algorithm ensures the system never enters an unsafe state by checking if granting a request leads to a safe sequence.")
-            
-            # Input parameters
-            col1, col2 = st.columns(2)
-            with col1:
-                num_processes = st.number_input("Number of Processes", min_value=1, max_value=10, value=5)
-                num_resources = st.number_input("Number of Resource Types", min_value=1, max_value=5, value=3)
-            
-            with col2:
-                available_input = st.text_input("Available Resources (comma-separated)", "3, 3, 2")
-            
-            # Process details input
-            st.markdown("#### Process Details")
-            processes = []
-            allocation = []
-            max_need = []
-            
-            for i in range(num_processes):
-                st.markdown(f"**Process P{i}**")
-                col1, col2, col3 = st.columns(3)
-                
+
+    # -------------------- Process Management --------------------
+    elif page == "Process Management":
+        st.title("⚙️ Process Management Simulator")
+
+        process_option = st.selectbox(
+            "Choose Process Management Technique",
+            ["Deadlock Management", "Process Synchronization", "Inter-Process Communication"]
+        )
+
+        if process_option == "Deadlock Management":
+            st.subheader("🔒 Deadlock Management")
+
+            deadlock_method = st.radio("Select Method", ["Banker's Algorithm (Prevention)", "Deadlock Detection"])
+
+            if deadlock_method == "Banker's Algorithm (Prevention)":
+                st.markdown("### 🏦 Banker's Algorithm")
+                st.info("The Banker's Algorithm ensures the system never enters an unsafe state by checking if granting a request leads to a safe sequence.")
+
+                # Input parameters
+                col1, col2 = st.columns(2)
                 with col1:
-                    st.write("Process Name")
-                    processes.append(f"P{i}")
-                    st.write(f"P{i}")
-                
+                    num_processes = st.number_input("Number of Processes", min_value=1, max_value=10, value=5)
+                    num_resources = st.number_input("Number of Resource Types", min_value=1, max_value=5, value=3)
+
                 with col2:
-                    alloc_input = st.text_input(f"Allocated Resources", key=f"alloc_{i}", value="0, 1, 0")
+                    available_input = st.text_input("Available Resources (comma-separated)", "3, 3, 2")
+
+                # Process details input
+                st.markdown("#### Process Details")
+                processes = []
+                allocation = []
+                max_need = []
+
+                for i in range(num_processes):
+                    st.markdown(f"**Process P{i}**")
+                    col1, col2, col3 = st.columns(3)
+
+                    with col1:
+                        st.write("Process Name")
+                        processes.append(f"P{i}")
+                        st.write(f"P{i}")
+
+                    with col2:
+                        alloc_input = st.text_input(f"Allocated Resources", key=f"alloc_{i}", value="0, 1, 0")
+                        try:
+                            alloc = list(map(int, alloc_input.split(',')))
+                            allocation.append(alloc)
+                        except:
+                            allocation.append([0] * num_resources)
+
+                    with col3:
+                        max_input = st.text_input(f"Maximum Need", key=f"max_{i}", value="7, 5, 3")
+                        try:
+                            max_need_val = list(map(int, max_input.split(',')))
+                            max_need.append(max_need_val)
+                        except:
+                            max_need.append([0] * num_resources)
+
+                if st.button("Run Banker's Algorithm"):
                     try:
-                        alloc = list(map(int, alloc_input.split(',')))
-                        allocation.append(alloc)
-                    except:
-                        allocation.append([0] * num_resources)
-                
-                with col3:
-                    max_input = st.text_input(f"Maximum Need", key=f"max_{i}", value="7, 5, 3")
+                        available = list(map(int, available_input.split(',')))
+                        with prof.phase("compute"):
+                            safe_sequence, need_matrix = bankers_algorithm_np(processes, allocation, max_need, available)
+
+                        if safe_sequence:
+                            st.success("✅ System is in SAFE state!")
+                            st.subheader("🔐 Safe Sequence")
+                            st.write(" → ".join(safe_sequence))
+
+                            # Display matrices
+                            col1, col2, col3 = st.columns(3)
+
+                            with col1:
+                                st.subheader("📋 Allocation Matrix")
+                                import pandas as pd
+                                alloc_df = pd.DataFrame(allocation, index=[f"P{i}" for i in range(num_processes)], columns=[f"R{i}" for i in range(num_resources)])
+                                st.dataframe(alloc_df)
+
+                            with col2:
+                                st.subheader("📊 Max Need Matrix")
+                                max_df = pd.DataFrame(max_need, index=[f"P{i}" for i in range(num_processes)], columns=[f"R{i}" for i in range(num_resources)])
+                                st.dataframe(max_df)
+
+                            with col3:
+                                st.subheader("📈 Need Matrix")
+                                need_df = pd.DataFrame(need_matrix, index=[f"P{i}" for i in range(num_processes)], columns=[f"R{i}" for i in range(num_resources)])
+                                st.dataframe(need_df)
+
+                            st.subheader("📌 Available Resources")
+                            avail_df = pd.DataFrame([available], columns=[f"R{i}" for i in range(num_resources)])
+                            st.dataframe(avail_df)
+
+                        else:
+                            st.error("❌ System is in UNSAFE state! Potential deadlock detected.")
+                            st.warning("The system cannot find a safe sequence to execute all processes.")
+
+                    except Exception as e:
+                        st.error(f"❌ Error in input format: {str(e)}")
+
+                st.markdown("#### 📨 Evaluate a Resource Request")
+                req_col1, req_col2 = st.columns(2)
+                with req_col1:
+                    requesting = st.selectbox("Requesting Process", processes)
+                with req_col2:
+                    request_input = st.text_input("Request (comma-separated)", "1, 0, 2")
+
+                if st.button("Evaluate Request"):
                     try:
-                        max_need_val = list(map(int, max_input.split(',')))
-                        max_need.append(max_need_val)
-                    except:
-                        max_need.append([0] * num_resources)
-            
-            if st.button("Run Banker's Algorithm"):
-                try:
-                    available = list(map(int, available_input.split(',')))
-                    safe_sequence, need_matrix = bankers_algorithm(processes, allocation, max_need, available)
-                    
-                    if safe_sequence:
-                        st.success("✅ System is in SAFE state!")
-                        st.subheader("🔐 Safe Sequence")
-                        st.write(" → ".join(safe_sequence))
-                        
-                        # Display matrices
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.subheader("📋 Allocation Matrix")
+                        available = list(map(int, available_input.split(',')))
+                        state = BankersState(allocation, max_need, available, processes)
+                        granted, reason = state.request(processes.index(requesting), list(map(int, request_input.split(','))))
+                        if granted:
+                            st.success(f"✅ Request granted. New safe sequence: {' → '.join(state.safe_sequence)}")
+                        else:
+                            st.error(f"❌ Request denied: {reason}.")
+                    except ValueError as e:
+                        st.error(f"❌ {str(e)}")
+
+            else:  # Deadlock Detection
+                st.markdown("### 🔍 Deadlock Detection")
+                detection_model = st.radio("Detection Model", ["Matrix Reduction (multi-instance)", "Resource-Allocation Graph (single-instance)"], horizontal=True)
+
+                if detection_model == "Resource-Allocation Graph (single-instance)":
+                    st.info("Edges are added one at a time: `P -> R` is a request, `R -> P` an assignment. A cycle means deadlock; each cycle is reported as soon as the edge that closes it arrives.")
+                    edges_input = st.text_area("Edges (one per line)", "P0 -> R0\nR0 -> P1\nP1 -> R1\nR1 -> P2\nP2 -> R2\nR2 -> P0")
+
+                    if st.button("Detect Deadlock", key="detect_graph"):
+                        graph = ResourceGraph()
+                        events = []
+                        for line_no, line in enumerate(edges_input.splitlines(), 1):
+                            if not line.strip():
+                                continue
+                            source, arrow, target = line.partition("->")
+                            if not arrow or not source.strip() or not target.strip():
+                                st.error(f"❌ Line {line_no}: expected `A -> B`.")
+                                stop_render()
+                            cycle = graph.add_edge(source.strip(), target.strip())
+                            if cycle:
+                                events.append({"Edge": line.strip(), "Cycle Closed": " → ".join(cycle + [cycle[0]])})
+
+                        deadlocks = graph.deadlocks()
+                        if deadlocks:
+                            st.error(f"❌ DEADLOCK DETECTED! {len(deadlocks)} deadlocked group(s).")
                             import pandas as pd
-                            alloc_df = pd.DataFrame(allocation, index=[f"P{i}" for i in range(num_processes)], columns=[f"R{i}" for i in range(num_resources)])
-                            st.dataframe(alloc_df)
-                        
+                            st.dataframe(pd.DataFrame([
+                                {"Processes": ", ".join(sorted(n for n in nodes if n.startswith("P"))) or "-",
+                                 "Nodes": len(nodes), "Cycle": " → ".join(cycle + [cycle[0]])}
+                                for nodes, cycle in deadlocks
+                            ]), use_container_width=True)
+                            st.markdown("#### Edges that closed a cycle")
+                            st.dataframe(pd.DataFrame(events), use_container_width=True)
+                        else:
+                            st.success("✅ NO DEADLOCK detected! The graph has no cycle.")
+
+                else:  # Matrix reduction
+                    st.info("This algorithm detects if the current system state has a deadlock by checking if all processes can complete.")
+
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        num_processes_detect = st.number_input("Number of Processes", min_value=1, max_value=10, value=3, key="detect_processes")
+                        num_resources_detect = st.number_input("Number of Resource Types", min_value=1, max_value=5, value=3, key="detect_resources")
+
+                    with col2:
+                        available_detect = st.text_input("Available Resources", "0, 0, 0", key="detect_available")
+
+                    # Input matrices
+                    st.markdown("#### Current System State")
+                    allocation_detect = []
+                    request_detect = []
+
+                    for i in range(num_processes_detect):
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            alloc = st.text_input(f"P{i} - Current Allocation", f"0, 1, 0", key=f"detect_alloc_{i}")
+                            try:
+                                allocation_detect.append(list(map(int, alloc.split(','))))
+                            except:
+                                allocation_detect.append([0] * num_resources_detect)
+
                         with col2:
-                            st.subheader("📊 Max Need Matrix")
-                            max_df = pd.DataFrame(max_need, index=[f"P{i}" for i in range(num_processes)], columns=[f"R{i}" for i in range(num_resources)])
-                            st.dataframe(max_df)
-                        
-                        with col3:
-                            st.subheader("📈 Need Matrix")
-                            need_df = pd.DataFrame(need_matrix, index=[f"P{i}" for i in range(num_processes)], columns=[f"R{i}" for i in range(num_resources)])
-                            st.dataframe(need_df)
-                        
-                        st.subheader("📌 Available Resources")
-                        avail_df = pd.DataFrame([available], columns=[f"R{i}" for i in range(num_resources)])
-                        st.dataframe(avail_df)
-                        
-                    else:
-                        st.error("❌ System is in UNSAFE state! Potential deadlock detected.")
-                        st.warning("The system cannot find a safe sequence to execute all processes.")
-                
-                except Exception as e:
-                    st.error(f"❌ Error in input format: {str(e)}")
-        
-        else:  # Deadlock Detection
-            st.markdown("### 🔍 Deadlock Detection")
-            st.info("This algorithm detects if the current system state has a deadlock by checking if all processes can complete.")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                num_processes_detect = st.number_input("Number of Processes", min_value=1, max_value=10, value=3, key="detect_processes")
-                num_resources_detect = st.number_input("Number of Resource Types", min_value=1, max_value=5, value=3, key="detect_resources")
-            
-            with col2:
-                available_detect = st.text_input("Available Resources", "0, 0, 0", key="detect_available")
-            
-            # Input matrices
-            st.markdown("#### Current System State")
-            allocation_detect = []
-            request_detect = []
-            
-            for i in range(num_processes_detect):
-                col1, col2 = st.columns(2)
-                with col1:
-                    alloc = st.text_input(f"P{i} - Current Allocation", f"0, 1, 0", key=f"detect_alloc_{i}")
-                    try:
-                        allocation_detect.append(list(map(int, alloc.split(','))))
-                    except:
-                        allocation_detect.append([0] * num_resources_detect)
-                
-                with col2:
-                    req = st.text_input(f"P{i} - Request", f"0, 0, 0", key=f"detect_req_{i}")
-                    try:
-                        request_detect.append(list(map(int, req.split(','))))
-                    except:
-                        request_detect.append([0] * num_resources_detect)
-            
-            if st.button("Detect Deadlock"):
-                try:
-                    available_resources = list(map(int, available_detect.split(',')))
-                    deadlocked = detect_deadlock(allocation_detect, request_detect, available_resources)
-                    
-                    if deadlocked:
-                        st.error(f"❌ DEADLOCK DETECTED!")
-                        st.write(f"**Deadlocked Processes:** {[f'P{i}' for i in deadlocked]}")
-                        
-                        # Show the state
-                        col1, col2, col3 = st.columns(3)
+                            req = st.text_input(f"P{i} - Request", f"0, 0, 0", key=f"detect_req_{i}")
+                            try:
+                                request_detect.append(list(map(int, req.split(','))))
+                            except:
+                                request_detect.append([0] * num_resources_detect)
+
+                    if st.button("Detect Deadlock"):
+                        try:
+                            available_resources = list(map(int, available_detect.split(',')))
+                            with prof.phase("compute"):
+                                deadlocked = detect_deadlock(allocation_detect, request_detect, available_resources)
+
+                            if deadlocked:
+                                st.error(f"❌ DEADLOCK DETECTED!")
+                                st.write(f"**Deadlocked Processes:** {[f'P{i}' for i in deadlocked]}")
+                                # With one instance per resource the graph shows why
+                                instances = np.asarray(allocation_detect).sum(axis=0) + np.asarray(available_resources)
+                                if np.all(instances <= 1):
+                                    for _, cycle in find_deadlocks(graph_from_matrices(allocation_detect, request_detect)):
+                                        st.write(f"**Cycle:** {' → '.join(cycle + [cycle[0]])}")
+
+                                # Show the state
+                                import pandas as pd
+                                col1, col2, col3 = st.columns(3)
+                                with col1:
+                                    st.subheader("Current Allocation")
+                                    alloc_df = pd.DataFrame(allocation_detect, columns=[f"R{i}" for i in range(num_resources_detect)])
+                                    alloc_df.index = [f"P{i}" for i in range(num_processes_detect)]
+                                    st.dataframe(alloc_df)
+
+                                with col2:
+                                    st.subheader("Request Matrix")
+                                    req_df = pd.DataFrame(request_detect, columns=[f"R{i}" for i in range(num_resources_detect)])
+                                    req_df.index = [f"P{i}" for i in range(num_processes_detect)]
+                                    st.dataframe(req_df)
+
+                                with col3:
+                                    st.subheader("Available")
+                                    avail_df = pd.DataFrame([available_resources], columns=[f"R{i}" for i in range(num_resources_detect)])
+                                    st.dataframe(avail_df)
+                            else:
+                                st.success("✅ NO DEADLOCK detected! All processes can complete.")
+
+                        except Exception as e:
+                            st.error(f"❌ Error: {str(e)}")
+
+        elif process_option == "Process Synchronization":
+            st.subheader("🔄 Process Synchronization")
+
+            sync_problem = st.selectbox("Choose Synchronization Problem", ["Producer-Consumer", "Readers-Writers"])
+
+            if sync_problem == "Producer-Consumer":
+                st.markdown("### 🏭 Producer-Consumer Problem")
+                pc_mode = st.radio("Mode", ["Step Simulation", "Real Threads / Processes"], horizontal=True)
+
+                if pc_mode == "Real Threads / Processes":
+                    st.info("Runs real producer and consumer workers over a bounded buffer and measures throughput, per-item latency and time spent blocked in put/get. Thread backends share one interpreter; process backends run one OS process per worker.")
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        backends = st.multiselect("Buffer Backends", list(SYNC_BACKENDS), default=list(SYNC_BACKENDS))
+                        buffer_sizes_input = st.text_input("Buffer Sizes (comma-separated)", "1, 16, 256")
+                    with col2:
+                        num_producers = st.number_input("Number of Producers", min_value=1, max_value=32, value=2, key="real_producers")
+                        num_consumers = st.number_input("Number of Consumers", min_value=1, max_value=32, value=2, key="real_consumers")
+                    with col3:
+                        items_to_produce = st.number_input("Items to Produce", min_value=100, max_value=2_000_000, value=50_000, step=1000, key="real_items")
+
+                    if st.button("Run Producer-Consumer Benchmark"):
+                        try:
+                            buffer_sizes = [int(x) for x in buffer_sizes_input.split(',')]
+                        except ValueError:
+                            st.error("❌ Please enter valid comma-separated integers for the buffer sizes.")
+                            stop_render()
+
+                        import pandas as pd
+                        with st.spinner("Running workers..."), prof.phase("compute"):
+                            rows = [
+                                run_producer_consumer(backend, size, int(num_producers), int(num_consumers), int(items_to_produce))
+                                for backend in backends for size in buffer_sizes
+                            ]
+                        frame = pd.DataFrame(rows)
+                        st.dataframe(frame.round(2), use_container_width=True, hide_index=True)
+                        if rows:
+                            st.line_chart(frame.pivot_table(index="buffer_size", columns="backend", values="items_per_second"))
+
+                else:
+                    st.info("Simulates the classic synchronization problem where producers add items to a buffer and consumers remove them.")
+
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        buffer_size = st.number_input("Buffer Size", min_value=1, max_value=20, value=5)
+                    with col2:
+                        num_producers = st.number_input("Number of Producers", min_value=1, max_value=5, value=2)
+                    with col3:
+                        num_consumers = st.number_input("Number of Consumers", min_value=1, max_value=5, value=1)
+                    with col4:
+                        items_to_produce = st.number_input("Items to Produce", min_value=1, max_value=20, value=10)
+
+                    if st.button("Run Producer-Consumer Simulation"):
+                        operations, produced, consumed = producer_consumer_simulation(buffer_size, num_producers, num_consumers, items_to_produce)
+
+                        col1, col2 = st.columns(2)
                         with col1:
-                            st.subheader("Current Allocation")
-                            alloc_df = pd.DataFrame(allocation_detect, columns=[f"R{i}" for i in range(num_resources_detect)])
-                            alloc_df.index = [f"P{i}" for i in range(num_processes_detect)]
-                            st.dataframe(alloc_df)
-                        
+                            st.subheader("📊 Simulation Results")
+                            st.metric("Items Produced", len(produced))
+                            st.metric("Items Consumed", len(consumed))
+                            st.metric("Buffer Size", buffer_size)
+
                         with col2:
-                            st.subheader("Request Matrix")
-                            req_df = pd.DataFrame(request_detect, columns=[f"R{i}" for i in range(num_resources_detect)])
-                            req_df.index = [f"P{i}" for i in range(num_processes_detect)]
-                            st.dataframe(req_df)
-                        
-                        with col3:
-                            st.subheader("Available")
-                            avail_df = pd.DataFrame([available_resources], columns=[f"R{i}" for i in range(num_resources_detect)])
-                            st.dataframe(avail_df)
-                    else:
-                        st.success("✅ NO DEADLOCK detected! All processes can complete.")
-                
-                except Exception as e:
-                    st.error(f"❌ Error: {str(e)}")
-    
-    elif process_option == "Process Synchronization":
-        st.subheader("🔄 Process Synchronization")
-        
-        sync_problem = st.selectbox("Choose Synchronization Problem", ["Producer-Consumer", "Readers-Writers"])
-        
-        if sync_problem == "Producer-Consumer":
-            st.markdown("### 🏭 Producer-Consumer Problem")
-            st.info("Simulates the classic synchronization problem where producers add items to a buffer and consumers remove them.")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                buffer_size = st.number_input("Buffer Size", min_value=1, max_value=20, value=5)
-            with col2:
-                num_producers = st.number_input("Number of Producers", min_value=1, max_value=5, value=2)
-            with col3:
-                items_to_produce = st.number_input("Items to Produce", min_value=1, max_value=20, value=10)
-            
-            if st.button("Run Producer-Consumer Simulation"):
-                operations, produced, consumed = producer_consumer_simulation(buffer_size, num_producers, 1, items_to_produce)
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.subheader("📊 Simulation Results")
-                    st.metric("Items Produced", len(produced))
-                    st.metric("Items Consumed", len(consumed))
-                    st.metric("Buffer Size", buffer_size)
-                
-                with col2:
-                    st.subheader("📈 Statistics")
-                    efficiency = (len(consumed) / len(produced)) * 100 if produced else 0
-                    st.metric("Consumption Efficiency", f"{efficiency:.1f}%")
-                
-                st.subheader("📋 Operation Log")
-                for i, op in enumerate(operations[:20]):  # Show first 20 operations
-                    st.text(f"{i+1:2d}. {op}")
-                
-                if len(operations) > 20:
-                    st.info(f"... and {len(operations) - 20} more operations")
-        
-        else:  # Readers-Writers
-            st.markdown("### 📚 Readers-Writers Problem")
-            st.info("Simulates the synchronization problem where multiple readers can access a resource simultaneously, but writers need exclusive access.")
-            
-            col1, col2, col3 = st.columns(3)
+                            st.subheader("📈 Statistics")
+                            efficiency = (len(consumed) / len(produced)) * 100 if produced else 0
+                            st.metric("Consumption Efficiency", f"{efficiency:.1f}%")
+
+                        st.subheader("📋 Operation Log")
+                        for i, op in enumerate(operations[:20]):  # Show first 20 operations
+                            st.text(f"{i+1:2d}. {op}")
+
+                        if len(operations) > 20:
+                            st.info(f"... and {len(operations) - 20} more operations")
+
+            else:  # Readers-Writers
+                st.markdown("### 📚 Readers-Writers Problem")
+                rw_mode = st.radio("Mode", ["Step Simulation", "Real Lock Contention"], horizontal=True, key="rw_mode")
+
+                if rw_mode == "Real Lock Contention":
+                    st.info("Runs real reader and writer threads against each lock policy. Every thread loops acquire → hold → release → think and records how long each acquire waited.")
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        policies = st.multiselect("Lock Policies", list(RW_LOCKS), default=list(RW_LOCKS))
+                        bench_readers = st.number_input("Reader Threads", min_value=0, max_value=64, value=8)
+                        bench_writers = st.number_input("Writer Threads", min_value=0, max_value=16, value=2)
+                    with col2:
+                        read_hold_ms = st.number_input("Read Hold (ms)", min_value=0.0, value=0.1, format="%.3f")
+                        write_hold_ms = st.number_input("Write Hold (ms)", min_value=0.0, value=0.5, format="%.3f")
+                        think_ms = st.number_input("Think Time (ms)", min_value=0.0, value=0.1, format="%.3f")
+                    with col3:
+                        bench_duration = st.number_input("Duration per Policy (s)", min_value=0.2, max_value=30.0, value=1.0)
+                        bench_seed = st.number_input("Seed", min_value=0, value=0, key="rw_bench_seed")
+
+                    if st.button("Run Lock Contention Benchmark"):
+                        import pandas as pd
+                        with st.spinner("Running threads..."), prof.phase("compute"):
+                            results = [
+                                contention_benchmark(policy, int(bench_readers), int(bench_writers), bench_duration,
+                                                     read_hold_ms / 1e3, write_hold_ms / 1e3, think_ms / 1e3, int(bench_seed))
+                                for policy in policies
+                            ]
+                        summary = pd.DataFrame([{k: v for k, v in r.items() if not k.endswith("histogram")} for r in results])
+                        st.dataframe(summary.round(3), use_container_width=True, hide_index=True)
+
+                        st.markdown("#### Wait-Time Histograms")
+                        bins = [f"≤{edge:,.0f} µs" for edge in LATENCY_BINS[1:]]
+                        for side in ("read", "write"):
+                            hist = pd.DataFrame({r["policy"]: r[f"{side}_histogram"] for r in results}, index=bins)
+                            st.markdown(f"**{side.title()} waits**")
+                            st.bar_chart(hist[(hist > 0).any(axis=1)])
+
+                else:
+                    st.info("Simulates the synchronization problem where multiple readers can access a resource simultaneously, but writers need exclusive access.")
+
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        num_readers = st.number_input("Max Readers", min_value=1, max_value=10, value=3)
+                    with col2:
+                        num_writers = st.number_input("Max Writers", min_value=1, max_value=5, value=2)
+                    with col3:
+                        operations_count = st.number_input("Number of Operations", min_value=5, max_value=50, value=15)
+                    with col4:
+                        rw_seed = st.number_input("Seed", min_value=0, value=0, key="rw_seed")
+
+                    if st.button("Run Readers-Writers Simulation"):
+                        operations, final_status = readers_writers_simulation(num_readers, num_writers, operations_count, seed=int(rw_seed))
+
+                        st.subheader("📊 Final Resource Status")
+                        st.info(f"Resource Status: {final_status}")
+
+                        st.subheader("📋 Operation Log")
+                        for op in operations:
+                            if "started" in op:
+                                st.success(op)
+                            elif "waiting" in op:
+                                st.warning(op)
+                            elif "finished" in op:
+                                st.info(op)
+                            else:
+                                st.text(op)
+
+
+
+        elif process_option == "Inter-Process Communication":
+            st.subheader("📡 Inter-Process Communication")
+            st.info("Benchmarks real IPC mechanisms between this process and a forked child: round-trip latency from a ping-pong of messages, bandwidth and CPU cost per message from a one-way stream.")
+
+            col1, col2 = st.columns(2)
             with col1:
-                num_readers = st.number_input("Max Readers", min_value=1, max_value=10, value=3)
+                mechanisms = st.multiselect("Mechanisms", list(IPC_MECHANISMS), default=list(IPC_MECHANISMS))
+                sizes_input = st.text_input("Message Sizes in Bytes (comma-separated)", "64, 1024, 16384, 262144, 1048576")
             with col2:
-                num_writers = st.number_input("Max Writers", min_value=1, max_value=5, value=2)
-            with col3:
-                operations_count = st.number_input("Number of Operations", min_value=5, max_value=50, value=15)
-            
-            if st.button("Run Readers-Writers Simulation"):
-                operations, final_status = readers_writers_simulation(num_readers, num_writers, operations_count)
-                
-                st.subheader("📊 Final Resource Status")
-                st.info(f"Resource Status: {final_status}")
-                
-                st.subheader("📋 Operation Log")
-                for op in operations:
-                    if "started" in op:
-                        st.success(op)
-                    elif "waiting" in op:
-                        st.warning(op)
-                    elif "finished" in op:
-                        st.info(op)
-                    else:
-                        st.text(op)
-    
-   
\ No newline at end of file
+                stream_mb = st.number_input("Data Streamed per Measurement (MB)", min_value=1, max_value=1024, value=16)
+
+            if st.button("Run IPC Benchmark"):
+                try:
+                    ipc_sizes = [int(x) for x in sizes_input.split(',')]
+                    if min(ipc_sizes) < 1:
+                        raise ValueError
+                except ValueError:
+                    st.error("❌ Please enter comma-separated positive integers for the message sizes.")
+                    stop_render()
+
+                import pandas as pd
+                with st.spinner("Running IPC benchmark..."), prof.phase("compute"):
+                    rows = run_ipc_benchmark(mechanisms, ipc_sizes, stream_bytes=int(stream_mb) << 20)
+                frame = pd.DataFrame(rows)
+                st.dataframe(frame.round(2), use_container_width=True, hide_index=True)
+                if rows:
+                    st.markdown("#### Bandwidth (MB/s) by Message Size")
+                    st.line_chart(frame.pivot_table(index="size", columns="mechanism", values="bandwidth_MBps"))
+                    st.markdown("#### Median Round Trip (µs) by Message Size")
+                    st.line_chart(frame.pivot_table(index="size", columns="mechanism", values="rtt_p50_us"))
+    finish_render()
+finally:
+    # Stops cProfile or the sampling thread if the render was cut short
+    # (an exception, st.stop or a rerun); a no-op after finish_render()
+    prof.finish()
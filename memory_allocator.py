@@ -0,0 +1,362 @@
+# memory_allocator.py
+"""
+Contiguous memory allocator simulators.
+
+Sizes and addresses are in abstract allocation units. Every allocator
+offers alloc(size) -> address or None, free(address) and stats(), and
+`replay` drives any of them with an alloc/free trace.
+
+- FreeListAllocator: first-fit, next-fit, best-fit and worst-fit over one
+  free list. Free blocks are indexed by start and by end (dicts, for O(1)
+  coalescing) and, depending on the policy, in a max segment tree over
+  start addresses (first/next fit: leftmost fitting block) or over block
+  sizes (best/worst fit: smallest fitting / largest size), with a heap of
+  starts per size that drops removed blocks lazily. Every operation is
+  O(log n).
+- BuddyAllocator: binary buddy system with one free set per order.
+- SlabAllocator: per-size-class caches of fixed-size objects carved from
+  slabs that come from a buddy allocator.
+"""
+import heapq
+import time
+from bisect import bisect_left
+
+FIT_POLICIES = ('first', 'next', 'best', 'worst')
+ALLOCATORS = tuple(f'{p}-fit' for p in FIT_POLICIES) + ('buddy', 'slab')
+
+
+class _MaxTree:
+    """Segment tree of maxima over positions 0..n-1, for leftmost-fit queries."""
+
+    def __init__(self, n):
+        size = 1
+        while size < n:
+            size *= 2
+        self.size = size
+        self.tree = [0] * (2 * size)
+
+    def set(self, i, value):
+        i += self.size
+        tree = self.tree
+        tree[i] = value
+        i //= 2
+        while i:
+            left, right = tree[2 * i], tree[2 * i + 1]
+            best = left if left > right else right
+            if tree[i] == best:
+                break  # ancestors are unchanged
+            tree[i] = best
+            i //= 2
+
+    def find_first(self, need, lo=0):
+        """Leftmost position >= lo whose value is >= need, or None."""
+        if lo >= self.size:
+            return None
+        tree = self.tree
+        node = lo + self.size
+        # Climb to the first subtree right of `lo` that holds a large enough value
+        while tree[node] < need:
+            while node & 1:
+                node >>= 1
+            if node == 0:
+                return None
+            node += 1
+        while node < self.size:
+            node = 2 * node if tree[2 * node] >= need else 2 * node + 1
+        return node - self.size
+
+
+class FreeListAllocator:
+    def __init__(self, total, policy='first'):
+        if policy not in FIT_POLICIES:
+            raise ValueError(f"Unknown fit policy: {policy}")
+        self.total = total
+        self.policy = policy
+        self.by_start = {}
+        self.by_end = {}
+        # First/next fit search by address, best/worst fit by size
+        by_address = policy in ('first', 'next')
+        self.tree = _MaxTree(total) if by_address else None
+        self.size_tree = None if by_address else _MaxTree(total + 1)
+        self.buckets = {}  # size -> heap of starts (negated for worst fit), may hold removed blocks
+        self._sign = -1 if policy == 'worst' else 1
+        self.counts = {}   # size -> number of free blocks of that size
+        self.allocated = {}
+        self.used = 0
+        self.cursor = 0
+        self._add_block(0, total)
+
+    def _add_block(self, start, size):
+        self.by_start[start] = size
+        self.by_end[start + size] = start
+        if self.tree is not None:
+            self.tree.set(start, size)
+            return
+        heapq.heappush(self.buckets.setdefault(size, []), self._sign * start)
+        self.counts[size] = self.counts.get(size, 0) + 1
+        if self.counts[size] == 1:
+            self.size_tree.set(size, size)
+
+    def _remove_block(self, start):
+        size = self.by_start.pop(start)
+        del self.by_end[start + size]
+        if self.tree is not None:
+            self.tree.set(start, 0)
+            return size
+        count = self.counts[size] - 1
+        if count == 0:
+            del self.counts[size], self.buckets[size]
+            self.size_tree.set(size, 0)
+        else:
+            self.counts[size] = count
+            bucket = self.buckets[size]
+            if len(bucket) > 2 * count + 8:
+                # Too many removed blocks left behind: rebuild from the live ones
+                bucket[:] = [s for s in bucket if self.by_start.get(self._sign * s) == size]
+                heapq.heapify(bucket)
+        return size
+
+    def _pick_start(self, size):
+        """Start of the free block of exactly `size` units to use: the lowest (highest for worst fit)."""
+        bucket = self.buckets[size]
+        while self.by_start.get(self._sign * bucket[0]) != size:
+            heapq.heappop(bucket)
+        return self._sign * bucket[0]
+
+    def _find(self, size):
+        if self.policy == 'first':
+            return self.tree.find_first(size)
+        if self.policy == 'next':
+            start = self.tree.find_first(size, self.cursor)
+            return start if start is not None else self.tree.find_first(size)
+        if self.policy == 'best':
+            fit = self.size_tree.find_first(size)
+            return self._pick_start(fit) if fit is not None else None
+        # worst fit
+        largest = self.size_tree.tree[1]
+        return self._pick_start(largest) if largest and largest >= size else None
+
+    def alloc(self, size):
+        if size < 1:
+            raise ValueError(f"Allocation size must be at least 1, got {size}")
+        start = self._find(size)
+        if start is None:
+            return None
+        block = self._remove_block(start)
+        if block > size:
+            self._add_block(start + size, block - size)
+        self.allocated[start] = size
+        self.used += size
+        self.cursor = (start + size) % self.total
+        return start
+
+    def free(self, address):
+        size = self.allocated.pop(address)
+        self.used -= size
+        start, end = address, address + size
+        if end in self.by_start:
+            end += self._remove_block(end)
+        if start in self.by_end:
+            start = self.by_end[start]
+            self._remove_block(start)
+        self._add_block(start, end - start)
+
+    def stats(self):
+        free = self.total - self.used
+        largest = (self.tree or self.size_tree).tree[1]
+        return {
+            'free': free,
+            'largest_free': largest,
+            'free_blocks': len(self.by_start),
+            'external_fragmentation': 1 - largest / free if free else 0.0,
+            'internal_fragmentation': 0.0,
+        }
+
+
+class BuddyAllocator:
+    def __init__(self, max_order, min_order=0):
+        self.max_order = max_order
+        self.min_order = min_order
+        self.total = 1 << max_order
+        self.free_lists = [set() for _ in range(max_order + 1)]
+        self.free_lists[max_order].add(0)
+        self.allocated = {}  # address -> (order, requested size)
+        self.granted = 0
+        self.requested = 0
+
+    def _order(self, size):
+        return max(self.min_order, (size - 1).bit_length())
+
+    def alloc(self, size):
+        if size < 1:
+            raise ValueError(f"Allocation size must be at least 1, got {size}")
+        order = self._order(size)
+        if order > self.max_order:
+            return None
+        k = order
+        while k <= self.max_order and not self.free_lists[k]:
+            k += 1
+        if k > self.max_order:
+            return None
+        address = self.free_lists[k].pop()
+        # Split down, returning the upper halves to the free lists
+        while k > order:
+            k -= 1
+            self.free_lists[k].add(address + (1 << k))
+        self.allocated[address] = (order, size)
+        self.granted += 1 << order
+        self.requested += size
+        return address
+
+    def free(self, address):
+        order, size = self.allocated.pop(address)
+        self.granted -= 1 << order
+        self.requested -= size
+        while order < self.max_order:
+            buddy = address ^ (1 << order)
+            if buddy not in self.free_lists[order]:
+                break
+            self.free_lists[order].remove(buddy)
+            address = min(address, buddy)
+            order += 1
+        self.free_lists[order].add(address)
+
+    def stats(self):
+        granted, requested = self.granted, self.requested
+        free = self.total - granted
+        largest = next((1 << k for k in range(self.max_order, -1, -1) if self.free_lists[k]), 0)
+        return {
+            'free': free,
+            'largest_free': largest,
+            'free_blocks': sum(len(s) for s in self.free_lists),
+            'external_fragmentation': 1 - largest / free if free else 0.0,
+            'internal_fragmentation': 1 - requested / granted if granted else 0.0,
+        }
+
+
+class SlabAllocator:
+    """
+    Objects up to the largest size class are served from per-class caches of
+    slabs (`slab_order`-sized buddy blocks); larger requests go straight to
+    the buddy allocator.
+    """
+
+    def __init__(self, max_order, slab_order=6, size_classes=(1, 2, 4, 8, 16, 32)):
+        self.buddy = BuddyAllocator(max_order)
+        self.slab_size = 1 << slab_order
+        self.size_classes = sorted(size_classes)
+        if self.size_classes[-1] > self.slab_size:
+            raise ValueError("Size classes must fit in a slab")
+        self.partial = {c: set() for c in self.size_classes}  # class -> slabs with free objects
+        self.slab_free = {}   # slab address -> free object addresses (stack)
+        self.slab_class = {}  # slab address -> size class
+        self.allocated = {}   # object address -> requested size (slab objects only)
+        self.requested = 0
+
+    def _class_for(self, size):
+        i = bisect_left(self.size_classes, size)
+        return self.size_classes[i] if i < len(self.size_classes) else None
+
+    def alloc(self, size):
+        if size < 1:
+            raise ValueError(f"Allocation size must be at least 1, got {size}")
+        cls = self._class_for(size)
+        if cls is None:
+            return self.buddy.alloc(size)
+        partial = self.partial[cls]
+        if not partial:
+            slab = self.buddy.alloc(self.slab_size)
+            if slab is None:
+                return None
+            self.slab_free[slab] = list(range(slab + self.slab_size - cls, slab - 1, -cls))
+            self.slab_class[slab] = cls
+            partial.add(slab)
+        slab = next(iter(partial))
+        objects = self.slab_free[slab]
+        address = objects.pop()
+        if not objects:
+            partial.discard(slab)
+        self.allocated[address] = size
+        self.requested += size
+        return address
+
+    def free(self, address):
+        if address not in self.allocated:
+            self.buddy.free(address)
+            return
+        self.requested -= self.allocated.pop(address)
+        slab = address - address % self.slab_size
+        cls = self.slab_class[slab]
+        objects = self.slab_free[slab]
+        objects.append(address)
+        self.partial[cls].add(slab)
+        if len(objects) == self.slab_size // cls:
+            # Slab is empty again: give it back
+            self.partial[cls].discard(slab)
+            del self.slab_free[slab], self.slab_class[slab]
+            self.buddy.free(slab)
+
+    def stats(self):
+        stats = self.buddy.stats()
+        # Unused object space in slabs counts as internal fragmentation
+        granted = self.buddy.granted
+        used = self.buddy.requested - len(self.slab_class) * self.slab_size + self.requested
+        stats['internal_fragmentation'] = 1 - used / granted if granted else 0.0
+        stats['slabs'] = len(self.slab_class)
+        return stats
+
+
+def make_allocator(kind, total_order=20):
+    """Create an allocator by name (one of ALLOCATORS) managing 2**total_order units."""
+    if kind.endswith('-fit'):
+        return FreeListAllocator(1 << total_order, kind[:-4])
+    if kind == 'buddy':
+        return BuddyAllocator(total_order)
+    if kind == 'slab':
+        return SlabAllocator(total_order)
+    raise ValueError(f"Unknown allocator: {kind}")
+
+
+def replay(allocator, ops, sample_every=1000):
+    """
+    Replay an alloc/free trace.
+
+    Args:
+        allocator: Any allocator from this module.
+        ops (iterable): ('alloc', id, size) or ('free', id) tuples.
+        sample_every (int): Fragmentation is sampled every this many ops.
+
+    Returns:
+        dict: operation and failure counts, mean cost per operation in
+        microseconds, peak and final external fragmentation, final stats.
+    """
+    addresses = {}
+    count = failures = 0
+    peak_fragmentation = 0.0
+    elapsed = 0.0
+
+    for op in ops:
+        start = time.perf_counter()
+        if op[0] == 'alloc':
+            address = allocator.alloc(op[2])
+            if address is None:
+                failures += 1
+            else:
+                addresses[op[1]] = address
+        else:
+            address = addresses.pop(op[1], None)
+            if address is not None:
+                allocator.free(address)
+        elapsed += time.perf_counter() - start
+        count += 1
+        if count % sample_every == 0:
+            peak_fragmentation = max(peak_fragmentation, allocator.stats()['external_fragmentation'])
+
+    final = allocator.stats()
+    return {
+        'operations': count,
+        'failed_allocations': failures,
+        'us_per_op': elapsed / count * 1e6 if count else 0.0,
+        'peak_external_fragmentation': max(peak_fragmentation, final['external_fragmentation']),
+        **final,
+    }
@@ -0,0 +1,113 @@
+# memory_analysis.py
+"""
+Page-fault curves over every frame count.
+
+LRU is a stack algorithm: a reference hits with f frames exactly when its
+LRU stack distance is <= f. One pass that computes all stack distances
+(Mattson et al.) therefore yields the fault count for every f at once.
+FIFO has no such property, so it is simulated once per frame count,
+spread over worker processes, and checked for Belady's anomaly.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from memorymanagmet import fifo
+
+
+def lru_stack_distances(pages):
+    """
+    LRU stack distance of every reference (0 for a first reference).
+
+    A Fenwick tree over reference times marks the latest access of each
+    page; the distance of a re-reference is the number of marks after the
+    page's previous access, plus one. O(n log n).
+    """
+    pages = pages.tolist() if isinstance(pages, np.ndarray) else list(pages)
+    n = len(pages)
+    tree = [0] * (n + 1)
+    last = {}
+    distances = [0] * n
+    marked = 0  # marks currently in the tree
+
+    for i, page in enumerate(pages):
+        prev = last.get(page)
+        if prev is not None:
+            # Marks at positions <= prev
+            j = prev + 1
+            before = 0
+            while j > 0:
+                before += tree[j]
+                j -= j & -j
+            distances[i] = marked - before + 1
+            # Unmark the previous access
+            j = prev + 1
+            while j <= n:
+                tree[j] -= 1
+                j += j & -j
+            marked -= 1
+        j = i + 1
+        while j <= n:
+            tree[j] += 1
+            j += j & -j
+        marked += 1
+        last[page] = i
+
+    return np.array(distances, dtype=np.int64)
+
+
+def lru_fault_curve(pages, max_frames=None):
+    """
+    LRU faults for every frame count 1..max_frames from a single pass.
+
+    Returns:
+        numpy.ndarray: faults[k] is the fault count with k + 1 frames.
+    """
+    distances = lru_stack_distances(pages)
+    if max_frames is None:
+        max_frames = max(1, int(distances.max(initial=0)))
+    hist = np.bincount(distances[distances > 0], minlength=max_frames + 1)[:max_frames + 1]
+    # Hits with f frames = re-references at distance <= f
+    hits = np.cumsum(hist)[1:]
+    return len(distances) - hits
+
+
+_shared_pages = None
+
+
+def _init_worker(pages):
+    global _shared_pages
+    _shared_pages = pages
+
+
+def _fifo_faults(frames):
+    return fifo(_shared_pages, frames, trace=False)[0]
+
+
+def fifo_fault_curve(pages, frame_counts, workers=None):
+    """
+    FIFO faults for each entry of `frame_counts`.
+
+    The reference string is shipped to each worker once (pool initializer);
+    with workers=1 everything runs in this process.
+    """
+    frame_counts = list(frame_counts)
+    if workers == 1 or len(frame_counts) < 2:
+        return np.array([fifo(pages, f, trace=False)[0] for f in frame_counts], dtype=np.int64)
+    pages = pages.tolist() if isinstance(pages, np.ndarray) else list(pages)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pages,)) as pool:
+        return np.fromiter(pool.map(_fifo_faults, frame_counts), dtype=np.int64, count=len(frame_counts))
+
+
+def belady_anomalies(frame_counts, faults):
+    """
+    Pairs of consecutive frame counts where adding frames increased faults.
+
+    Returns:
+        list: (frames, faults, more_frames, more_faults) tuples.
+    """
+    anomalies = []
+    for k in range(1, len(frame_counts)):
+        if faults[k] > faults[k - 1]:
+            anomalies.append((frame_counts[k - 1], int(faults[k - 1]), frame_counts[k], int(faults[k])))
+    return anomalies
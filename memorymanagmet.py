@@ -1,3 +1,8 @@
+import heapq
+from collections import OrderedDict, deque
+
+import numpy as np
+
 def logical_to_physical_paging(logical_address, page_size, base_address):
     page_number = logical_address // page_size
     offset = logical_address % page_size
@@ -6,70 +11,355 @@ def logical_to_physical_paging(logical_address, page_size, base_address):
 
 def segmentation_translation(segments, seg_name, offset):
     base, limit = segments.get(seg_name, (0, 0))
-    if offset > (limit - base):
-        return None  # Invalid offset
+    if not 0 <= offset < limit:
+        return None  # Invalid offset: limit is the segment length
     return base + offset
 
-def fifo(pages, frame_size):
-    frame = []
+def fifo(pages, frame_size, trace=True):
+    """
+    FIFO page replacement in O(1) per reference.
+
+    trace=True records the frame contents after every reference (in load
+    order), trace='delta' records only faults as (step, slot, page, evicted)
+    with evicted None while free frames remain, and trace=False records
+    nothing so the memory used does not grow with the reference string.
+    """
+    resident = {}    # page -> frame slot
+    order = deque()  # resident pages, oldest first
     faults = 0
-    page_trace = []
-    
-    for page in pages:
-        if page not in frame:
+    page_trace = [] if trace else None
+
+    for step, page in enumerate(pages):
+        if page not in resident:
+            faults += 1
+            if len(order) < frame_size:
+                slot, evicted = len(order), None
+            else:
+                evicted = order.popleft()
+                slot = resident.pop(evicted)
+            order.append(page)
+            resident[page] = slot
+            if trace == 'delta':
+                page_trace.append((step, slot, page, evicted))
+        if trace is True:
+            page_trace.append(list(order))
+
+    return faults, page_trace
+
+def lru(pages, frame_size, trace=True):
+    """
+    LRU page replacement in O(1) per reference (see `fifo` for `trace`).
+    """
+    loaded = {}              # page -> frame slot, in load order
+    recency = OrderedDict()  # resident pages, least recently used first
+    faults = 0
+    page_trace = [] if trace else None
+
+    for step, page in enumerate(pages):
+        if page in recency:
+            recency.move_to_end(page)
+        else:
+            faults += 1
+            if len(loaded) < frame_size:
+                slot, evicted = len(loaded), None
+            else:
+                evicted, _ = recency.popitem(last=False)
+                slot = loaded.pop(evicted)
+            loaded[page] = slot
+            recency[page] = None
+            if trace == 'delta':
+                page_trace.append((step, slot, page, evicted))
+        if trace is True:
+            page_trace.append(list(loaded))
+
+    return faults, page_trace
+
+def next_use_index(pages):
+    """
+    For every position i, the position of the next reference to pages[i]
+    (len(pages) if it is never referenced again). One stable sort, no loops.
+    """
+    n = len(pages)
+    _, codes = np.unique(np.asarray(pages), return_inverse=True)
+    codes = codes.ravel()
+    order = np.argsort(codes, kind='stable')
+    next_use = np.full(n, n, dtype=np.int64)
+    if n > 1:
+        same = codes[order[1:]] == codes[order[:-1]]
+        next_use[order[:-1][same]] = order[1:][same]
+    return next_use
+
+def optimal(pages, frame_size, trace=True, next_use=None):
+    """
+    Belady's optimal replacement in O(n log f).
+
+    Next uses are precomputed (or passed in as `next_use`, the output of
+    `next_use_index`), and resident pages sit in a max-heap keyed by their
+    next use (stale entries are skipped lazily). Among pages that are never
+    used again the lowest frame slot is evicted, as before.
+    See `fifo` for `trace`.
+    """
+    pages = pages.tolist() if isinstance(pages, np.ndarray) else list(pages)
+    if next_use is None:
+        next_use = next_use_index(pages) if pages else []
+    next_use = next_use.tolist() if isinstance(next_use, np.ndarray) else list(next_use)
+    frame = []     # slot -> page
+    slot_of = {}   # page -> slot
+    upcoming = {}  # page -> its current next use
+    heap = []      # (-next_use, slot, page)
+    faults = 0
+    page_trace = [] if trace else None
+
+    for i, page in enumerate(pages):
+        if page in slot_of:
+            slot = slot_of[page]
+        else:
             faults += 1
             if len(frame) < frame_size:
+                slot, evicted = len(frame), None
                 frame.append(page)
             else:
-                frame.pop(0)
-                frame.append(page)
-        page_trace.append(frame.copy())
-    
+                while True:
+                    neg_use, slot, evicted = heapq.heappop(heap)
+                    if frame[slot] == evicted and upcoming[evicted] == -neg_use:
+                        break
+                del slot_of[evicted], upcoming[evicted]
+                frame[slot] = page
+            slot_of[page] = slot
+            if trace == 'delta':
+                page_trace.append((i, slot, page, evicted))
+
+        upcoming[page] = next_use[i]
+        heapq.heappush(heap, (-next_use[i], slot, page))
+        if len(heap) > 4 * frame_size + 64:
+            # Drop stale entries so the heap stays O(frames)
+            heap = [(-upcoming[p], s, p) for p, s in slot_of.items()]
+            heapq.heapify(heap)
+        if trace is True:
+            page_trace.append(frame.copy())
+
     return faults, page_trace
 
-def lru(pages, frame_size):
-    frame = []
-    history = []
+def clock(pages, frame_size, trace=True):
+    """
+    Clock (second chance): a circular array of frames with reference bits.
+    See `fifo` for `trace`.
+    """
+    frame = []    # slot -> page
+    ref_bit = []  # slot -> referenced since the hand last passed
+    slot_of = {}
+    hand = 0
     faults = 0
-    page_trace = []
-    
-    for page in pages:
-        if page not in frame:
+    page_trace = [] if trace else None
+
+    for step, page in enumerate(pages):
+        slot = slot_of.get(page)
+        if slot is not None:
+            ref_bit[slot] = True
+        else:
             faults += 1
             if len(frame) < frame_size:
+                slot, evicted = len(frame), None
                 frame.append(page)
+                ref_bit.append(False)
             else:
-                lru_page = history.pop(0)
-                frame.remove(lru_page)
+                while ref_bit[hand]:
+                    ref_bit[hand] = False
+                    hand = (hand + 1) % frame_size
+                slot, evicted = hand, frame[hand]
+                del slot_of[evicted]
+                frame[slot] = page
+                ref_bit[slot] = False
+                hand = (hand + 1) % frame_size
+            slot_of[page] = slot
+            if trace == 'delta':
+                page_trace.append((step, slot, page, evicted))
+        if trace is True:
+            page_trace.append(frame.copy())
+
+    return faults, page_trace
+
+def lfu(pages, frame_size, trace=True):
+    """
+    LFU in O(1): pages live in per-frequency buckets (least recently used
+    first within a bucket) and the minimum frequency is tracked.
+    See `fifo` for `trace`.
+    """
+    frame = []    # slot -> page
+    slot_of = {}
+    freq = {}     # page -> reference count while resident
+    buckets = {}  # count -> OrderedDict of pages
+    min_freq = 0
+    faults = 0
+    page_trace = [] if trace else None
+
+    for step, page in enumerate(pages):
+        if page in freq:
+            f = freq[page]
+            bucket = buckets[f]
+            del bucket[page]
+            if not bucket:
+                del buckets[f]
+                if min_freq == f:
+                    min_freq = f + 1
+            freq[page] = f + 1
+            buckets.setdefault(f + 1, OrderedDict())[page] = None
+        else:
+            faults += 1
+            if len(frame) < frame_size:
+                slot, evicted = len(frame), None
                 frame.append(page)
+            else:
+                bucket = buckets[min_freq]
+                evicted, _ = bucket.popitem(last=False)
+                if not bucket:
+                    del buckets[min_freq]
+                del freq[evicted]
+                slot = slot_of.pop(evicted)
+                frame[slot] = page
+            slot_of[page] = slot
+            freq[page] = 1
+            buckets.setdefault(1, OrderedDict())[page] = None
+            min_freq = 1
+            if trace == 'delta':
+                page_trace.append((step, slot, page, evicted))
+        if trace is True:
+            page_trace.append(frame.copy())
+
+    return faults, page_trace
+
+def arc(pages, frame_size, trace=True):
+    """
+    Adaptive Replacement Cache (Megiddo & Modha).
+
+    T1/T2 hold resident pages seen once / more than once, B1/B2 are ghost
+    lists of their recent evictions, and the target size p of T1 adapts on
+    ghost hits. All lists are OrderedDicts, so each reference is O(1).
+    See `fifo` for `trace`.
+    """
+    c = frame_size
+    t1, t2, b1, b2 = OrderedDict(), OrderedDict(), OrderedDict(), OrderedDict()
+    p = 0.0
+    frame = []  # slot -> page
+    slot_of = {}
+    faults = 0
+    page_trace = [] if trace else None
+
+    def replace(in_b2):
+        """Evict from T1 or T2 into its ghost list; returns (evicted page, freed slot)."""
+        if t1 and (len(t1) > p or (in_b2 and len(t1) == p)):
+            victim, _ = t1.popitem(last=False)
+            b1[victim] = None
+        else:
+            victim, _ = t2.popitem(last=False)
+            b2[victim] = None
+        return victim, slot_of.pop(victim)
+
+    for step, page in enumerate(pages):
+        if page in t1:
+            del t1[page]
+            t2[page] = None
+        elif page in t2:
+            t2.move_to_end(page)
         else:
-            history.remove(page)
-        history.append(page)
-        page_trace.append(frame.copy())
-    
+            faults += 1
+            evicted = slot = None
+            if page in b1:
+                p = min(c, p + max(len(b2) / len(b1), 1))
+                del b1[page]
+                if len(t1) + len(t2) >= c:
+                    evicted, slot = replace(False)
+                t2[page] = None
+            elif page in b2:
+                p = max(0, p - max(len(b1) / len(b2), 1))
+                del b2[page]
+                if len(t1) + len(t2) >= c:
+                    evicted, slot = replace(True)
+                t2[page] = None
+            else:
+                if len(t1) + len(b1) >= c:
+                    if len(t1) < c:
+                        b1.popitem(last=False)
+                        if len(t1) + len(t2) >= c:
+                            evicted, slot = replace(False)
+                    else:
+                        evicted, _ = t1.popitem(last=False)
+                        slot = slot_of.pop(evicted)
+                elif len(t1) + len(t2) + len(b1) + len(b2) >= c:
+                    if len(t1) + len(t2) + len(b1) + len(b2) >= 2 * c:
+                        b2.popitem(last=False)
+                    if len(t1) + len(t2) >= c:
+                        evicted, slot = replace(False)
+                t1[page] = None
+
+            if slot is None:
+                slot = len(frame)
+                frame.append(page)
+            else:
+                frame[slot] = page
+            slot_of[page] = slot
+            if trace == 'delta':
+                page_trace.append((step, slot, page, evicted))
+        if trace is True:
+            page_trace.append(frame.copy())
+
     return faults, page_trace
 
-def optimal(pages, frame_size):
-    frame = []
+def two_q(pages, frame_size, trace=True, kin=None, kout=None):
+    """
+    2Q (Johnson & Shasha): new pages enter the FIFO A1in; pages referenced
+    again after leaving it (found in the ghost list A1out) are promoted to
+    the LRU list Am. Defaults follow the paper: |A1in| = frames / 4,
+    |A1out| = frames / 2. See `fifo` for `trace`.
+    """
+    kin = max(1, frame_size // 4) if kin is None else kin
+    kout = max(1, frame_size // 2) if kout is None else kout
+    a1in, a1out, am = OrderedDict(), OrderedDict(), OrderedDict()
+    frame = []  # slot -> page
+    slot_of = {}
     faults = 0
-    page_trace = []
-    
-    for i in range(len(pages)):
-        page = pages[i]
-        if page not in frame:
+    page_trace = [] if trace else None
+
+    for step, page in enumerate(pages):
+        if page in am:
+            am.move_to_end(page)
+        elif page in a1in:
+            pass
+        else:
             faults += 1
+            evicted = None
             if len(frame) < frame_size:
+                slot = len(frame)
                 frame.append(page)
             else:
-                future = pages[i+1:]
-                index = []
-                for f in frame:
-                    if f in future:
-                        index.append(future.index(f))
-                    else:
-                        index.append(float('inf'))
-                victim = index.index(max(index))
-                frame[victim] = page
-        page_trace.append(frame.copy())
-    
-    return faults, page_trace
\ No newline at end of file
+                if len(a1in) > kin or not am:
+                    evicted, _ = a1in.popitem(last=False)
+                    a1out[evicted] = None
+                    if len(a1out) > kout:
+                        a1out.popitem(last=False)
+                else:
+                    evicted, _ = am.popitem(last=False)
+                slot = slot_of.pop(evicted)
+                frame[slot] = page
+            slot_of[page] = slot
+            if page in a1out:
+                del a1out[page]
+                am[page] = None
+            else:
+                a1in[page] = None
+            if trace == 'delta':
+                page_trace.append((step, slot, page, evicted))
+        if trace is True:
+            page_trace.append(frame.copy())
+
+    return faults, page_trace
+
+REPLACEMENT_ALGORITHMS = {
+    "FIFO": fifo,
+    "LRU": lru,
+    "Optimal": optimal,
+    "Clock": clock,
+    "LFU": lfu,
+    "ARC": arc,
+    "2Q": two_q,
+}
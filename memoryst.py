@@ -1,12 +1,9 @@
 import streamlit as st
 
 
-from memorymanagmet import (
-    logical_to_physical_paging,
-    segmentation_translation,
-    fifo,
-    lru
-)
+from engine import simulate_replacement, translate_paging, translate_segment
+from memorymanagmet import REPLACEMENT_ALGORITHMS
+from trace_table import PAGE_ROWS
 
 st.set_page_config(page_title="Memory Management Simulator", layout="wide")
 st.title("🧠 Linux System Memory Management Simulator")
@@ -22,7 +19,7 @@ if module == "Paging":
     base_address = st.number_input("Enter Base Physical Address", min_value=0, value=1000)
 
     if st.button("Translate Paging"):
-        physical_address, page_number, offset = logical_to_physical_paging(logical_address, page_size, base_address)
+        physical_address, page_number, offset = translate_paging(logical_address, page_size, base_address).as_tuple()
         st.success(f"Page Number: {page_number}")
         st.success(f"Offset: {offset}")
         st.success(f"Physical Address: {physical_address}")
@@ -45,11 +42,11 @@ elif module == "Segmentation":
     offset = st.number_input("Enter Offset", min_value=0)
 
     if st.button("Translate Segmentation"):
-        result = segmentation_translation(segments, selected_seg, offset)
-        if result is None:
+        result = translate_segment(segments, selected_seg, offset)
+        if not result.valid:
             st.error("Invalid offset! Exceeds segment limit.")
         else:
-            st.success(f"Physical Address: {result}")
+            st.success(f"Physical Address: {result.physical_address}")
 
 # -------------------- Virtual Memory --------------------
 elif module == "Virtual Memory":
@@ -58,11 +55,15 @@ elif module == "Virtual Memory":
     page_ref = st.text_input("Enter Page Reference String (comma-separated)", "7,0,1,2,0,3,0,4,2,3,0,3,2")
     pages = [int(x.strip()) for x in page_ref.split(",") if x.strip().isdigit()]
     num_frames = st.number_input("Number of Frames", min_value=1, value=3)
-    algo = st.selectbox("Replacement Algorithm", ["FIFO", "LRU"])
+    algo = st.selectbox("Replacement Algorithm", list(REPLACEMENT_ALGORITHMS))
 
     if st.button("Simulate Virtual Memory"):
-        if algo == "FIFO":
-            faults = fifo(pages, num_frames)
-        else:
-            faults = lru(pages, num_frames)
-        st.success(f"Total Page Faults using {algo}: {faults}")
+        result = simulate_replacement(algo, pages, int(num_frames), trace=True)
+        st.success(f"Total Page Faults using {algo}: {result.faults}")
+        st.write(f"Page Hits: {result.hits} | Fault Ratio: {result.fault_ratio * 100:.2f}%")
+
+        import pandas as pd
+        df = pd.DataFrame(result.trace.display_rows(0, PAGE_ROWS))
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        if len(pages) > PAGE_ROWS:
+            st.caption(f"First {PAGE_ROWS} of {len(pages)} references shown.")
@@ -0,0 +1,196 @@
+# osim.py
+"""
+Headless batch runner for the simulators.
+
+Usage:
+    python -m osim run jobs.json [--workers 4] [--timeout 30] [--output results.ndjson]
+    python -m osim tasks
+
+A job file is a JSON list of jobs, an object with a "jobs" list, or one
+JSON job per line ("-" reads stdin). A job looks like
+
+    {"id": "rr-q4", "task": "cpu.round_robin",
+     "args": {"processes": [...], "time_quantum": 4}, "timeout": 10}
+
+Every job runs in its own worker process (at most --workers at a time) and
+is killed when it exceeds its timeout. Results are written as one JSON
+object per line, in completion order, as soon as each job finishes:
+
+    {"id": ..., "task": ..., "status": "ok" | "error" | "timeout" | "crashed",
+     "seconds": ..., "result": ... | "error": ...}
+
+Only the simulator modules a batch needs are imported (never Streamlit or
+matplotlib), so startup stays fast.
+"""
+import argparse
+import importlib
+import json
+import multiprocessing as mp
+import sys
+import time
+from multiprocessing.connection import wait
+
+# task name -> (module, function)
+TASKS = {
+    'cpu.fcfs': ('cpu_scheduler', 'fcfs_scheduling'),
+    'cpu.round_robin': ('cpu_scheduler', 'round_robin_scheduling'),
+    'cpu.priority': ('cpu_scheduler', 'priority_scheduling'),
+    'disk.fcfs': ('disk_scheduler', 'fcfs_disk_scheduling'),
+    'disk.sstf': ('disk_scheduler', 'sstf_disk_scheduling'),
+    'disk.scan': ('disk_scheduler', 'scan_disk_scheduling'),
+    'disk.c_scan': ('disk_scheduler', 'c_scan_disk_scheduling'),
+    'disk.look': ('disk_scheduler', 'look_disk_scheduling'),
+    'disk.c_look': ('disk_scheduler', 'c_look_disk_scheduling'),
+    'memory.paging': ('memorymanagmet', 'logical_to_physical_paging'),
+    'memory.segmentation': ('memorymanagmet', 'segmentation_translation'),
+    'memory.fifo': ('memorymanagmet', 'fifo'),
+    'memory.lru': ('memorymanagmet', 'lru'),
+    'memory.optimal': ('memorymanagmet', 'optimal'),
+    'memory.clock': ('memorymanagmet', 'clock'),
+    'memory.lfu': ('memorymanagmet', 'lfu'),
+    'memory.arc': ('memorymanagmet', 'arc'),
+    'memory.two_q': ('memorymanagmet', 'two_q'),
+    'memory.replacement': ('engine', 'simulate_replacement'),
+    'process.bankers': ('processmanagment', 'bankers_algorithm'),
+    'process.detect_deadlock': ('processmanagment', 'detect_deadlock'),
+    'process.producer_consumer': ('processmanagment', 'producer_consumer_simulation'),
+    'process.readers_writers': ('processmanagment', 'readers_writers_simulation'),
+}
+DEFAULT_TIMEOUT = 60.0
+
+
+def resolve(task):
+    if task not in TASKS:
+        raise KeyError(f"Unknown task: {task}")
+    module, name = TASKS[task]
+    return getattr(importlib.import_module(module), name)
+
+
+def _to_json(value):
+    """json.dumps fallback for NumPy values and other simulator return types."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if hasattr(value, 'as_tuple'):
+        return value.as_tuple()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def load_jobs(path):
+    """Read jobs from a JSON / NDJSON file ('-' for stdin) and fill in defaults."""
+    text = sys.stdin.read() if path == '-' else open(path).read()
+    stripped = text.lstrip()
+    if stripped.startswith('[') or stripped.startswith('{"jobs"') or stripped.startswith('{ "jobs"'):
+        data = json.loads(text)
+        jobs = data['jobs'] if isinstance(data, dict) else data
+    else:
+        jobs = [json.loads(line) for line in text.splitlines() if line.strip()]
+    for i, job in enumerate(jobs):
+        job.setdefault('id', str(i))
+        job.setdefault('args', {})
+    return jobs
+
+
+def _run_job(conn, task, args):
+    start = time.perf_counter()
+    try:
+        fn = resolve(task)
+        result = fn(*args) if isinstance(args, list) else fn(**args)
+        payload = json.dumps({'status': 'ok', 'seconds': time.perf_counter() - start, 'result': result},
+                             default=_to_json)
+    except Exception as e:
+        payload = json.dumps({'status': 'error', 'seconds': time.perf_counter() - start,
+                              'error': f"{type(e).__name__}: {e}"})
+    conn.send_bytes(payload.encode())
+    conn.close()
+
+
+def run_jobs(jobs, workers=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Run jobs in worker processes, at most `workers` at a time.
+
+    Yields:
+        dict: One result per job, in completion order.
+    """
+    ctx = mp.get_context()
+    workers = workers or mp.cpu_count()
+    # Import the needed modules once so forked workers inherit them
+    if ctx.get_start_method() == 'fork':
+        for module in {TASKS[job['task']][0] for job in jobs if job.get('task') in TASKS}:
+            importlib.import_module(module)
+
+    pending = list(reversed(jobs))
+    running = {}  # connection -> (job, process, deadline, start)
+    while pending or running:
+        while pending and len(running) < workers:
+            job = pending.pop()
+            if job.get('task') not in TASKS:
+                yield {'id': job['id'], 'task': job.get('task'), 'status': 'error',
+                       'seconds': 0.0, 'error': f"Unknown task: {job.get('task')}"}
+                continue
+            reader, writer = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_run_job, args=(writer, job['task'], job['args']), daemon=True)
+            proc.start()
+            writer.close()
+            start = time.monotonic()
+            running[reader] = (job, proc, start + float(job.get('timeout', timeout)), start)
+
+        if not running:
+            continue
+        now = time.monotonic()
+        next_deadline = min(deadline for _, _, deadline, _ in running.values())
+        for conn in wait(list(running), timeout=max(0.0, next_deadline - now)):
+            job, proc, _, start = running.pop(conn)
+            try:
+                result = json.loads(conn.recv_bytes())
+            except EOFError:
+                proc.join()
+                result = {'status': 'crashed', 'seconds': time.monotonic() - start,
+                          'error': f"worker exited with code {proc.exitcode}"}
+            conn.close()
+            proc.join()
+            yield {'id': job['id'], 'task': job['task'], **result}
+
+        now = time.monotonic()
+        for conn, (job, proc, deadline, start) in list(running.items()):
+            if now >= deadline:
+                proc.kill()
+                proc.join()
+                conn.close()
+                del running[conn]
+                yield {'id': job['id'], 'task': job['task'], 'status': 'timeout',
+                       'seconds': now - start, 'error': f"exceeded {deadline - start:g} s"}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='osim', description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    run = sub.add_parser('run', help='Run a batch of jobs')
+    run.add_argument('jobs', help='Job file (JSON list, {"jobs": [...]} or NDJSON; - for stdin)')
+    run.add_argument('--workers', type=int, default=None, help='Concurrent worker processes (default: CPU count)')
+    run.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Default per-job timeout in seconds')
+    run.add_argument('--output', help='Write NDJSON here instead of stdout')
+    sub.add_parser('tasks', help='List available tasks')
+    args = parser.parse_args(argv)
+
+    if args.command == 'tasks':
+        for name, (module, fn) in TASKS.items():
+            print(f"{name:<28} {module}.{fn}")
+        return 0
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    failed = 0
+    try:
+        for result in run_jobs(load_jobs(args.jobs), args.workers, args.timeout):
+            failed += result['status'] != 'ok'
+            out.write(json.dumps(result, default=_to_json) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
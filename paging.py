@@ -0,0 +1,196 @@
+# paging.py
+"""
+Batch address translation: vectorized paging arithmetic, a multi-level
+page-table model and a set-associative TLB simulator for address traces.
+"""
+import numpy as np
+
+
+def translate_paging_batch(logical_addresses, page_size, base_address):
+    """
+    Vectorized `logical_to_physical_paging` over an array of logical addresses.
+
+    Returns:
+        tuple: (physical_addresses, page_numbers, offsets) as int64 arrays.
+    """
+    logical = np.asarray(logical_addresses, dtype=np.int64)
+    page_numbers, offsets = np.divmod(logical, page_size)
+    physical = base_address + page_numbers * page_size + offsets
+    return physical, page_numbers, offsets
+
+
+class MultiLevelPageTable:
+    """
+    Hierarchical page table, e.g. level_bits=(10, 10) with offset_bits=12 for
+    classic 32-bit x86 or (9, 9, 9, 9) for x86-64 four-level paging.
+
+    Mappings are kept as sorted VPN/PFN arrays so whole traces translate with
+    one searchsorted; the level structure is used to count page-table pages
+    and the memory accesses of a page walk.
+    """
+
+    def __init__(self, level_bits=(10, 10), offset_bits=12):
+        self.level_bits = tuple(level_bits)
+        self.offset_bits = offset_bits
+        self.vpn_bits = sum(self.level_bits)
+        if not self.level_bits or min(self.level_bits) < 1:
+            raise ValueError("Every level needs at least one bit")
+        if self.vpn_bits + offset_bits > 63:
+            raise ValueError("Virtual addresses must fit in 63 bits")
+        self._vpns = np.empty(0, dtype=np.int64)
+        self._pfns = np.empty(0, dtype=np.int64)
+
+    @property
+    def levels(self):
+        return len(self.level_bits)
+
+    @property
+    def page_size(self):
+        return 1 << self.offset_bits
+
+    def map(self, vpns, pfns):
+        """Map virtual page numbers to physical frame numbers (later mappings win)."""
+        vpns = np.concatenate((self._vpns, np.asarray(vpns, dtype=np.int64)))
+        pfns = np.concatenate((self._pfns, np.asarray(pfns, dtype=np.int64)))
+        if len(vpns) and (vpns.min() < 0 or vpns.max() >= 1 << self.vpn_bits):
+            raise ValueError(f"Virtual page numbers must fit in {self.vpn_bits} bits")
+        # Keep the last mapping of each VPN: unique on the reversed arrays
+        uniq, idx = np.unique(vpns[::-1], return_index=True)
+        self._vpns = uniq
+        self._pfns = pfns[::-1][idx]
+
+    def split(self, addresses):
+        """Per-level table indices (n x levels) and page offsets of virtual addresses."""
+        addresses = np.asarray(addresses, dtype=np.int64)
+        offsets = addresses & (self.page_size - 1)
+        vpn = addresses >> self.offset_bits
+        indices = np.empty((len(addresses), self.levels), dtype=np.int64)
+        shift = self.vpn_bits
+        for level, bits in enumerate(self.level_bits):
+            shift -= bits
+            indices[:, level] = (vpn >> shift) & ((1 << bits) - 1)
+        return indices, offsets
+
+    def lookup(self, vpns):
+        """PFN of each VPN, or -1 where the page is not mapped."""
+        vpns = np.asarray(vpns, dtype=np.int64)
+        if len(self._vpns) == 0:
+            return np.full(len(vpns), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self._vpns, vpns), len(self._vpns) - 1)
+        return np.where(self._vpns[pos] == vpns, self._pfns[pos], -1)
+
+    def translate(self, addresses):
+        """
+        Translate virtual addresses.
+
+        Returns:
+            tuple: (physical addresses with -1 on a page fault, fault mask).
+        """
+        addresses = np.asarray(addresses, dtype=np.int64)
+        pfns = self.lookup(addresses >> self.offset_bits)
+        faults = pfns < 0
+        physical = np.where(faults, -1, (pfns << self.offset_bits) | (addresses & (self.page_size - 1)))
+        return physical, faults
+
+    def table_pages(self):
+        """Number of page-table pages allocated at each level for the current mappings."""
+        if len(self._vpns) == 0:
+            return [1] + [0] * (self.levels - 1)
+        counts = []
+        shift = self.vpn_bits
+        for bits in self.level_bits:
+            # One table per distinct VPN prefix above this level
+            counts.append(len(np.unique(self._vpns >> shift)))
+            shift -= bits
+        return counts
+
+
+class TLB:
+    """
+    Set-associative TLB with LRU replacement inside each set.
+
+    `entries` must be a multiple of `ways`; sets are indexed by the low bits
+    of the VPN.
+    """
+
+    def __init__(self, entries=64, ways=4):
+        if entries % ways:
+            raise ValueError("entries must be a multiple of ways")
+        self.entries = entries
+        self.ways = ways
+        self.num_sets = entries // ways
+        self.sets = [[] for _ in range(self.num_sets)]  # each: VPNs, most recent last
+
+    def flush(self):
+        self.sets = [[] for _ in range(self.num_sets)]
+
+    def simulate(self, vpns, mapped=None):
+        """
+        Run a VPN trace through the TLB and return a boolean hit array.
+
+        `mapped` (bool array, default all True) marks references whose page
+        the page table maps. The others always miss and are never cached,
+        since a walk that faults has no translation to install.
+
+        Runs of the same VPN are collapsed first (only the first reference of
+        a run can miss), so the Python loop sees one step per page change.
+        """
+        vpns = np.asarray(vpns, dtype=np.int64)
+        hits = np.ones(len(vpns), dtype=bool)
+        if mapped is not None:
+            mapped = np.asarray(mapped, dtype=bool)
+            hits[~mapped] = False
+            vpns = vpns[mapped]
+            positions = np.flatnonzero(mapped)
+        if len(vpns) == 0:
+            return hits
+        starts = np.flatnonzero(np.concatenate(([True], vpns[1:] != vpns[:-1])))
+        sets = self.sets
+        num_sets = self.num_sets
+        ways = self.ways
+
+        run_hits = np.empty(len(starts), dtype=bool)
+        for k, vpn in enumerate(vpns[starts].tolist()):
+            tlb_set = sets[vpn % num_sets]
+            if vpn in tlb_set:
+                tlb_set.remove(vpn)
+                run_hits[k] = True
+            else:
+                if len(tlb_set) >= ways:
+                    del tlb_set[0]
+                run_hits[k] = False
+            tlb_set.append(vpn)
+        hits[starts if mapped is None else positions[starts]] = run_hits
+        return hits
+
+
+def simulate_address_trace(addresses, page_table, tlb, memory_time=100.0, tlb_time=1.0):
+    """
+    Translate a whole virtual address trace through a TLB and page table.
+
+    Each TLB miss costs one page walk of `page_table.levels` memory accesses.
+    Effective access time = TLB lookup + memory access + miss rate x walk cost.
+
+    Returns:
+        dict: counts of references, TLB hits/misses, page walks, walk memory
+        accesses and page faults, plus hit rate and effective access time.
+    """
+    addresses = np.asarray(addresses, dtype=np.int64)
+    vpns = addresses >> page_table.offset_bits
+    mapped = page_table.lookup(vpns) >= 0
+    hits = tlb.simulate(vpns, mapped)
+    misses = int(len(hits) - np.count_nonzero(hits))
+    # Unmapped pages never enter the TLB: every reference walks and faults
+    faults = int(len(mapped) - np.count_nonzero(mapped))
+    n = len(addresses)
+    hit_rate = (n - misses) / n if n else 0.0
+    return {
+        "references": n,
+        "tlb_hits": n - misses,
+        "tlb_misses": misses,
+        "tlb_hit_rate": hit_rate,
+        "page_walks": misses,
+        "walk_memory_accesses": misses * page_table.levels,
+        "page_faults": faults,
+        "effective_access_time": tlb_time + memory_time + (1 - hit_rate) * page_table.levels * memory_time,
+    }
@@ -0,0 +1,291 @@
+# proc_sampler.py
+"""
+Per-process memory behaviour sampled straight from Linux procfs.
+
+Every tracked process keeps its /proc/<pid>/stat (and optionally
+smaps_rollup) file descriptor open between samples; each sample is one
+pread per file and counters are turned into deltas against the previous
+sample. That keeps a full sweep of thousands of PIDs well under a second.
+The open descriptors are capped (`fd_budget`, half the RLIMIT_NOFILE soft
+limit by default); files past the cap are opened, read and closed again.
+
+The samples can be exported as a page reference string for the
+replacement simulators in `memorymanagmet.py` (see `to_reference_string`).
+"""
+import os
+import time
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+PROC = '/proc'
+READ_SIZE = 1 << 14
+PAGE_KB = os.sysconf('SC_PAGE_SIZE') // 1024 if hasattr(os, 'sysconf') else 4
+VMSTAT_FIELDS = ('pgfault', 'pgmajfault', 'pswpin', 'pswpout', 'pgsteal_kswapd', 'pgscan_kswapd')
+
+SAMPLE_DTYPE = np.dtype([
+    ('pid', np.int32),
+    ('minflt', np.int64),     # minor faults since the previous sample
+    ('majflt', np.int64),     # major faults since the previous sample
+    ('cpu_ticks', np.int64),  # utime + stime ticks since the previous sample
+    ('rss_kb', np.int64),
+    ('working_set_kb', np.int64),  # smaps_rollup Referenced, -1 when not read
+])
+
+
+def available():
+    """True when procfs exposes the files this module reads."""
+    return os.path.exists(os.path.join(PROC, 'vmstat'))
+
+
+def fd_budget(share=0.5, default=512):
+    """Descriptors a sampler may keep open: `share` of the RLIMIT_NOFILE soft limit."""
+    if resource is None:
+        return default
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return default
+    return max(0, int(soft * share))
+
+
+def _read(fd):
+    # procfs regenerates the file on a read from offset 0
+    return os.pread(fd, READ_SIZE, 0)
+
+
+def _close_all(fds):
+    for fd, _ in fds.values():
+        os.close(fd)
+    fds.clear()
+
+
+def _parse_stat(data):
+    """(comm, minflt, majflt, utime + stime, rss pages) from /proc/<pid>/stat."""
+    close = data.rindex(b')')
+    comm = data[data.index(b'(') + 1:close].decode(errors='replace')
+    fields = data[close + 2:].split()
+    # fields[0] is field 3 (state) of proc(5)
+    return comm, int(fields[7]), int(fields[9]), int(fields[11]) + int(fields[12]), int(fields[21])
+
+
+def _parse_referenced(data):
+    """Referenced kB from smaps_rollup (pages touched since the last clear_refs)."""
+    start = data.find(b'\nReferenced:')
+    if start < 0:
+        return -1
+    return int(data[start + 12:data.index(b'kB', start)])
+
+
+def _parse_vmstat(data):
+    values = {}
+    for line in data.split(b'\n'):
+        name, _, value = line.partition(b' ')
+        name = name.decode()
+        if name in VMSTAT_FIELDS:
+            values[name] = int(value)
+    return values
+
+
+class ProcSampler:
+    """
+    Keeps procfs file handles open and samples every process on each call.
+
+    Args:
+        working_set_every (int): Read smaps_rollup on every n-th sample only
+            (0 disables it). smaps_rollup walks the page tables, so it is by
+            far the most expensive file; needs ptrace access for other users.
+        max_history (int): Number of samples kept in `history`.
+        max_open (int): Cap on cached descriptors (default `fd_budget()`).
+            The least recently read one is closed to make room, unless it
+            was already read in the current sample: then the file is read
+            without caching, so a sweep over more PIDs than the cap does not
+            evict its own descriptors.
+
+    Descriptors are also closed when the sampler is garbage collected.
+    """
+
+    def __init__(self, working_set_every=5, max_history=600, max_open=None):
+        self.working_set_every = working_set_every
+        self.max_history = max_history
+        self.max_open = fd_budget() if max_open is None else max_open
+        self.history = []  # (timestamp, interval, records)
+        self.names = {}
+        self._pids = set()
+        self._fds = OrderedDict()  # path -> (fd, sample it was last read in), least recent first
+        self._no_smaps = set()     # pids whose smaps_rollup is not readable
+        self._last = {}   # pid -> (minflt, majflt, ticks)
+        self._working_set = {}
+        self._vmstat_last = None
+        self._time = None
+        self._count = 0
+        weakref.finalize(self, _close_all, self._fds)
+
+    def close(self):
+        _close_all(self._fds)
+        self._pids.clear()
+
+    @property
+    def open_files(self):
+        return len(self._fds)
+
+    def _read_file(self, path):
+        """Read `path` through its cached descriptor, opening (and caching) it when needed."""
+        fds = self._fds
+        cached = fds.get(path)
+        if cached is not None:
+            fds[path] = (cached[0], self._count)
+            fds.move_to_end(path)
+            return _read(cached[0])
+        fd = os.open(path, os.O_RDONLY)
+        if fds and len(fds) >= self.max_open:
+            oldest = next(iter(fds.values()))
+            if oldest[1] < self._count:
+                os.close(fds.popitem(last=False)[1][0])
+        if len(fds) >= self.max_open:
+            try:
+                return _read(fd)
+            finally:
+                os.close(fd)
+        fds[path] = (fd, self._count)
+        return _read(fd)
+
+    def _forget(self, path):
+        cached = self._fds.pop(path, None)
+        if cached is not None:
+            os.close(cached[0])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _drop(self, pid):
+        self._pids.discard(pid)
+        self._forget(f'{PROC}/{pid}/stat')
+        self._forget(f'{PROC}/{pid}/smaps_rollup')
+        self._no_smaps.discard(pid)
+        self._last.pop(pid, None)
+        self._working_set.pop(pid, None)
+        self.names.pop(pid, None)
+
+    def _sync_pids(self):
+        pids = {int(name) for name in os.listdir(PROC) if name.isdigit()}
+        for pid in self._pids - pids:
+            self._drop(pid)
+        self._pids = pids
+
+    def sample(self):
+        """
+        Take one sample of every process.
+
+        Returns:
+            dict: 'time', 'interval' (seconds since the previous sample, None
+            on the first), 'processes' (SAMPLE_DTYPE array; counters of newly
+            seen processes are deltas from zero) and 'vmstat' deltas.
+        """
+        now = time.monotonic()
+        self._sync_pids()
+        read_ws = self.working_set_every and self._count % self.working_set_every == 0
+        records = np.empty(len(self._pids), dtype=SAMPLE_DTYPE)
+        n = 0
+
+        for pid in sorted(self._pids):
+            try:
+                comm, minflt, majflt, ticks, rss = _parse_stat(self._read_file(f'{PROC}/{pid}/stat'))
+            except (OSError, ValueError):
+                self._drop(pid)  # exited between listdir and read
+                continue
+            self.names[pid] = comm
+            prev = self._last.get(pid, (0, 0, 0))
+            self._last[pid] = (minflt, majflt, ticks)
+
+            if read_ws and pid not in self._no_smaps:
+                path = f'{PROC}/{pid}/smaps_rollup'
+                try:
+                    self._working_set[pid] = _parse_referenced(self._read_file(path))
+                except OSError:
+                    self._forget(path)
+                    self._no_smaps.add(pid)
+
+            records[n] = (pid, minflt - prev[0], majflt - prev[1], ticks - prev[2],
+                          rss * PAGE_KB, self._working_set.get(pid, -1))
+            n += 1
+
+        vmstat = {}
+        try:
+            current = _parse_vmstat(self._read_file(os.path.join(PROC, 'vmstat')))
+        except OSError:
+            current = None
+        if current is not None:
+            if self._vmstat_last is not None:
+                vmstat = {k: v - self._vmstat_last.get(k, v) for k, v in current.items()}
+            self._vmstat_last = current
+
+        interval = now - self._time if self._time is not None else None
+        self._time = now
+        self._count += 1
+        records = records[:n]
+        self.history.append((now, interval, records))
+        del self.history[:-self.max_history]
+        return {'time': now, 'interval': interval, 'processes': records, 'vmstat': vmstat}
+
+
+def fault_rates(sample):
+    """Per-process minor/major faults per second of one `ProcSampler.sample` result."""
+    records = sample['processes']
+    interval = sample['interval'] or 0.0
+    if not interval:
+        zeros = np.zeros(len(records))
+        return zeros, zeros.copy()
+    return records['minflt'] / interval, records['majflt'] / interval
+
+
+def to_reference_string(history, max_references=100_000, page_kb=PAGE_KB, seed=0):
+    """
+    Turn sampled fault counts into a page reference string.
+
+    procfs does not expose individual page references, so this synthesizes
+    one that matches the samples: in each interval, every process issues a
+    share of references proportional to its faults, drawn uniformly from
+    its own page range sized by its working set (RSS when the working set
+    was not read). Page numbers are disjoint between processes.
+
+    Args:
+        history (list): `ProcSampler.history` entries.
+        max_references (int): Length cap; fault counts are scaled down to fit.
+
+    Returns:
+        list: Page numbers for `fifo`, `lru` and `optimal`.
+    """
+    rng = np.random.default_rng(seed)
+    usable = [records[records['minflt'] + records['majflt'] > 0]
+              for _, interval, records in history if interval is not None]
+    total = sum(int((r['minflt'] + r['majflt']).sum()) for r in usable)
+    if total == 0:
+        return []
+    scale = min(1.0, max_references / total)
+
+    page_base = {}
+    next_base = 0
+    chunks = []
+    for records in usable:
+        counts = np.floor((records['minflt'] + records['majflt']) * scale).astype(np.int64)
+        footprint = np.where(records['working_set_kb'] > 0, records['working_set_kb'], records['rss_kb'])
+        pages = np.maximum(1, footprint // page_kb)
+        bases = np.empty(len(records), dtype=np.int64)
+        for i, (pid, size) in enumerate(zip(records['pid'].tolist(), pages.tolist())):
+            if pid not in page_base:
+                page_base[pid] = next_base
+                next_base += size
+            bases[i] = page_base[pid]
+        owner = np.repeat(np.arange(len(records)), counts)
+        refs = bases[owner] + (rng.random(len(owner)) * pages[owner]).astype(np.int64)
+        chunks.append(refs[rng.permutation(len(refs))])
+    return np.concatenate(chunks).tolist() if chunks else []
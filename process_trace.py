@@ -0,0 +1,227 @@
+# process_trace.py
+"""
+Capture real process CPU activity and replay it through the CPU schedulers.
+
+Trace file layout (little endian):
+    header:  magic b'PTRC', version (u16), sample interval (f32), start epoch (f64)
+    records: time offset s (f32), pid (u32), create_time (f64),
+             cpu seconds used since previous sample (f32),
+             voluntary / involuntary context switches since previous sample (u32, u32),
+             nice (i8)
+
+Only processes that consumed CPU during an interval are written, so an idle
+host produces almost nothing. Records are in time order, which lets replay
+stream the file straight into the scheduler cores.
+
+Usage:
+    python process_trace.py capture night.ptrace --duration 28800 --interval 1
+    python process_trace.py replay night.ptrace --from "2026-10-18 22:00" --to "2026-10-19 06:00"
+"""
+import argparse
+import math
+import struct
+import sys
+import time
+from datetime import datetime
+
+from cpu_scheduler import iter_fcfs, iter_priority, iter_round_robin
+
+MAGIC = b'PTRC'
+VERSION = 1
+HEADER = struct.Struct('<4sHfd')
+RECORD = struct.Struct('<fIdfIIb')
+READ_CHUNK = 1 << 16  # records per read
+
+
+def capture_process_trace(path, duration, interval=1.0):
+    """
+    Sample every process' cpu_times / num_ctx_switches each `interval` seconds
+    for `duration` seconds and append the per-interval deltas to `path`.
+
+    Returns the number of records written.
+    """
+    import psutil
+
+    start = time.time()
+    previous = {}
+    written = 0
+    attrs = ['pid', 'create_time', 'cpu_times', 'num_ctx_switches', 'nice']
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, interval, start))
+        next_tick = time.monotonic()
+        while True:
+            now = time.time()
+            offset = now - start
+            current = {}
+            for proc in psutil.process_iter(attrs):
+                info = proc.info
+                if info['cpu_times'] is None or info['create_time'] is None:
+                    continue  # access denied
+                # (pid, create_time) identifies a process across pid reuse
+                key = (info['pid'], info['create_time'])
+                cpu = info['cpu_times'].user + info['cpu_times'].system
+                ctx = info['num_ctx_switches']
+                vol, invol = (ctx.voluntary, ctx.involuntary) if ctx else (0, 0)
+                current[key] = (cpu, vol, invol)
+
+                prev = previous.get(key)
+                if prev is None:
+                    # First sighting: only CPU used after the process started is attributable
+                    prev = (0.0, 0, 0) if info['create_time'] >= start else (cpu, vol, invol)
+                cpu_delta = cpu - prev[0]
+                if cpu_delta <= 0:
+                    continue
+                nice = info['nice'] if isinstance(info['nice'], int) else 0
+                f.write(RECORD.pack(
+                    offset, info['pid'], info['create_time'], cpu_delta,
+                    max(0, vol - prev[1]), max(0, invol - prev[2]), max(-128, min(127, nice)),
+                ))
+                written += 1
+            previous = current
+
+            if offset >= duration:
+                break
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+    return written
+
+
+def read_trace_header(path):
+    with open(path, 'rb') as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: truncated trace header")
+    magic, version, interval, start = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} process trace")
+    return {'interval': interval, 'start': start}
+
+
+def iter_trace(path):
+    """Yield trace records as dicts, reading the file in fixed-size chunks."""
+    header = read_trace_header(path)
+    with open(path, 'rb') as f:
+        f.seek(HEADER.size)
+        while True:
+            chunk = f.read(RECORD.size * READ_CHUNK)
+            if not chunk:
+                break
+            usable = len(chunk) - len(chunk) % RECORD.size  # ignore a torn final record
+            for offset, pid, create_time, cpu, vol, invol, nice in RECORD.iter_unpack(chunk[:usable]):
+                yield {
+                    'time': header['start'] + offset,
+                    'pid': pid,
+                    'create_time': create_time,
+                    'cpu': cpu,
+                    'voluntary_ctx': vol,
+                    'involuntary_ctx': invol,
+                    'nice': nice,
+                }
+
+
+def trace_to_workload(records, tick=0.01, start=None, end=None):
+    """
+    Turn trace records into scheduler processes, lazily and in arrival order.
+
+    Every record becomes one CPU burst: it arrives at its sample time and needs
+    the CPU time it consumed, both measured in `tick` seconds. Priority follows
+    nice (-20 -> 1, 19 -> 40). Only records within [start, end] epoch seconds
+    are used.
+    """
+    origin = None
+    for seq, r in enumerate(records):
+        if start is not None and r['time'] < start:
+            continue
+        if end is not None and r['time'] > end:
+            break
+        if origin is None:
+            origin = r['time']
+        yield {
+            'pid': f"{r['pid']}#{seq}",
+            'arrival_time': int((r['time'] - origin) / tick),
+            'burst_time': max(1, math.ceil(r['cpu'] / tick)),
+            'priority': r['nice'] + 21,
+        }
+
+
+def _summarize(events):
+    jobs = 0
+    dispatches = 0
+    waiting_sum = turnaround_sum = 0
+    waiting_max = turnaround_max = 0
+    makespan = 0
+    for _, _, end, waiting, turnaround in events:
+        dispatches += 1
+        makespan = end
+        if turnaround is not None:
+            jobs += 1
+            waiting_sum += waiting
+            turnaround_sum += turnaround
+            waiting_max = max(waiting_max, waiting)
+            turnaround_max = max(turnaround_max, turnaround)
+    return {
+        'jobs': jobs,
+        'dispatches': dispatches,
+        'makespan': makespan,
+        'avg_waiting': waiting_sum / jobs if jobs else 0,
+        'max_waiting': waiting_max,
+        'avg_turnaround': turnaround_sum / jobs if jobs else 0,
+        'max_turnaround': turnaround_max,
+    }
+
+
+def replay_trace(path, algorithm='round_robin', time_quantum=10, tick=0.01, start=None, end=None):
+    """
+    Stream a trace through one scheduler and return aggregate metrics
+    (times in ticks). Memory stays proportional to the processes in flight,
+    not to the trace length.
+    """
+    workload = trace_to_workload(iter_trace(path), tick, start, end)
+    if algorithm == 'fcfs':
+        events = iter_fcfs(workload)
+    elif algorithm == 'round_robin':
+        events = iter_round_robin(workload, time_quantum)
+    elif algorithm == 'priority':
+        events = iter_priority(workload)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    summary = _summarize(events)
+    summary['algorithm'] = algorithm
+    return summary
+
+
+def _parse_time(value):
+    return datetime.fromisoformat(value).timestamp() if value else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    cap = sub.add_parser('capture', help='Sample live processes into a trace file')
+    cap.add_argument('path')
+    cap.add_argument('--duration', type=float, default=60.0)
+    cap.add_argument('--interval', type=float, default=1.0)
+
+    rep = sub.add_parser('replay', help='Replay a trace through the CPU schedulers')
+    rep.add_argument('path')
+    rep.add_argument('--algorithms', nargs='+', default=['fcfs', 'round_robin', 'priority'])
+    rep.add_argument('--time-quantum', type=int, default=10)
+    rep.add_argument('--tick', type=float, default=0.01, help='Seconds per simulated time unit')
+    rep.add_argument('--from', dest='start', help='ISO timestamp of the window start')
+    rep.add_argument('--to', dest='end', help='ISO timestamp of the window end')
+    args = parser.parse_args(argv)
+
+    if args.command == 'capture':
+        n = capture_process_trace(args.path, args.duration, args.interval)
+        print(f"Wrote {n} records to {args.path}")
+    else:
+        for algorithm in args.algorithms:
+            print(replay_trace(args.path, algorithm, args.time_quantum, args.tick,
+                               _parse_time(args.start), _parse_time(args.end)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
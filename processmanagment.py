@@ -64,9 +64,7 @@ def detect_deadlock(allocation, request, available):
     return deadlocked_processes
 
 def producer_consumer_simulation(buffer_size, num_producers, num_consumers, items_to_produce):
-    """Simulate Producer-Consumer Problem"""
-    import random
-    
+    """Simulate Producer-Consumer Problem (producers, then consumers, take turns each step)"""
     buffer = []
     produced_items = []
     consumed_items = []
@@ -75,36 +73,37 @@ def producer_consumer_simulation(buffer_size, num_producers, num_consumers, item
     total_produced = 0
     total_consumed = 0
     
-    # Simulate the process
-    for step in range(items_to_produce * 2):  # Allow enough steps
-        if total_produced < items_to_produce:
-            # Producer tries to produce
+    # Simulate the process; every step some producer or consumer makes progress
+    while total_consumed < items_to_produce:
+        for p in range(num_producers):
+            if total_produced >= items_to_produce:
+                break
             if len(buffer) < buffer_size:
                 item = f"Item-{total_produced + 1}"
                 buffer.append(item)
                 produced_items.append(item)
-                operations.append(f"Producer: Added {item} to buffer")
+                operations.append(f"Producer {p + 1}: Added {item} to buffer")
                 total_produced += 1
             else:
-                operations.append("Producer: Buffer full, waiting...")
-        
-        # Consumer tries to consume
-        if buffer and total_consumed < total_produced:
-            item = buffer.pop(0)
-            consumed_items.append(item)
-            operations.append(f"Consumer: Consumed {item}")
-            total_consumed += 1
-        elif total_consumed < total_produced:
-            operations.append("Consumer: Buffer empty, waiting...")
+                operations.append(f"Producer {p + 1}: Buffer full, waiting...")
         
-        if total_consumed >= items_to_produce:
-            break
+        for c in range(num_consumers):
+            if total_consumed >= items_to_produce:
+                break
+            if buffer:
+                item = buffer.pop(0)
+                consumed_items.append(item)
+                operations.append(f"Consumer {c + 1}: Consumed {item}")
+                total_consumed += 1
+            else:
+                operations.append(f"Consumer {c + 1}: Buffer empty, waiting...")
     
     return operations, produced_items, consumed_items
 
-def readers_writers_simulation(num_readers, num_writers, operations_count):
-    """Simulate Readers-Writers Problem"""
+def readers_writers_simulation(num_readers, num_writers, operations_count, seed=None):
+    """Simulate Readers-Writers Problem (reproducible when `seed` is given)"""
     import random
+    rng = random.Random(seed)
     
     active_readers = 0
     active_writers = 0
@@ -115,7 +114,7 @@ def readers_writers_simulation(num_readers, num_writers, operations_count):
     
     for i in range(operations_count):
         # Randomly choose operation
-        operation = random.choice(['reader_request', 'writer_request', 'reader_finish', 'writer_finish'])
+        operation = rng.choice(['reader_request', 'writer_request', 'reader_finish', 'writer_finish'])
         
         if operation == 'reader_request':
             if active_writers == 0 and waiting_writers == 0:
@@ -0,0 +1,213 @@
+# profiling.py
+"""
+Opt-in instrumentation for Streamlit page renders.
+
+    prof = Profiler(enabled=True, profile="cProfile").start()
+    with prof.phase("collection"):
+        info = get_cpu_info()
+    ...
+    report = prof.finish()
+
+A render is split into the phases in PHASES. Time is charged exclusively:
+while a nested phase runs its parent's clock is paused, so the phase totals
+add up to the whole render, and anything outside an explicit phase counts
+as 'widgets' (Streamlit element emission).
+
+When the profiler is disabled, `phase()` hands back one shared no-op
+context manager, so an instrumented block costs a method call and nothing
+else. Optionally one render can also be captured with cProfile or with a
+sampling profiler that polls the rendering thread's stack.
+
+Call `finish()` in a `finally` block: a render cut short by an exception
+or by Streamlit's rerun/stop exceptions would otherwise leave cProfile
+enabled, and on Python 3.12+ the next one fails with "Another profiling
+tool is already active". If that happens anyway (another session is
+mid-profile), the render goes ahead without a profile.
+"""
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+PHASES = ('collection', 'compute', 'table', 'plot', 'widgets')
+PROFILE_MODES = ('cProfile', 'sampling')
+PROFILE_ROWS = 30
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._push(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._pop()
+        return False
+
+
+def _function_label(code):
+    return f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_firstlineno}({code.co_name})"
+
+
+class StackSampler:
+    """Samples one thread's Python stack every `interval` seconds from a helper thread."""
+
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples = 0
+        self.self_counts = Counter()
+        self.total_counts = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        frames = sys._current_frames
+        while not self._stop.wait(self.interval):
+            frame = frames().get(self.thread_id)
+            if frame is None:
+                break  # the sampled thread has exited
+            self.samples += 1
+            self.self_counts[frame.f_code] += 1
+            seen = set()
+            while frame is not None:
+                if frame.f_code not in seen:
+                    seen.add(frame.f_code)
+                    self.total_counts[frame.f_code] += 1
+                frame = frame.f_back
+
+    def rows(self, limit=PROFILE_ROWS):
+        """Hottest functions by inclusive sample count, with estimated seconds."""
+        return [
+            {'function': _function_label(code), 'samples': total,
+             'self_s': self.self_counts[code] * self.interval, 'cumulative_s': total * self.interval}
+            for code, total in self.total_counts.most_common(limit)
+        ]
+
+
+def _cprofile_rows(profile, limit=PROFILE_ROWS):
+    stats = pstats.Stats(profile).stats
+    rows = [
+        {'function': f"{file.rsplit('/', 1)[-1]}:{line}({name})", 'calls': calls,
+         'self_s': tottime, 'cumulative_s': cumtime}
+        for (file, line, name), (_, calls, tottime, cumtime, _) in stats.items()
+    ]
+    rows.sort(key=lambda row: row['cumulative_s'], reverse=True)
+    return rows[:limit]
+
+
+class Profiler:
+    """Phase timer (and optional one-shot profiler) for a single page render."""
+
+    def __init__(self, enabled=False, profile=None):
+        if profile is not None and profile not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {profile}")
+        self.profile_mode = profile
+        self.enabled = bool(enabled) or profile is not None
+        self.totals = {}
+        self.calls = {}
+        self.started = self.finished = None
+        self._stack = []
+        self._resumed = 0.0
+        self._profiler = None
+
+    def phase(self, name):
+        """Context manager charging the enclosed block to `name`."""
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def _charge(self, now):
+        name = self._stack[-1]
+        self.totals[name] = self.totals.get(name, 0.0) + now - self._resumed
+        self._resumed = now
+
+    def _push(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            self._charge(now)
+        self._resumed = now
+        self._stack.append(name)
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _pop(self):
+        if not self._stack:  # finish() already closed the render (e.g. before st.stop)
+            return
+        self._charge(time.perf_counter())
+        self._stack.pop()
+
+    def start(self):
+        if not self.enabled:
+            return self
+        if self.profile_mode == 'cProfile':
+            self._profiler = cProfile.Profile()
+            try:
+                self._profiler.enable()
+            except ValueError:  # another render's profile is still running
+                self._profiler = self.profile_mode = None
+        elif self.profile_mode == 'sampling':
+            self._profiler = StackSampler()
+            self._profiler.start()
+        self.started = time.perf_counter()
+        self._push('widgets')
+        return self
+
+    def finish(self):
+        """End the render; returns the report, or None if disabled or already finished."""
+        if not self.enabled or self.finished is not None:
+            return None
+        while self._stack:
+            self._pop()
+        self.finished = time.perf_counter()
+        if self.profile_mode == 'cProfile':
+            self._profiler.disable()
+        elif self.profile_mode == 'sampling':
+            self._profiler.stop()
+        return self.report()
+
+    def report(self):
+        """
+        Returns:
+            dict: total_ms, one row per phase (ms, calls, share of the render
+            in %), and the captured profile rows (or None).
+        """
+        total = (self.finished or time.perf_counter()) - self.started
+        names = [p for p in PHASES if p in self.totals] + [p for p in self.totals if p not in PHASES]
+        phases = [
+            {'phase': name, 'ms': self.totals[name] * 1e3, 'calls': self.calls[name],
+             'share_%': 100.0 * self.totals[name] / total if total else 0.0}
+            for name in names
+        ]
+        profile = None
+        if self.profile_mode == 'cProfile':
+            profile = _cprofile_rows(self._profiler)
+        elif self.profile_mode == 'sampling':
+            profile = self._profiler.rows()
+        return {'total_ms': total * 1e3, 'phases': phases, 'profile_mode': self.profile_mode, 'profile': profile}
@@ -0,0 +1,182 @@
+# rwlock.py
+"""
+Readers-writers locks with different fairness policies, and a contention
+benchmark that runs real threads against them.
+
+- ReaderPreferringRWLock: readers enter whenever no writer holds the lock;
+  a steady stream of readers starves writers.
+- WriterPreferringRWLock: a waiting writer blocks new readers; a steady
+  stream of writers starves readers.
+- PhaseFairRWLock: reader and writer phases alternate. A waiting writer
+  blocks new readers, and when a writer leaves, every reader that queued
+  behind it is admitted before the next writer, so neither side starves.
+"""
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class _RWLockBase:
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self.readers = 0
+        self.writer = False
+        self.waiting_writers = 0
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def release_read(self):
+        with self._cond:
+            self.readers -= 1
+            if self.readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self.waiting_writers += 1
+            while self.writer or self.readers:
+                self._cond.wait()
+            self.waiting_writers -= 1
+            self.writer = True
+
+    def release_write(self):
+        with self._cond:
+            self.writer = False
+            self._cond.notify_all()
+
+
+class ReaderPreferringRWLock(_RWLockBase):
+    def acquire_read(self):
+        with self._cond:
+            while self.writer:
+                self._cond.wait()
+            self.readers += 1
+
+
+class WriterPreferringRWLock(_RWLockBase):
+    def acquire_read(self):
+        with self._cond:
+            while self.writer or self.waiting_writers:
+                self._cond.wait()
+            self.readers += 1
+
+
+class PhaseFairRWLock(_RWLockBase):
+    def __init__(self):
+        super().__init__()
+        self.waiting_readers = 0
+        self.phase = 0  # bumped each time a writer hands over to queued readers
+
+    def acquire_read(self):
+        with self._cond:
+            if not self.writer and not self.waiting_writers:
+                self.readers += 1
+                return
+            # Queue behind the current writer phase; release_write admits us
+            self.waiting_readers += 1
+            phase = self.phase
+            while self.phase == phase:
+                self._cond.wait()
+
+    def release_write(self):
+        with self._cond:
+            self.writer = False
+            if self.waiting_readers:
+                self.readers += self.waiting_readers
+                self.waiting_readers = 0
+                self.phase += 1
+            self._cond.notify_all()
+
+
+RW_LOCKS = {
+    'reader-preferring': ReaderPreferringRWLock,
+    'writer-preferring': WriterPreferringRWLock,
+    'phase-fair': PhaseFairRWLock,
+}
+
+# Histogram bin edges for lock wait times, in microseconds
+LATENCY_BINS = np.concatenate(([0], np.logspace(0, 7, 29)))
+
+
+def _worker(lock, write, stop, hold, think, waits, counts, rng_seed):
+    rng = np.random.default_rng(rng_seed)
+    acquire = lock.acquire_write if write else lock.acquire_read
+    release = lock.release_write if write else lock.release_read
+    clock = time.perf_counter
+    thinks = rng.exponential(think, size=4096).tolist() if think else [0.0]
+    i = 0
+    while not stop.is_set():
+        start = clock()
+        acquire()
+        waits.append(clock() - start)
+        time.sleep(hold)
+        release()
+        counts[0] += 1
+        time.sleep(thinks[i % len(thinks)])
+        i += 1
+
+
+def contention_benchmark(policy, num_readers=8, num_writers=2, duration=1.0,
+                         read_hold=1e-4, write_hold=5e-4, think=1e-4, seed=0):
+    """
+    Run reader and writer threads against one lock for `duration` seconds.
+
+    Each thread loops acquire -> hold (sleep) -> release -> think (seeded
+    exponential sleep), recording how long every acquire waited.
+
+    Returns:
+        dict: read/write operations per second, mean and p99 wait times and
+        the longest writer wait (starvation) in milliseconds, and wait-time
+        histograms over LATENCY_BINS (microseconds).
+    """
+    lock = RW_LOCKS[policy]()
+    stop = threading.Event()
+    threads = []
+    read_waits, write_waits = [], []
+    read_counts, write_counts = [], []
+    for k in range(num_readers + num_writers):
+        write = k >= num_readers
+        waits, counts = array('d'), [0]
+        (write_waits if write else read_waits).append(waits)
+        (write_counts if write else read_counts).append(counts)
+        threads.append(threading.Thread(
+            target=_worker,
+            args=(lock, write, stop, write_hold if write else read_hold, think, waits, counts, seed + k),
+            daemon=True,
+        ))
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    result = {'policy': policy, 'readers': num_readers, 'writers': num_writers}
+    for side, waits, counts in (('read', read_waits, read_counts), ('write', write_waits, write_counts)):
+        us = np.concatenate([np.frombuffer(w, dtype=np.float64) for w in waits]) * 1e6 if waits else np.empty(0)
+        result[f'{side}s_per_second'] = sum(c[0] for c in counts) / elapsed
+        result[f'{side}_wait_mean_ms'] = float(us.mean()) / 1e3 if len(us) else 0.0
+        result[f'{side}_wait_p99_ms'] = float(np.percentile(us, 99)) / 1e3 if len(us) else 0.0
+        result[f'{side}_histogram'] = np.histogram(us, bins=LATENCY_BINS)[0].tolist()
+        if side == 'write':
+            result['writer_starvation_ms'] = float(us.max()) / 1e3 if len(us) else 0.0
+    return result
@@ -0,0 +1,147 @@
+# schedule_result.py
+"""
+Compact columnar results for the CPU schedulers.
+
+The scheduler cores in `cpu_scheduler.py` emit events of the form
+(pid, start, end, waiting, turnaround), where waiting/turnaround are None
+unless the slice completes the process. `ScheduleResult` stores these as
+int arrays (pid index, start, end) plus per-process waiting/turnaround
+arrays aligned to a pid table, and exposes the historical list-of-dicts
+API as a view.
+"""
+from array import array
+
+import numpy as np
+
+
+def merge_slices(events):
+    """
+    Merge run-length slices: consecutive events of the same pid where one
+    ends exactly when the next starts become a single slice.
+
+    Works lazily, so it can sit between a scheduler core and any consumer.
+    """
+    current = None
+    for pid, start, end, waiting, turnaround in events:
+        if current is not None and current[0] == pid and current[2] == start:
+            current = (pid, current[1], end, waiting, turnaround)
+            continue
+        if current is not None:
+            yield current
+        current = (pid, start, end, waiting, turnaround)
+    if current is not None:
+        yield current
+
+
+def _append(column, value):
+    """Append to an int64 column, widening it to float64 the first time a non-integer arrives."""
+    try:
+        column.append(value)
+    except TypeError:
+        column = array('d', column)
+        column.append(value)
+    return column
+
+
+class ScheduleResult:
+    """Columnar Gantt chart and per-process metrics of one scheduling run."""
+
+    def __init__(self, pid_table, pid_index, start, end, waiting, turnaround):
+        self.pid_table = pid_table
+        self.pid_index = pid_index
+        self.start = start
+        self.end = end
+        self.waiting = waiting
+        self.turnaround = turnaround
+
+    @classmethod
+    def from_events(cls, events, merge=True):
+        """Build a result from a scheduler event stream, merging adjacent slices by default."""
+        if merge:
+            events = merge_slices(events)
+        pid_table = []
+        pid_lookup = {}
+        pid_index = array('i')
+        start = array('q')
+        end = array('q')
+        waiting = array('q')
+        turnaround = array('q')
+        done_index = array('i')
+
+        for pid, s, e, w, t in events:
+            idx = pid_lookup.get(pid)
+            if idx is None:
+                idx = pid_lookup[pid] = len(pid_table)
+                pid_table.append(pid)
+            pid_index.append(idx)
+            start = _append(start, s)
+            end = _append(end, e)
+            if t is not None:
+                done_index.append(idx)
+                waiting = _append(waiting, w)
+                turnaround = _append(turnaround, t)
+
+        # Align per-process metrics to the pid table.
+        done_index = np.frombuffer(done_index, dtype=np.int32)
+        w_col = np.zeros(len(pid_table), dtype=waiting.typecode)
+        t_col = np.zeros(len(pid_table), dtype=turnaround.typecode)
+        w_col[done_index] = np.frombuffer(waiting, dtype=waiting.typecode)
+        t_col[done_index] = np.frombuffer(turnaround, dtype=turnaround.typecode)
+        return cls(
+            pid_table,
+            np.frombuffer(pid_index, dtype=np.int32),
+            np.frombuffer(start, dtype=start.typecode),
+            np.frombuffer(end, dtype=end.typecode),
+            w_col,
+            t_col,
+        )
+
+    def __len__(self):
+        return len(self.pid_index)
+
+    @property
+    def nbytes(self):
+        """Memory held by the column arrays."""
+        return sum(a.nbytes for a in (self.pid_index, self.start, self.end, self.waiting, self.turnaround))
+
+    # ---- Legacy dict API (views) ----
+
+    @property
+    def gantt_chart(self):
+        pids = self.pid_table
+        return [
+            {'pid': pids[i], 'start': s, 'end': e}
+            for i, s, e in zip(self.pid_index.tolist(), self.start.tolist(), self.end.tolist())
+        ]
+
+    @property
+    def waiting_times(self):
+        return dict(zip(self.pid_table, self.waiting.tolist()))
+
+    @property
+    def turnaround_times(self):
+        return dict(zip(self.pid_table, self.turnaround.tolist()))
+
+    def as_tuple(self):
+        """Return (gantt_chart, waiting_times, turnaround_times) as the schedulers always have."""
+        return self.gantt_chart, self.waiting_times, self.turnaround_times
+
+    # ---- pandas ----
+
+    def to_frame(self):
+        """Gantt slices as a DataFrame; pid is a categorical over the pid table, so no strings are copied."""
+        import pandas as pd
+        return pd.DataFrame({
+            'pid': pd.Categorical.from_codes(self.pid_index, categories=self.pid_table),
+            'start': self.start,
+            'end': self.end,
+        })
+
+    def stats_frame(self):
+        """Per-process waiting and turnaround times as a DataFrame."""
+        import pandas as pd
+        return pd.DataFrame({
+            'pid': self.pid_table,
+            'waiting': self.waiting,
+            'turnaround': self.turnaround,
+        })
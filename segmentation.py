@@ -0,0 +1,98 @@
+# segmentation.py
+"""
+Array-backed segment tables for bulk segmentation translation.
+
+A segment is (base, limit) where limit is the segment length, as entered
+on the Memory Management page: valid offsets are 0 .. limit - 1.
+"""
+import numpy as np
+
+
+class SegmentTable:
+    """
+    Segment table backed by NumPy arrays.
+
+    Segments keep their insertion order for id lookups; a copy sorted by base
+    address serves reverse (physical -> segment) lookups and overlap checks
+    with binary search. Zero-length segments hold no address, so they are
+    left out of that copy (they could otherwise hide the segment starting
+    at the same base).
+    """
+
+    def __init__(self, segments):
+        """
+        Args:
+            segments (dict): Segment name -> (base, limit).
+        """
+        self.names = list(segments)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        table = np.array(list(segments.values()), dtype=np.int64).reshape(-1, 2)
+        self.bases = table[:, 0]
+        self.limits = table[:, 1]
+        if np.any(self.limits < 0) or np.any(self.bases < 0):
+            raise ValueError("Segment bases and limits must be non-negative")
+        nonempty = np.flatnonzero(self.limits > 0)
+        self._order = nonempty[np.argsort(self.bases[nonempty], kind='stable')]
+        self._sorted_bases = self.bases[self._order]
+        self._sorted_ends = self._sorted_bases + self.limits[self._order]
+
+    def __len__(self):
+        return len(self.names)
+
+    def segment_ids(self, names):
+        """Map segment names to ids (-1 for unknown names)."""
+        return np.fromiter((self.ids.get(n, -1) for n in names), dtype=np.int64, count=len(names))
+
+    def translate(self, segment_ids, offsets):
+        """
+        Translate arrays of (segment id, offset) pairs.
+
+        Returns:
+            tuple: (physical addresses with -1 where invalid, validity mask).
+        """
+        segment_ids = np.asarray(segment_ids, dtype=np.int64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if len(self.names) == 0:
+            return np.full(len(offsets), -1, dtype=np.int64), np.zeros(len(offsets), dtype=bool)
+        known = (segment_ids >= 0) & (segment_ids < len(self.names))
+        ids = np.where(known, segment_ids, 0)
+        valid = known & (offsets >= 0) & (offsets < self.limits[ids])
+        physical = np.where(valid, self.bases[ids] + offsets, -1)
+        return physical, valid
+
+    def reverse(self, physical):
+        """
+        Find the segment containing each physical address.
+
+        Returns:
+            tuple: (segment ids with -1 where no segment matches, offsets).
+            Assumes the segments do not overlap (see `overlaps`).
+        """
+        physical = np.asarray(physical, dtype=np.int64)
+        if len(self._order) == 0:
+            missing = np.full(len(physical), -1, dtype=np.int64)
+            return missing, missing.copy()
+        pos = np.searchsorted(self._sorted_bases, physical, side='right') - 1
+        safe = np.maximum(pos, 0)
+        inside = (pos >= 0) & (physical < self._sorted_ends[safe])
+        ids = np.where(inside, self._order[safe], -1)
+        offsets = np.where(inside, physical - self._sorted_bases[safe], -1)
+        return ids, offsets
+
+    def overlaps(self):
+        """
+        Overlapping segments, found with one sort and a sweep: O(n log n).
+
+        Returns:
+            list: (name, other_name) pairs where `name` starts inside
+            `other_name`, the earlier segment reaching furthest.
+        """
+        found = []
+        reach_end = -1
+        reach_id = -1
+        for i, base, end in zip(self._order.tolist(), self._sorted_bases.tolist(), self._sorted_ends.tolist()):
+            if base < reach_end and end > base:
+                found.append((self.names[i], self.names[reach_id]))
+            if end > reach_end:
+                reach_end, reach_id = end, i
+        return found
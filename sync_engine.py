@@ -0,0 +1,243 @@
+# sync_engine.py
+"""
+Real producer-consumer runs over bounded buffers.
+
+`producer_consumer_simulation` in processmanagment.py steps a single loop;
+this module starts actual producer and consumer threads (or processes) and
+measures what the buffer costs:
+
+    backend      workers    buffer
+    'queue'      threads    queue.Queue(maxsize)
+    'deque'      threads    collections.deque guarded by two Conditions
+    'mp_queue'   processes  multiprocessing.Queue(maxsize)
+    'shm_ring'   processes  ring buffer in shared memory, counted with semaphores
+
+Each item carries its production timestamp (time.perf_counter, a system-wide
+monotonic clock on Linux, so it is comparable across processes).
+"""
+import multiprocessing as mp
+import queue
+import threading
+import time
+from array import array
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+BACKENDS = ('queue', 'deque', 'mp_queue', 'shm_ring')
+PROCESS_BACKENDS = ('mp_queue', 'shm_ring')
+LATENCY_PERCENTILES = (50, 90, 99, 99.9)
+_STOP = -1  # item id that tells a consumer to exit
+
+
+class ConditionBuffer:
+    """Bounded FIFO: a deque with not-full / not-empty conditions on one lock."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.items = deque()
+        lock = threading.Lock()
+        self.not_full = threading.Condition(lock)
+        self.not_empty = threading.Condition(lock)
+
+    def put(self, item):
+        with self.not_full:
+            while len(self.items) >= self.capacity:
+                self.not_full.wait()
+            self.items.append(item)
+            self.not_empty.notify()
+
+    def get(self):
+        with self.not_empty:
+            while not self.items:
+                self.not_empty.wait()
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+
+
+class SharedRing:
+    """
+    Bounded multi-producer / multi-consumer ring of (id, timestamp) pairs in
+    a SharedMemory block. Semaphores count free and filled slots; one lock
+    per side guards the head and tail counters.
+    """
+
+    def __init__(self, capacity, ctx=None):
+        ctx = ctx or mp.get_context()
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(create=True, size=16 * (capacity + 1))
+        self.free_slots = ctx.Semaphore(capacity)
+        self.filled_slots = ctx.Semaphore(0)
+        self.put_lock = ctx.Lock()
+        self.get_lock = ctx.Lock()
+        self._owner = True
+        self._attach()
+        self.counters[:] = 0
+
+    def _attach(self):
+        buf = self.shm.buf
+        self.counters = np.ndarray(2, dtype=np.int64, buffer=buf)  # head, tail
+        self.ids = np.ndarray(self.capacity, dtype=np.int64, buffer=buf, offset=16)
+        self.stamps = np.ndarray(self.capacity, dtype=np.float64, buffer=buf, offset=16 + 8 * self.capacity)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ('shm', 'counters', 'ids', 'stamps'):
+            del state[key]
+        state['name'] = self.shm.name
+        return state
+
+    def __setstate__(self, state):
+        name = state.pop('name')
+        self.__dict__.update(state)
+        self._owner = False
+        self.shm = shared_memory.SharedMemory(name=name)
+        self._attach()
+
+    def put(self, item):
+        self.free_slots.acquire()
+        with self.put_lock:
+            head = int(self.counters[0])
+            slot = head % self.capacity
+            self.ids[slot], self.stamps[slot] = item
+            self.counters[0] = head + 1
+        self.filled_slots.release()
+
+    def get(self):
+        self.filled_slots.acquire()
+        with self.get_lock:
+            tail = int(self.counters[1])
+            slot = tail % self.capacity
+            item = (int(self.ids[slot]), float(self.stamps[slot]))
+            self.counters[1] = tail + 1
+        self.free_slots.release()
+        return item
+
+    def close(self):
+        self.counters = self.ids = self.stamps = None
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+
+def _make_buffer(backend, capacity, ctx):
+    if backend == 'queue':
+        return queue.Queue(maxsize=capacity)
+    if backend == 'deque':
+        return ConditionBuffer(capacity)
+    if backend == 'mp_queue':
+        return ctx.Queue(maxsize=capacity)
+    if backend == 'shm_ring':
+        return SharedRing(capacity, ctx)
+    raise ValueError(f"Unknown backend: {backend}")
+
+
+def _producer(buf, first, count, results):
+    clock = time.perf_counter
+    blocked = 0.0
+    for item in range(first, first + count):
+        start = clock()
+        buf.put((item, start))
+        blocked += clock() - start
+    if hasattr(buf, 'join_thread'):
+        # multiprocessing.Queue: flush the feeder thread so the stop
+        # markers cannot overtake our last items
+        buf.close()
+        buf.join_thread()
+    results.put(('producer', blocked, None))
+
+
+def _consumer(buf, results):
+    clock = time.perf_counter
+    latencies = array('d')
+    blocked = 0.0
+    while True:
+        start = clock()
+        item, stamp = buf.get()
+        now = clock()
+        blocked += now - start
+        if item == _STOP:
+            break
+        latencies.append(now - stamp)
+    results.put(('consumer', blocked, latencies.tobytes()))
+
+
+def run_producer_consumer(backend='queue', buffer_size=64, num_producers=2, num_consumers=2, items=100_000):
+    """
+    Move `items` items from producers to consumers through one bounded buffer.
+
+    Returns:
+        dict: items, wall seconds, items_per_second, latency percentiles in
+        microseconds (p50 .. p99.9 and max), and the total time producers
+        spent in put / consumers spent in get (blocking included).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    use_processes = backend in PROCESS_BACKENDS
+    ctx = mp.get_context()
+    buf = _make_buffer(backend, buffer_size, ctx)
+    results = ctx.SimpleQueue() if use_processes else queue.SimpleQueue()
+    Worker = ctx.Process if use_processes else threading.Thread
+
+    share, extra = divmod(items, num_producers)
+    counts = [share + (1 if i < extra else 0) for i in range(num_producers)]
+    firsts = np.concatenate(([0], np.cumsum(counts)[:-1])).tolist()
+
+    consumers = [Worker(target=_consumer, args=(buf, results)) for _ in range(num_consumers)]
+    producers = [Worker(target=_producer, args=(buf, first, count, results))
+                 for first, count in zip(firsts, counts)]
+    start = time.perf_counter()
+    for worker in consumers + producers:
+        worker.start()
+
+    # Drain results before joining: a process cannot exit while its
+    # result is still stuck in the pipe
+    producer_blocked = consumer_blocked = 0.0
+    chunks = []
+    finished_producers = 0
+    for _ in range(num_producers + num_consumers):
+        role, blocked, payload = results.get()
+        if role == 'producer':
+            producer_blocked += blocked
+            finished_producers += 1
+            if finished_producers == num_producers:
+                for worker in consumers:
+                    buf.put((_STOP, 0.0))
+        else:
+            consumer_blocked += blocked
+            chunks.append(np.frombuffer(payload, dtype=np.float64))
+    elapsed = time.perf_counter() - start
+    for worker in consumers + producers:
+        worker.join()
+    if isinstance(buf, SharedRing):
+        buf.close()
+
+    latencies = np.concatenate(chunks) * 1e6 if chunks else np.empty(0)
+    row = {
+        'backend': backend,
+        'buffer_size': buffer_size,
+        'producers': num_producers,
+        'consumers': num_consumers,
+        'items': len(latencies),
+        'seconds': elapsed,
+        'items_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'producer_blocked_s': producer_blocked,
+        'consumer_blocked_s': consumer_blocked,
+    }
+    if len(latencies):
+        for p, value in zip(LATENCY_PERCENTILES, np.percentile(latencies, LATENCY_PERCENTILES)):
+            row[f'p{p:g}_us'] = float(value)
+        row['max_us'] = float(latencies.max())
+    return row
+
+
+def sweep(backends=BACKENDS, buffer_sizes=(1, 16, 256), worker_counts=((1, 1), (4, 4)), items=50_000):
+    """Run every backend x buffer size x (producers, consumers) combination."""
+    return [
+        run_producer_consumer(backend, size, producers, consumers, items)
+        for backend in backends
+        for size in buffer_sizes
+        for producers, consumers in worker_counts
+    ]
@@ -1,8 +1,10 @@
 # system_monitor.py
 import psutil
 import platform
+import time
 from datetime import datetime
 import GPUtil
+import numpy as np
 
 def get_system_info():
     """Return basic system and OS info with consistent keys."""
@@ -17,11 +19,11 @@ def get_system_info():
         "boot_time": datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
     }
 
-def get_cpu_info():
-    """Return detailed CPU info including frequency."""
+def get_cpu_info(interval=1):
+    """Return detailed CPU info including frequency (interval=None does not block)."""
     freq = psutil.cpu_freq()
     return {
-        "cpu_usage_percent": psutil.cpu_percent(interval=1),
+        "cpu_usage_percent": psutil.cpu_percent(interval=interval),
         "physical_cores": psutil.cpu_count(logical=False),
         "logical_cores": psutil.cpu_count(logical=True),
         "max_frequency": freq.max if freq else 0,
@@ -90,3 +92,131 @@ def get_gpu_info():
         })
 
     return gpu_info_list
+
+
+def _core_topology(cores):
+    """(package id, core id) of every logical CPU from sysfs, or None where unknown."""
+    topology = []
+    for cpu in range(cores):
+        base = f"/sys/devices/system/cpu/cpu{cpu}/topology/"
+        try:
+            with open(base + "physical_package_id") as f:
+                package = int(f.read())
+            with open(base + "core_id") as f:
+                core = int(f.read())
+            topology.append((package, core))
+        except (OSError, ValueError):
+            topology.append(None)
+    return topology
+
+
+class PerCoreCollector:
+    """
+    Non-blocking per-core sampler for utilisation, frequency and temperature.
+
+    Utilisation comes from cpu_times(percpu=True) deltas between two calls
+    (the same arithmetic as cpu_percent(percpu=True, interval=None), but with
+    private state so other callers do not reset it), so sample() never sleeps.
+    Each metric is kept as a cores x history NumPy ring matrix.
+    """
+
+    METRICS = ("usage", "iowait", "frequency", "temperature")
+
+    def __init__(self, history=120):
+        self.cores = psutil.cpu_count(logical=True) or 1
+        self.history = history
+        self.count = 0
+        self.times = np.full(history, np.nan)
+        self.data = {name: np.full((self.cores, history), np.nan) for name in self.METRICS}
+        self.topology = _core_topology(self.cores)
+        self._fields = psutil.cpu_times(percpu=True)[0]._fields
+        self._last = self._cpu_times()
+
+    def _cpu_times(self):
+        return np.array(psutil.cpu_times(percpu=True), dtype=np.float64)
+
+    def _usage(self):
+        now = self._cpu_times()
+        delta = now - self._last if now.shape == self._last.shape else np.zeros_like(now)
+        self._last = now
+        fields = self._fields
+        # guest time is already counted in user / nice on Linux
+        total = delta.sum(axis=1)
+        for name in ("guest", "guest_nice"):
+            if name in fields:
+                total -= delta[:, fields.index(name)]
+        idle = delta[:, fields.index("idle")]
+        iowait = delta[:, fields.index("iowait")] if "iowait" in fields else np.zeros(len(delta))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            busy = np.where(total > 0, 100.0 * (total - idle - iowait) / total, 0.0)
+            wait = np.where(total > 0, 100.0 * iowait / total, 0.0)
+        return np.clip(busy, 0.0, 100.0), np.clip(wait, 0.0, 100.0)
+
+    def _frequency(self):
+        try:
+            freqs = psutil.cpu_freq(percpu=True)
+        except (AttributeError, NotImplementedError, OSError):
+            freqs = None
+        if not freqs:
+            return np.full(self.cores, np.nan)
+        current = np.array([f.current for f in freqs], dtype=np.float64)
+        if len(current) != self.cores:
+            current = np.resize(current, self.cores)  # some platforms report one value
+        return current
+
+    def _temperature(self):
+        sensors_temperatures = getattr(psutil, "sensors_temperatures", None)
+        try:
+            sensors = sensors_temperatures() if sensors_temperatures else {}
+        except (OSError, NotImplementedError):
+            sensors = {}
+        temps = np.full(self.cores, np.nan)
+        if not sensors:
+            return temps
+        # coretemp lists "Package id P" followed by that package's "Core N"
+        per_core, per_package = {}, {}
+        package = 0
+        for entry in sensors.get("coretemp", []):
+            label = entry.label or ""
+            if label.startswith("Package id"):
+                package = int(label.split()[-1])
+                per_package[package] = entry.current
+            elif label.startswith("Core"):
+                per_core[(package, int(label.split()[-1]))] = entry.current
+        if not per_package:
+            # k10temp, cpu_thermal, acpitz...: one reading for the whole CPU
+            for name in ("k10temp", "zenpower", "cpu_thermal", "acpitz"):
+                if sensors.get(name):
+                    per_package[0] = max(entry.current for entry in sensors[name])
+                    break
+        fallback = max(per_package.values()) if per_package else np.nan
+        for cpu, place in enumerate(self.topology):
+            if place is None:
+                temps[cpu] = fallback
+            else:
+                temps[cpu] = per_core.get(place, per_package.get(place[0], fallback))
+        return temps
+
+    def sample(self):
+        """Take one sample (no sleeping) and store it in the next ring column."""
+        column = self.count % self.history
+        usage, iowait = self._usage()
+        self.data["usage"][:, column] = usage
+        self.data["iowait"][:, column] = iowait
+        self.data["frequency"][:, column] = self._frequency()
+        self.data["temperature"][:, column] = self._temperature()
+        self.times[column] = time.time()
+        self.count += 1
+        return {name: matrix[:, column] for name, matrix in self.data.items()}
+
+    def matrix(self, metric):
+        """
+        Returns:
+            tuple: (cores x samples matrix oldest first, sample timestamps).
+        """
+        filled = min(self.count, self.history)
+        if self.count <= self.history:
+            return self.data[metric][:, :filled], self.times[:filled]
+        start = self.count % self.history
+        order = np.r_[start:self.history, 0:start]
+        return self.data[metric][:, order], self.times[order]
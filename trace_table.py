@@ -0,0 +1,132 @@
+# trace_table.py
+"""
+Array-backed trace tables for the simulator pages.
+
+The replacement algorithms record only their faults when run with
+trace='delta': (step, slot, page, evicted) per fault. PageTrace stores
+those as columns next to the reference string, so the fault flag of every
+step is known without rescanning frames. Frame contents are rebuilt only
+for the rows being shown: the page held by slot s at step i is the last
+fault in slot s at or before i, a searchsorted per slot.
+"""
+import numpy as np
+
+EMPTY = -1           # marks a free frame / no eviction
+PAGE_ROWS = 200      # rows per rendered page
+SUMMARY_ONLY_STEPS = 100_000  # above this, pages only show summaries by default
+
+
+class PageTrace:
+    """Columnar trace of one page-replacement run."""
+
+    def __init__(self, pages, frame_size, deltas):
+        if deltas:
+            steps, slots, loaded, evicted = zip(*deltas)
+        else:
+            steps = slots = loaded = evicted = ()
+        self._set_columns(pages, frame_size, steps, slots, loaded, [EMPTY if e is None else e for e in evicted])
+
+    @classmethod
+    def from_columns(cls, pages, frame_size, columns):
+        """Build from the (4, faults) array returned by `columns()`."""
+        trace = cls.__new__(cls)
+        trace._set_columns(pages, frame_size, *columns)
+        return trace
+
+    def _set_columns(self, pages, frame_size, steps, slots, loaded, evicted):
+        self.pages = np.asarray(pages, dtype=np.int64)
+        self.frame_size = frame_size
+        self.fault_steps = np.asarray(steps, dtype=np.int64)
+        self.fault_slots = np.asarray(slots, dtype=np.int64)
+        self.loaded = np.asarray(loaded, dtype=np.int64)
+        self.evicted = np.asarray(evicted, dtype=np.int64)
+        self.fault = np.zeros(len(self.pages), dtype=bool)
+        self.fault[self.fault_steps] = True
+
+        # Faults grouped by slot (stable, so steps stay sorted within a slot)
+        order = np.argsort(self.fault_slots, kind='stable')
+        self._slot_steps = self.fault_steps[order]
+        self._slot_pages = self.loaded[order]
+        self._slot_bounds = np.searchsorted(self.fault_slots[order], np.arange(frame_size + 1))
+
+    def columns(self):
+        """Fault columns (step, slot, loaded page, evicted page) as one (4, faults) int64 array."""
+        return np.stack([self.fault_steps, self.fault_slots, self.loaded, self.evicted])
+
+    def __len__(self):
+        return len(self.pages)
+
+    @property
+    def faults(self):
+        return len(self.fault_steps)
+
+    def frames(self, start, stop):
+        """Frame contents after each step in [start, stop) as a (rows, frame_size) array."""
+        steps = np.arange(start, min(stop, len(self.pages)))
+        out = np.full((len(steps), self.frame_size), EMPTY, dtype=np.int64)
+        for s in range(self.frame_size):
+            lo, hi = self._slot_bounds[s], self._slot_bounds[s + 1]
+            if lo == hi:
+                continue
+            idx = np.searchsorted(self._slot_steps[lo:hi], steps, side='right') - 1
+            held = idx >= 0
+            out[held, s] = self._slot_pages[lo:hi][idx[held]]
+        return out
+
+    def rows(self, start, stop):
+        """Columns for steps [start, stop): Step, Page, Frame 1..n, Fault, Evicted."""
+        stop = min(stop, len(self.pages))
+        evicted = np.full(stop - start, EMPTY, dtype=np.int64)
+        lo, hi = np.searchsorted(self.fault_steps, [start, stop])
+        evicted[self.fault_steps[lo:hi] - start] = self.evicted[lo:hi]
+        columns = {'Step': np.arange(start + 1, stop + 1), 'Page': self.pages[start:stop]}
+        frames = self.frames(start, stop)
+        for s in range(self.frame_size):
+            columns[f'Frame {s + 1}'] = frames[:, s]
+        columns['Fault'] = self.fault[start:stop]
+        columns['Evicted'] = evicted
+        return columns
+
+    def display_rows(self, start, stop):
+        """`rows` for a table: empty frames and no eviction shown as '-', Fault as Yes/No."""
+        columns = self.rows(start, stop)
+        for name, values in columns.items():
+            if name.startswith('Frame ') or name == 'Evicted':
+                shown = values.astype(object)
+                shown[values == EMPTY] = '-'
+                columns[name] = shown
+        columns['Fault'] = np.where(columns['Fault'], 'Yes', 'No')
+        return columns
+
+    def fault_rate(self, bins=200):
+        """Fault rate per window of steps: (window end steps, rates)."""
+        n = len(self.pages)
+        if n == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        edges = np.unique(np.linspace(0, n, min(bins, n) + 1).astype(np.int64))
+        cumulative = np.concatenate(([0], np.cumsum(self.fault)))
+        return edges[1:], np.diff(cumulative[edges]) / np.diff(edges)
+
+    def summary(self):
+        n = len(self.pages)
+        return {
+            'references': n,
+            'faults': self.faults,
+            'hits': n - self.faults,
+            'fault_ratio': self.faults / n if n else 0.0,
+            'distinct_pages': int(len(np.unique(self.pages))),
+        }
+
+
+def gantt_columns(gantt):
+    """Scheduler Gantt slices as columns: Process, Start, End, Duration."""
+    start = np.array([entry['start'] for entry in gantt])
+    end = np.array([entry['end'] for entry in gantt])
+    return {'Process': [entry['pid'] for entry in gantt], 'Start': start, 'End': end, 'Duration': end - start}
+
+
+def page_bounds(total, page, rows=PAGE_ROWS):
+    """(start, stop) of 1-based page `page` of `rows` rows, clamped to the last page."""
+    last = max(-(-total // rows), 1)
+    start = (min(max(page, 1), last) - 1) * rows
+    return start, min(start + rows, total)
@@ -36,3 +36,52 @@ def plot_disk_chart(sequence):
         ax.text(i, pos + 1, str(pos), ha='center', fontsize=9)
 
     return fig
+
+def plot_fault_curves(frame_counts, curves, anomalies=()):
+    """
+    Plots page faults against the number of frames.
+
+    Args:
+        frame_counts (list): Frame counts on the x axis.
+        curves (dict): Algorithm name -> fault counts aligned with frame_counts.
+        anomalies (list): (frames, faults, more_frames, more_faults) tuples to highlight.
+
+    Returns:
+        matplotlib.figure.Figure: The plot figure to render in Streamlit.
+    """
+    fig, ax = plt.subplots(figsize=(10, 4))
+    for name, faults in curves.items():
+        ax.plot(frame_counts, faults, marker='o', markersize=3, label=name)
+    for _, _, frames, faults in anomalies:
+        ax.plot(frames, faults, 'rx', markersize=10)
+    ax.set_title("Page Faults vs. Number of Frames")
+    ax.set_xlabel("Frames")
+    ax.set_ylabel("Page Faults")
+    ax.grid(True)
+    ax.legend()
+    return fig
+
+def plot_core_heatmap(matrix, times, title, unit, vmin=None, vmax=None, cmap='inferno'):
+    """
+    Plots a cores x time matrix as a heatmap.
+
+    Args:
+        matrix (numpy.ndarray): One row per logical core, one column per sample (oldest first).
+        times (numpy.ndarray): Sample timestamps in seconds, aligned with the columns.
+        title (str): Plot title.
+        unit (str): Colour bar label.
+        vmin, vmax (float): Colour scale limits (default: the data range).
+
+    Returns:
+        matplotlib.figure.Figure: The plot figure to render in Streamlit.
+    """
+    cores = matrix.shape[0]
+    fig, ax = plt.subplots(figsize=(10, min(2 + cores * 0.08, 12)))
+    start = times[0] - times[-1] if len(times) > 1 else -1.0
+    image = ax.imshow(matrix, aspect='auto', interpolation='nearest', cmap=cmap, vmin=vmin, vmax=vmax,
+                      extent=(start, 0, cores - 0.5, -0.5))
+    ax.set_title(title)
+    ax.set_xlabel("Seconds Ago")
+    ax.set_ylabel("Logical Core")
+    fig.colorbar(image, ax=ax, label=unit)
+    return fig
@@ -0,0 +1,186 @@
+# workload.py
+"""Seeded synthetic workload generators for the CPU scheduling simulator."""
+import numpy as np
+
+
+def poisson_arrivals(n, rate, rng):
+    """Arrival times of a Poisson process (exponential inter-arrival gaps)."""
+    gaps = rng.exponential(1.0 / rate, size=n)
+    return np.floor(np.cumsum(gaps)).astype(np.int64)
+
+
+def bursty_arrivals(n, rng, on_rate=2.0, off_rate=0.05, mean_on=50, mean_off=200):
+    """
+    On/off arrival process.
+
+    Arrivals come at `on_rate` while the source is ON and at `off_rate`
+    while it is OFF; period lengths are exponentially distributed.
+    """
+    arrivals = np.empty(n, dtype=np.int64)
+    t = 0.0
+    i = 0
+    on = True
+    while i < n:
+        period = rng.exponential(mean_on if on else mean_off)
+        rate = on_rate if on else off_rate
+        count = min(rng.poisson(rate * period), n - i)
+        if count:
+            arrivals[i:i + count] = np.floor(t + np.sort(rng.uniform(0, period, size=count)))
+            i += count
+        t += period
+        on = not on
+    return arrivals
+
+
+def exponential_bursts(n, rng, mean=5.0):
+    """Exponentially distributed CPU bursts (at least 1 tick)."""
+    return np.maximum(1, np.ceil(rng.exponential(mean, size=n))).astype(np.int64)
+
+
+def pareto_bursts(n, rng, alpha=1.5, scale=2.0, cap=10_000):
+    """Heavy-tailed (Pareto) CPU bursts: many short jobs, a few very long ones."""
+    bursts = scale * (1.0 + rng.pareto(alpha, size=n))
+    return np.clip(np.ceil(bursts), 1, cap).astype(np.int64)
+
+
+def uniform_bursts(n, rng, low=1, high=10):
+    """Uniformly distributed CPU bursts in [low, high]."""
+    return rng.integers(low, high + 1, size=n, dtype=np.int64)
+
+
+def priority_mix(n, rng, weights=None):
+    """
+    Draw priorities from a discrete mix.
+
+    `weights` maps priority level -> relative frequency; the default is a
+    mostly-low-priority mix with a small interactive (priority 1) share.
+    """
+    if weights is None:
+        weights = {1: 0.1, 2: 0.2, 3: 0.3, 4: 0.4}
+    levels = np.fromiter(weights.keys(), dtype=np.int64)
+    p = np.fromiter(weights.values(), dtype=float)
+    return rng.choice(levels, size=n, p=p / p.sum())
+
+
+ARRIVALS = {
+    'poisson': lambda n, rng, rate=0.2: poisson_arrivals(n, rate, rng),
+    'bursty': bursty_arrivals,
+}
+
+BURSTS = {
+    'exponential': exponential_bursts,
+    'pareto': pareto_bursts,
+    'uniform': uniform_bursts,
+}
+
+
+def generate_workload(n, arrival='poisson', burst='pareto', priorities=None, seed=0):
+    """
+    Generate `n` processes in the format the schedulers in `cpu_scheduler.py` expect.
+
+    Args:
+        n (int): Number of processes.
+        arrival (str): Arrival pattern, one of ARRIVALS.
+        burst (str): Burst-length distribution, one of BURSTS.
+        priorities (dict): Priority level -> weight, see `priority_mix`.
+        seed (int): Seed; equal arguments always give the same workload.
+
+    Returns:
+        list: Dicts with 'pid', 'arrival_time', 'burst_time' and 'priority'.
+    """
+    rng = np.random.default_rng(seed)
+    arrivals = ARRIVALS[arrival](n, rng)
+    bursts = BURSTS[burst](n, rng)
+    prios = priority_mix(n, rng, priorities)
+    return [
+        {'pid': f'P{i+1}', 'arrival_time': a, 'burst_time': b, 'priority': p}
+        for i, (a, b, p) in enumerate(zip(arrivals.tolist(), bursts.tolist(), prios.tolist()))
+    ]
+
+
+def reference_string(n, num_pages=100_000, alpha=1.2, phase_length=50_000, seed=0):
+    """
+    Page reference string with Zipf popularity and shifting locality.
+
+    Every `phase_length` references the popularity ranking is remapped onto
+    a different set of pages, modelling a program moving between phases.
+    """
+    rng = np.random.default_rng(seed)
+    ranks = np.minimum(rng.zipf(alpha, size=n), num_pages) - 1
+    phases = np.arange(n) // phase_length
+    offsets = rng.integers(0, num_pages, size=phases[-1] + 1 if n else 0)
+    return ((ranks + offsets[phases]) % num_pages).astype(np.int64)
+
+
+def address_trace(n, page_size=4096, num_pages=100_000, alpha=1.2, seed=0):
+    """Virtual address trace: pages from `reference_string`, uniform offsets within each page."""
+    rng = np.random.default_rng(seed)
+    pages = reference_string(n, num_pages, alpha, seed=seed)
+    return pages * page_size + rng.integers(0, page_size, size=n)
+
+
+def allocation_trace(n, live_target=10_000, mean_size=8.0, sigma=1.0, max_size=4096, seed=0, batch=65_536):
+    """
+    Alloc/free trace for the allocators in `memory_allocator.py`.
+
+    Yields ('alloc', id, size) and ('free', id) tuples, `n` in total. Sizes
+    are log-normal; the live set grows towards `live_target` objects and
+    frees pick a random live object, so lifetimes are mixed.
+    """
+    rng = np.random.default_rng(seed)
+    mu = np.log(mean_size) - sigma ** 2 / 2
+    live = []
+    next_id = 0
+    emitted = 0
+    while emitted < n:
+        count = min(batch, n - emitted)
+        sizes = np.clip(np.ceil(rng.lognormal(mu, sigma, size=count)), 1, max_size).astype(np.int64).tolist()
+        coins = rng.random(count).tolist()
+        picks = rng.random(count).tolist()
+        for size, coin, pick in zip(sizes, coins, picks):
+            # Allocate with probability 1 at an empty heap, 1/2 at the target
+            if not live or coin < live_target / (live_target + len(live)):
+                live.append(next_id)
+                yield ('alloc', next_id, size)
+                next_id += 1
+            else:
+                i = int(pick * len(live))
+                live[i], live[-1] = live[-1], live[i]
+                yield ('free', live.pop())
+        emitted += count
+
+
+def disk_requests(n, disk_size=200, seed=0):
+    """Uniform cylinder requests and a starting head position for the disk schedulers."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, disk_size, size=n).tolist(), int(rng.integers(0, disk_size))
+
+
+def resource_state(n, m, max_units=5, seed=0):
+    """
+    Safe Banker's algorithm input for `n` processes and `m` resource types.
+
+    Returns:
+        tuple: (allocation, max_need, available) as nested lists; available
+        covers the largest remaining need, so the state is always safe.
+    """
+    rng = np.random.default_rng(seed)
+    allocation = rng.integers(0, max_units, size=(n, m))
+    need = rng.integers(0, max_units, size=(n, m))
+    available = need.max(axis=0) if n else np.zeros(m, dtype=np.int64)
+    return allocation.tolist(), (allocation + need).tolist(), available.tolist()
+
+
+def deadlock_state(n, m, deadlocked_fraction=0.1, max_units=5, seed=0):
+    """
+    Deadlock detection input: (allocation, request, available) nested lists
+    where roughly `deadlocked_fraction` of the processes request more than
+    the system can ever free.
+    """
+    rng = np.random.default_rng(seed)
+    allocation = rng.integers(0, max_units, size=(n, m))
+    request = rng.integers(0, max_units, size=(n, m))
+    available = np.full(m, max_units)
+    stuck = rng.random(n) < deadlocked_fraction
+    request[stuck] += allocation.sum(axis=0) + max_units
+    return allocation.tolist(), request.tolist(), available.tolist()